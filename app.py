@@ -1,26 +1,158 @@
 # app.py
 # Import necessary libraries
-from flask import Flask, request, jsonify, render_template, redirect, url_for, flash, session
+from flask import Flask, Response, abort, g, has_app_context, has_request_context, request, jsonify, make_response, render_template, redirect, url_for, flash, session, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, SelectField, BooleanField
 from wtforms.validators import DataRequired, Email, EqualTo, Length
 import bcrypt
+import click
+import csv
+import gzip
+import hashlib
+import io
 import json
+import operator
 import os
-from datetime import datetime
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict, deque
+from datetime import date, datetime
 from functools import wraps
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, declared_attr, joinedload, selectinload, validates
+from config.config import Config, engine_options
+
+_import_started = time.perf_counter()
+
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib encoder produces the same output, only slower
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # Optional: without it responses are gzip-compressed only
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: statistics refreshes are only serialized within each process
+    fcntl = None
 
 # --- App & Database Configuration ---
 app = Flask(__name__, template_folder='.', static_folder='static')
+# Level of app.logger, which reports startup, migrations and errors on stderr
+app.logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 # Define the absolute path for the database file
 basedir = os.path.abspath(os.path.dirname(__file__))
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(basedir, 'reports.db')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['SECRET_KEY'] = 'your-secret-key-change-in-production'  # Change this in production
+# Database URL, engine/pool options and SQLite pragmas come from config/config.py;
+# DATABASE_URL points the app at another database, e.g. the scratch file used by scripts/benchmark.py
+app.config.from_object(Config)
+# Seconds between background rebuilds of the statistics cache tables (0 disables). Report writes
+# keep the rollups current, so a periodic rebuild only corrects drift from writes made outside the app.
+# Every server worker runs the scheduler; a lock file shared by the processes on the host
+# (STATS_REFRESH_LOCK_FILE, by default one per database in the temp directory) makes them take turns.
+app.config['STATS_REFRESH_INTERVAL'] = int(os.environ.get('STATS_REFRESH_INTERVAL', 0))
+app.config['STATS_REFRESH_LOCK_FILE'] = os.environ.get('STATS_REFRESH_LOCK_FILE', '')
+# Report search backend: 'auto', 'fts5' (SQLite full-text index) or 'like'
+app.config['REPORT_SEARCH_BACKEND'] = os.environ.get('REPORT_SEARCH_BACKEND', 'auto')
+# Background report exports: worker threads, where finished files are cached and for how long
+app.config['EXPORT_WORKERS'] = int(os.environ.get('EXPORT_WORKERS', 2))
+app.config['EXPORT_CACHE_DIR'] = os.environ.get('EXPORT_CACHE_DIR', os.path.join(basedir, 'export_cache'))
+app.config['EXPORT_CACHE_TTL'] = int(os.environ.get('EXPORT_CACHE_TTL', 24 * 60 * 60))
+app.config['EXPORT_CACHE_MAX_BYTES'] = int(os.environ.get('EXPORT_CACHE_MAX_BYTES', 500 * 1024 * 1024))
+# GET /api/reports/export.xlsx builds workbooks of up to this many rows in the request. Larger
+# ones are run as export jobs: a cached file is returned at once, otherwise the response
+# redirects (303) to the job's status, which is polled until it has a downloadUrl
+app.config['EXPORT_XLSX_SYNC_MAX_ROWS'] = int(os.environ.get('EXPORT_XLSX_SYNC_MAX_ROWS', 10000))
+# Largest body and number of reports POST /api/reports/bulk accepts. The body limit replaces
+# MAX_CONTENT_LENGTH for that route only; larger batches are answered with 413 and must be split.
+app.config['REPORT_BULK_MAX_BYTES'] = int(os.environ.get('REPORT_BULK_MAX_BYTES', 128 * 1024 * 1024))
+app.config['REPORT_BULK_MAX_REPORTS'] = int(os.environ.get('REPORT_BULK_MAX_REPORTS', 10000))
+# In-process cache for hot read endpoints. Set RESPONSE_CACHE_SHARED when running
+# several worker processes so that writes in one invalidate entries in all of them.
+app.config['RESPONSE_CACHE_ENABLED'] = os.environ.get('RESPONSE_CACHE_ENABLED', '1') == '1'
+app.config['RESPONSE_CACHE_MAX_ENTRIES'] = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 256))
+app.config['RESPONSE_CACHE_TTL'] = int(os.environ.get('RESPONSE_CACHE_TTL', 300))
+app.config['RESPONSE_CACHE_SHARED'] = os.environ.get('RESPONSE_CACHE_SHARED', '0') == '1'
+# Request profiling: Server-Timing headers, per-endpoint latency samples and the slow-query log
+app.config['PROFILE_REQUESTS'] = os.environ.get('PROFILE_REQUESTS', '1') == '1'
+app.config['SLOW_QUERY_MS'] = float(os.environ.get('SLOW_QUERY_MS', 100))
+app.config['PERF_SAMPLE_SIZE'] = int(os.environ.get('PERF_SAMPLE_SIZE', 500))
+# Fail requests that exceed their query_budget instead of only logging them (always on when TESTING)
+app.config['QUERY_BUDGET_ENFORCED'] = os.environ.get('QUERY_BUDGET_ENFORCED', '0') == '1'
+# Prometheus metrics at /metrics. With several worker processes, point METRICS_DIR at a
+# directory they share so each scrape sums all of them (gunicorn.conf.py sets one by default).
+# METRICS_TOKEN requires a bearer token.
+app.config['METRICS_ENABLED'] = os.environ.get('METRICS_ENABLED', '1') == '1'
+app.config['METRICS_DIR'] = os.environ.get('METRICS_DIR', '')
+app.config['METRICS_FLUSH_INTERVAL'] = float(os.environ.get('METRICS_FLUSH_INTERVAL', 5))
+app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN', '')
+# Seconds each worker reuses a logged-in user's record before reading it again (0 disables).
+# Changes made through the user and profile endpoints take effect at once in the worker that
+# handled them and within this many seconds in the others.
+app.config['USER_CACHE_TTL'] = float(os.environ.get('USER_CACHE_TTL', 30))
+# bcrypt cost factor for new password hashes; existing ones are rehashed at their next login
+app.config['BCRYPT_ROUNDS'] = int(os.environ.get('BCRYPT_ROUNDS', 12))
+# Password hashes each worker process computes at once, and how many may run or wait there before
+# further ones get a 503. Every server worker (WEB_CONCURRENCY of them) has its own, so the default
+# shares half the host's CPUs between them; host-wide, both limits are multiplied by the worker count.
+# A request waits in its own thread, so per worker no more than its threads can be waiting at once.
+app.config['PASSWORD_HASH_WORKERS'] = int(os.environ.get(
+    'PASSWORD_HASH_WORKERS', max(1, (os.cpu_count() or 2) // 2 // int(os.environ.get('WEB_CONCURRENCY', 1)))
+))
+app.config['PASSWORD_HASH_QUEUE'] = int(os.environ.get('PASSWORD_HASH_QUEUE', 16))
+# Token-bucket limits on password attempts per client IP and per account (burst, then per minute).
+# Buckets are kept per worker process, so a client whose requests are spread over all
+# WEB_CONCURRENCY workers can get up to that many times these.
+app.config['LOGIN_IP_BURST'] = int(os.environ.get('LOGIN_IP_BURST', 20))
+app.config['LOGIN_IP_PER_MINUTE'] = float(os.environ.get('LOGIN_IP_PER_MINUTE', 10))
+app.config['LOGIN_ACCOUNT_BURST'] = int(os.environ.get('LOGIN_ACCOUNT_BURST', 5))
+app.config['LOGIN_ACCOUNT_PER_MINUTE'] = float(os.environ.get('LOGIN_ACCOUNT_PER_MINUTE', 2))
+# Reverse proxies in front of the app whose X-Forwarded-For/-Proto/-Host headers are trusted, so
+# the login limits key on the real client address. Leave at 0 unless every request comes through them.
+app.config['TRUSTED_PROXY_HOPS'] = int(os.environ.get('TRUSTED_PROXY_HOPS', 0))
+# Response compression: gzip (or brotli when installed) for text responses of at least COMPRESS_MIN_SIZE bytes
+app.config['COMPRESS_ENABLED'] = os.environ.get('COMPRESS_ENABLED', '1') == '1'
+app.config['COMPRESS_MIN_SIZE'] = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+app.config['COMPRESS_LEVEL'] = int(os.environ.get('COMPRESS_LEVEL', 6))
+app.config['COMPRESS_BROTLI_QUALITY'] = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 5))
+app.config['COMPRESS_MIMETYPES'] = frozenset(os.environ.get(
+    'COMPRESS_MIMETYPES',
+    'text/html,text/css,text/plain,text/csv,text/javascript,application/javascript,application/json,image/svg+xml',
+).split(','))
+# Rendered pages and static files kept with their compressed copies, reused until the file's mtime changes
+app.config['COMPRESS_CACHE_MAX_ENTRIES'] = int(os.environ.get('COMPRESS_CACHE_MAX_ENTRIES', 256))
+# Seconds browsers may cache static files requested under their content fingerprint (url_for adds ?v=<hash>)
+app.config['STATIC_CACHE_MAX_AGE'] = int(os.environ.get('STATIC_CACHE_MAX_AGE', 365 * 24 * 60 * 60))
 
-db = SQLAlchemy(app)
+# Bound to the app in create_app, once config overrides have been applied
+db = SQLAlchemy()
+
+@event.listens_for(Engine, 'connect')
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure each new SQLite connection so readers are not blocked by writers"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout = {int(app.config['SQLITE_BUSY_TIMEOUT_MS'])}")
+    cursor.execute(f"PRAGMA journal_mode = {app.config['SQLITE_JOURNAL_MODE']}")
+    cursor.execute(f"PRAGMA synchronous = {app.config['SQLITE_SYNCHRONOUS']}")
+    cursor.execute(f"PRAGMA cache_size = {-int(app.config['SQLITE_CACHE_SIZE_KB'])}")
+    cursor.execute(f"PRAGMA mmap_size = {int(app.config['SQLITE_MMAP_SIZE'])}")
+    cursor.close()
+    if app.config['PROFILE_REQUESTS']:
+        dbapi_connection.row_factory = _fetched_row_counter(connection_record.info)
 
 # Initialize Flask-Login
 login_manager = LoginManager()
@@ -29,9 +161,66 @@ login_manager.login_view = 'login'
 login_manager.login_message = 'Please log in to access this page.'
 login_manager.login_message_category = 'info'
 
-@login_manager.user_loader
-def load_user(user_id):
-    return User.query.get(int(user_id))
+# --- JSON Serialization ---
+class RawJSON:
+    """Already-encoded JSON text that the app's JSON provider writes into its output unchanged"""
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes compact responses with orjson when it is installed.
+
+    Both encoders write sorted keys, compact separators and non-ASCII text as
+    UTF-8. They format floats in exponent notation differently (orjson writes
+    1e16 where the stdlib writes 1e+16), so output containing an exponent is
+    re-encoded with the stdlib, as is anything orjson rejects, such as
+    integers beyond 64 bits. Responses are then byte-identical whichever
+    encoder runs, except that orjson writes NaN and Infinity as null. orjson
+    versions with Fragment splice RawJSON values in without decoding them;
+    otherwise they are decoded, which gives the same bytes for text written by
+    dump_json_blob.
+    """
+    ensure_ascii = False
+    ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS if orjson is not None else None
+    )
+    EXPONENT = re.compile(rb'\d[eE][-+]?\d')
+
+    def default(self, o):
+        if isinstance(o, RawJSON):
+            return json.loads(o.text)
+        return super().default(o)
+
+    def _orjson_default(self, o):
+        if isinstance(o, RawJSON) and hasattr(orjson, 'Fragment'):
+            return orjson.Fragment(o.text)
+        return self.default(o)
+
+    def _orjson_dumps(self, obj):
+        """Compact orjson encoding of obj, or None where it would differ from the stdlib's"""
+        try:
+            encoded = orjson.dumps(obj, default=self._orjson_default, option=self.ORJSON_OPTIONS)
+        except TypeError:
+            return None
+        if self.EXPONENT.search(encoded):
+            return None  # A float in exponent notation, or text that looks like one
+        return encoded.decode()
+
+    def dumps(self, obj, **kwargs):
+        if self.ORJSON_OPTIONS is not None and kwargs == {'separators': (',', ':')}:
+            encoded = self._orjson_dumps(obj)
+            if encoded is not None:
+                return encoded
+        return super().dumps(obj, **kwargs)
+
+app.json = FastJSONProvider(app)
+
+def dump_json_blob(value):
+    """Encode a value for a JSON text column in the same form as API responses, so it can be spliced in as RawJSON"""
+    return app.json.dumps(value, separators=(',', ':'))
 
 # --- User Model and Authentication ---
 class User(UserMixin, db.Model):
@@ -47,11 +236,15 @@ class User(UserMixin, db.Model):
 
     def set_password(self, password):
         """Hash and set the password"""
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        self.password_hash = hash_password(password)
 
     def check_password(self, password):
         """Check if the provided password matches the hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+        return verify_password(password, self.password_hash)
+
+    def needs_rehash(self):
+        """Whether the password hash was made with a different cost factor than BCRYPT_ROUNDS"""
+        return password_hash_rounds(self.password_hash) != app.config['BCRYPT_ROUNDS']
 
     def get_full_name(self):
         """Get the user's full name"""
@@ -70,6 +263,185 @@ class User(UserMixin, db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
 
+# --- Password Hashing & Login Throttling ---
+class PasswordHashingBusy(RuntimeError):
+    """Every password hashing slot is taken; the request is turned away instead of queueing"""
+
+_password_semaphores_lock = threading.Lock()
+_password_running = None
+_password_slots = None
+
+def run_password_hash(function, *args):
+    """Run a bcrypt call in the request's thread once a password hashing slot is free.
+
+    At most PASSWORD_HASH_WORKERS hashes run at once in this process, so a
+    burst of logins cannot take every CPU from the report endpoints; bcrypt
+    releases the GIL, so the process's other threads keep serving meanwhile.
+    Once PASSWORD_HASH_QUEUE calls are running or waiting, further ones raise
+    PasswordHashingBusy.
+    """
+    global _password_running, _password_slots
+    with _password_semaphores_lock:
+        if _password_running is None:
+            _password_running = threading.BoundedSemaphore(app.config['PASSWORD_HASH_WORKERS'])
+            _password_slots = threading.BoundedSemaphore(app.config['PASSWORD_HASH_QUEUE'])
+    if not _password_slots.acquire(blocking=False):
+        metrics.inc('password_hash_rejected_total')
+        raise PasswordHashingBusy('Too many password checks in progress')
+    try:
+        with _password_running:
+            return function(*args)
+    finally:
+        _password_slots.release()
+
+def hash_password(password):
+    rounds = app.config['BCRYPT_ROUNDS']
+    return run_password_hash(bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+def verify_password(password, password_hash):
+    return run_password_hash(bcrypt.checkpw, password.encode('utf-8'), password_hash.encode('utf-8'))
+
+def password_hash_rounds(password_hash):
+    """The bcrypt cost factor a hash was made with, or None if it cannot be read"""
+    try:
+        return int(password_hash.split('$')[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+@app.errorhandler(PasswordHashingBusy)
+def password_hashing_busy(error):
+    """Ask the client to retry rather than queue behind other password checks"""
+    message = 'The server is busy checking passwords. Please try again in a moment.'
+    if request.path.startswith('/api/'):
+        return jsonify({'success': False, 'message': message}), 503, {'Retry-After': '1'}
+    flash(message, 'error')
+    return redirect(request.full_path)
+
+class TokenBucketLimiter:
+    """Token buckets by key, each holding up to `burst` tokens and regaining `per_minute` a minute.
+
+    The two limits are read from the named config settings on every call; a
+    burst of 0 disables the limiter.
+    """
+    MAX_BUCKETS = 10000
+
+    def __init__(self, burst_setting, per_minute_setting):
+        self.burst_setting = burst_setting
+        self.per_minute_setting = per_minute_setting
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, key):
+        """Take a token for key; returns 0 if one was available, else the seconds until there is one"""
+        burst = app.config[self.burst_setting]
+        rate = app.config[self.per_minute_setting] / 60
+        if burst <= 0:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return (1 - tokens) / rate if rate > 0 else 60
+            self._buckets[key] = (tokens - 1, now)
+            if len(self._buckets) > self.MAX_BUCKETS:
+                # Buckets that have refilled are the same as absent ones
+                self._buckets = {
+                    bucket_key: (bucket_tokens, bucket_updated)
+                    for bucket_key, (bucket_tokens, bucket_updated) in self._buckets.items()
+                    if bucket_tokens + (now - bucket_updated) * rate < burst
+                }
+        return 0
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+login_ip_limiter = TokenBucketLimiter('LOGIN_IP_BURST', 'LOGIN_IP_PER_MINUTE')
+login_account_limiter = TokenBucketLimiter('LOGIN_ACCOUNT_BURST', 'LOGIN_ACCOUNT_PER_MINUTE')
+
+def password_attempt_wait(email=None):
+    """Seconds the client must wait before another password attempt, or 0 to go ahead.
+
+    Checked before any bcrypt work: a token is taken from the client IP's
+    bucket and, when an account is named, from that account's bucket.
+    """
+    wait = login_ip_limiter.take(request.remote_addr or '')
+    scope = 'ip'
+    if not wait and email:
+        wait = login_account_limiter.take(email.strip().lower())
+        scope = 'account'
+    if wait:
+        metrics.inc('login_throttled_total', (('limit', scope),))
+    return wait
+
+def too_many_attempts(wait):
+    """Retry-After header value for a throttled password attempt"""
+    return {'Retry-After': str(max(1, int(wait + 0.999)))}
+
+# --- User Cache ---
+class CachedUser(UserMixin):
+    """Read-only snapshot of a User row that serves as current_user between requests.
+
+    Views that change the logged-in user load the row itself with
+    db.session.get(User, current_user.id) and invalidate the cache entry.
+    """
+    FIELDS = ('id', 'first_name', 'last_name', 'email', 'role', 'is_approved', 'created_at', 'updated_at')
+    get_full_name = User.get_full_name
+    to_dict = User.to_dict
+
+    def __init__(self, user):
+        for field in self.FIELDS:
+            setattr(self, field, getattr(user, field))
+
+class UserCache:
+    """Per-process cache of logged-in users by id, each entry kept for USER_CACHE_TTL seconds"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def put(self, user):
+        cached = CachedUser(user)
+        ttl = app.config['USER_CACHE_TTL']
+        if ttl > 0:
+            now = time.monotonic()
+            with self._lock:
+                if len(self._entries) >= 1000:
+                    self._entries = {key: entry for key, entry in self._entries.items() if entry[0] >= now}
+                self._entries[user.id] = (now + ttl, cached)
+        return cached
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+user_cache = UserCache()
+
+@login_manager.user_loader
+def load_user(user_id):
+    """Return the logged-in user, reading the row only when it is not cached"""
+    user_id = int(user_id)
+    cached = user_cache.get(user_id)
+    if cached is None:
+        user = db.session.get(User, user_id)
+        if user is None:
+            return None
+        cached = user_cache.put(user)
+    return cached
+
 # --- Forms ---
 class LoginForm(FlaskForm):
     email = StringField('Email', validators=[DataRequired(), Email()])
@@ -110,8 +482,835 @@ def approved_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# --- Data Version & Conditional GET ---
+# Tables whose changes can alter API responses; any write to them bumps the data version
+DATA_VERSION_TABLES = frozenset({
+    'report', 'report_request', 'report_build', 'report_tester', 'report_team_member', 'report_qa_note',
+    'portfolio', 'project', 'tester', 'team_member', 'tester_project'
+})
+DATA_VERSION_BUMP = db.text("UPDATE data_version SET version = version + 1 WHERE id = 1")
+CACHE_GENERATION_BUMP = db.text("UPDATE cache_generation SET generation = generation + 1 WHERE table_name = :table_name")
+
+class DataVersion(db.Model):
+    """Single-row counter bumped in the same transaction as every tracked write"""
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+class CacheGeneration(db.Model):
+    """Per-table write counters that let every worker see response cache invalidations"""
+    table_name = db.Column(db.String(50), primary_key=True)
+    generation = db.Column(db.Integer, nullable=False, default=0)
+
+def _record_table_writes(session, table_names):
+    """Bump the version counters for writes to tracked tables within the session's transaction"""
+    changed = DATA_VERSION_TABLES.intersection(table_names)
+    if not changed:
+        return
+    connection = session.connection()
+    connection.execute(DATA_VERSION_BUMP)
+    if app.config['RESPONSE_CACHE_SHARED']:
+        connection.execute(CACHE_GENERATION_BUMP, [{'table_name': table_name} for table_name in changed])
+    session.info.setdefault('changed_tables', set()).update(changed)
+
+@event.listens_for(Session, 'after_flush')
+def _bump_data_version_on_flush(session, flush_context):
+    """Bump the data version when a flush wrote tracked rows"""
+    _record_table_writes(session, {
+        instance.__table__.name for instance in session.new | session.dirty | session.deleted
+        if hasattr(instance, '__table__')
+    })
+
+@event.listens_for(Session, 'do_orm_execute')
+def _bump_data_version_on_execute(orm_execute_state):
+    """Bump the data version for bulk INSERT/UPDATE/DELETE statements on tracked tables"""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table_name = getattr(getattr(orm_execute_state.statement, 'table', None), 'name', None)
+        _record_table_writes(orm_execute_state.session, {table_name})
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_cached_responses(session):
+    """Drop cached responses built from tables the committed transaction wrote"""
+    changed = session.info.pop('changed_tables', None)
+    if changed:
+        response_cache.invalidate(changed)
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_table_writes(session):
+    """Rolled back writes leave cached responses valid"""
+    session.info.pop('changed_tables', None)
+
+def get_data_version():
+    """Return the current data version, creating the counter row on first use"""
+    version = db.session.execute(db.text("SELECT version FROM data_version WHERE id = 1")).scalar()
+    if version is None:
+        from sqlalchemy import insert
+        from sqlalchemy.exc import IntegrityError
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(insert(DataVersion.__table__).values(id=1, version=0))
+        except IntegrityError:
+            pass  # Another request created it first
+        version = 0
+    return version
+
+def get_cache_generations(table_names):
+    """Return the shared write generation of each table, creating missing counter rows"""
+    generations = dict(db.session.query(CacheGeneration.table_name, CacheGeneration.generation).filter(
+        CacheGeneration.table_name.in_(table_names)
+    ).all())
+    missing = [table_name for table_name in table_names if table_name not in generations]
+    if missing:
+        from sqlalchemy import insert
+        from sqlalchemy.exc import IntegrityError
+        for table_name in missing:
+            try:
+                with db.engine.begin() as connection:
+                    connection.execute(insert(CacheGeneration.__table__).values(table_name=table_name, generation=0))
+            except IntegrityError:
+                pass  # Another request created it first
+            generations[table_name] = 0
+    return generations
+
+def conditional_on_data_version(f):
+    """Tag GET responses with an ETag derived from the data version.
+
+    A request whose If-None-Match already holds the current tag is answered
+    with 304 Not Modified before the view runs. The comparison is weak because
+    compressed responses carry the tag as W/"data-N".
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        g.data_version = get_data_version()
+        etag = f'data-{g.data_version}'
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+        else:
+            response = make_response(f(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    return decorated_function
+
+# --- Response Cache ---
+class ResponseCache:
+    """Size-bounded LRU cache of response bodies with a TTL per entry.
+
+    Each entry records the tables it was built from. Entries are dropped
+    when a committed transaction writes one of those tables, when they
+    expire, or when the cache is full and they are the least recently used.
+    In shared mode each entry also stores the tables' write generations, and
+    a lookup checks them against the database so writes made by other
+    worker processes invalidate it too.
+    """
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+
+    def get(self, key, generations=None):
+        """Return the cached value for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.counters['misses'] += 1
+                return None
+            expires_at, tables, entry_generations, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.counters['expirations'] += 1
+                self.counters['misses'] += 1
+                return None
+            if generations is not None and entry_generations != generations:
+                del self._entries[key]
+                self.counters['invalidations'] += 1
+                self.counters['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.counters['hits'] += 1
+            return value
+
+    def set(self, key, value, tables, generations=None):
+        """Store value for key, evicting the least recently used entries beyond max_entries"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, frozenset(tables), generations, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.counters['evictions'] += 1
+
+    def invalidate(self, tables):
+        """Drop every entry built from any of `tables`"""
+        with self._lock:
+            stale_keys = [key for key, entry in self._entries.items() if not entry[1].isdisjoint(tables)]
+            for key in stale_keys:
+                del self._entries[key]
+            self.counters['invalidations'] += len(stale_keys)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self.counters['invalidations'] += len(self._entries)
+            self._entries.clear()
+
+    def configure(self, max_entries, ttl):
+        """Resize the cache and change the TTL of new entries, dropping what it holds"""
+        with self._lock:
+            self.max_entries = max_entries
+            self.ttl = ttl
+            self._entries.clear()
+
+    def status(self):
+        """Counters and current size"""
+        with self._lock:
+            return dict(self.counters, entries=len(self._entries), max_entries=self.max_entries, ttl=self.ttl)
+
+# Sized from the environment here; create_app resizes it from the final config
+response_cache = ResponseCache(app.config['RESPONSE_CACHE_MAX_ENTRIES'], app.config['RESPONSE_CACHE_TTL'])
+
+def cached_response(*tables):
+    """Serve a GET view's 200 responses from response_cache, keyed by endpoint, arguments and data version.
+
+    `tables` are the tables the view reads; writes to any of them invalidate
+    its cached responses. The data version in the key means a write committed
+    by another worker process is never served from this one's cache, nor under
+    that write's ETag; conditional_on_data_version leaves it in g.data_version.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not app.config['RESPONSE_CACHE_ENABLED']:
+                return f(*args, **kwargs)
+            data_version = g.data_version if 'data_version' in g else get_data_version()
+            key = (request.endpoint, tuple(sorted(kwargs.items())), tuple(sorted(request.args.items(multi=True))), data_version)
+            generations = get_cache_generations(tables) if app.config['RESPONSE_CACHE_SHARED'] else None
+            cached = response_cache.get(key, generations)
+            if cached is not None:
+                body, mimetype = cached
+                return app.response_class(body, mimetype=mimetype)
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                response_cache.set(key, (response.get_data(), response.mimetype), tables, generations)
+            return response
+        return decorated_function
+    return decorator
+
+# --- Query Budgets ---
+class QueryBudgetExceeded(RuntimeError):
+    """A view issued more SQL statements than its query_budget allows"""
+
+def query_budget(**limits):
+    """Cap the SQL statements a view may issue per HTTP method, e.g. query_budget(GET=2).
+
+    The caps hold regardless of how many rows the view returns, so they catch
+    N+1 loading. Statements are counted by the request profiling listeners. Exceeding one raises QueryBudgetExceeded when
+    QUERY_BUDGET_ENFORCED is set or the app is testing, and logs otherwise.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            limit = limits.get(request.method)
+            if limit is None:
+                return f(*args, **kwargs)
+            issued_before = g.get('query_count', 0)
+            response = f(*args, **kwargs)
+            issued = g.get('query_count', 0) - issued_before
+            if issued > limit:
+                message = f"{request.method} {request.endpoint} issued {issued} SQL statements (budget {limit})"
+                if app.config['QUERY_BUDGET_ENFORCED'] or app.testing:
+                    raise QueryBudgetExceeded(message)
+                app.logger.warning(f"Query budget exceeded: {message}")
+            return response
+        return decorated_function
+    return decorator
+
+# --- Request Profiling ---
+# Per-endpoint request timings, statement counts and recent slow statements for /api/admin/perf
+endpoint_timings = {}
+slow_queries = deque(maxlen=100)
+_profiling_lock = threading.Lock()
+
+def _fetched_row_counter(connection_info):
+    """sqlite3 row factory counting fetched rows, since SQLite gives SELECTs a rowcount of -1.
+
+    Rows count towards the profile of the request that last ran a statement
+    on the connection, which _before_cursor_execute keeps in its info.
+    """
+    def count_fetched_row(cursor, row):
+        profile = connection_info.get('sql_profile')
+        if profile is not None:
+            profile['rows_fetched'] += 1
+        return row
+    return count_fetched_row
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Count the statement and note when it started"""
+    if has_app_context():
+        g.query_count = g.get('query_count', 0) + 1
+    conn.info['sql_profile'] = g.get('sql_profile') if has_app_context() else None
+    conn.info.setdefault('statement_started', []).append(time.perf_counter())
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Record the statement's duration on the request profile and log it if slow"""
+    duration_ms = (time.perf_counter() - conn.info['statement_started'].pop()) * 1000
+    profile = g.get('sql_profile') if has_app_context() else None
+    if profile is not None:
+        profile['db_ms'] += duration_ms
+        if cursor.description is None:
+            if cursor.rowcount > 0:
+                profile['rows_written'] += cursor.rowcount
+        elif cursor.rowcount > 0 and not isinstance(cursor, sqlite3.Cursor):
+            profile['rows_fetched'] += cursor.rowcount  # e.g. psycopg reports the rows a SELECT returned
+        profile['slowest'].append((duration_ms, statement))
+        profile['slowest'].sort(key=lambda item: item[0], reverse=True)
+        del profile['slowest'][3:]
+    if duration_ms >= app.config['SLOW_QUERY_MS']:
+        entry = {
+            'at': datetime.utcnow().isoformat(),
+            'endpoint': request.endpoint if has_request_context() else None,
+            'duration_ms': round(duration_ms, 2),
+            'statement': ' '.join(statement.split())[:500],
+            'executemany': executemany,
+        }
+        slow_queries.append(entry)
+        app.logger.warning("Slow query: %s", json.dumps(entry))
+
+@event.listens_for(db.Model, 'load', propagate=True)
+def _count_loaded_object(target, context):
+    """Count ORM objects loaded during a request"""
+    profile = g.get('sql_profile') if has_app_context() else None
+    if profile is not None:
+        profile['objects_loaded'] += 1
+
+@event.listens_for(Engine, 'handle_error')
+def _discard_failed_statement(exception_context):
+    """Drop the start time of a statement that raised instead of completing"""
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('statement_started'):
+        connection.info['statement_started'].pop()
+
+@app.before_request
+def _start_request_profile():
+    """Start timing the request and collecting its SQL statistics"""
+    g.request_started = time.perf_counter()
+    if app.config['PROFILE_REQUESTS']:
+        g.query_count = 0
+        g.sql_profile = {'db_ms': 0.0, 'rows_fetched': 0, 'rows_written': 0, 'objects_loaded': 0, 'slowest': []}
+
+@app.after_request
+def _finish_request_profile(response):
+    """Add a Server-Timing header and fold the request into the endpoint timings"""
+    profile = g.get('sql_profile')
+    if profile is None:
+        return response
+    total_ms = (time.perf_counter() - g.request_started) * 1000
+    response.headers['Server-Timing'] = (
+        f'db;dur={profile["db_ms"]:.2f};desc="{g.query_count} queries", app;dur={total_ms:.2f}'
+    )
+    if request.endpoint and request.endpoint != 'static':
+        with _profiling_lock:
+            timings = endpoint_timings.get(request.endpoint)
+            if timings is None:
+                timings = endpoint_timings[request.endpoint] = {
+                    'count': 0, 'queries': 0, 'db_ms': 0.0, 'rows_fetched': 0, 'rows_written': 0, 'objects_loaded': 0,
+                    'durations': deque(maxlen=app.config['PERF_SAMPLE_SIZE']), 'slowest': [],
+                }
+            timings['count'] += 1
+            timings['queries'] += g.query_count
+            timings['db_ms'] += profile['db_ms']
+            timings['rows_fetched'] += profile['rows_fetched']
+            timings['rows_written'] += profile['rows_written']
+            timings['objects_loaded'] += profile['objects_loaded']
+            timings['durations'].append(total_ms)
+            timings['slowest'] = sorted(timings['slowest'] + profile['slowest'], key=lambda item: item[0], reverse=True)[:3]
+    return response
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list of numbers"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+# --- Metrics ---
+class MetricsRegistry:
+    """In-process Prometheus-style registry of counters, gauges and histograms.
+
+    Recording a sample is a dict update under one lock. With METRICS_DIR set,
+    every worker process periodically writes its samples to its own file
+    there, and /metrics sums the files so a scrape of any worker covers all
+    of them. Gauges are only taken from files written in the last minute,
+    so workers that have exited stop reporting them.
+    """
+
+    def __init__(self):
+        self.definitions = OrderedDict()
+        self.collectors = []
+        self._samples = {}
+        self._lock = threading.Lock()
+        self._flushed_at = 0.0
+
+    def define(self, name, kind, help_text, buckets=None):
+        """Declare a metric; kind is 'counter', 'gauge' or 'histogram'"""
+        self.definitions[name] = (kind, help_text, tuple(buckets) if buckets else None)
+
+    def inc(self, name, labels=(), amount=1):
+        """Add amount to a counter"""
+        key = (name, labels)
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0) + amount
+
+    def set(self, name, value, labels=()):
+        """Set a gauge, or a counter kept elsewhere, to value"""
+        with self._lock:
+            self._samples[(name, labels)] = value
+
+    def observe(self, name, value, labels=()):
+        """Record value in a histogram"""
+        from bisect import bisect_left
+        buckets = self.definitions[name][2]
+        key = (name, labels)
+        with self._lock:
+            sample = self._samples.get(key)
+            if sample is None:
+                sample = self._samples[key] = [[0] * (len(buckets) + 1), 0.0, 0]
+            sample[0][bisect_left(buckets, value)] += 1
+            sample[1] += value
+            sample[2] += 1
+
+    def snapshot(self):
+        """Run the collectors and return this process's samples as JSON-friendly rows"""
+        for collector in self.collectors:
+            try:
+                collector()
+            except Exception as e:
+                app.logger.error(f"Error collecting metrics: {e}")
+        with self._lock:
+            return [
+                [name, [list(label) for label in labels], [list(value[0]), value[1], value[2]] if isinstance(value, list) else value]
+                for (name, labels), value in self._samples.items()
+            ]
+
+    def flush(self, force=False):
+        """Write this process's samples to METRICS_DIR at most every METRICS_FLUSH_INTERVAL seconds"""
+        metrics_dir = app.config['METRICS_DIR']
+        now = time.monotonic()
+        if not metrics_dir or (not force and now - self._flushed_at < app.config['METRICS_FLUSH_INTERVAL']):
+            return
+        self._flushed_at = now
+        try:
+            os.makedirs(metrics_dir, exist_ok=True)
+            path = os.path.join(metrics_dir, f'metrics-{os.getpid()}.json')
+            with open(path + '.tmp', 'w') as output:
+                json.dump(self.snapshot(), output)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            app.logger.error(f"Error writing metrics to {metrics_dir}: {e}")
+
+    def merged_samples(self):
+        """Sum the samples of every worker process, or return this process's alone"""
+        metrics_dir = app.config['METRICS_DIR']
+        if not metrics_dir:
+            return self.snapshot()
+        self.flush(force=True)
+        merged = {}
+        for filename in os.listdir(metrics_dir):
+            if not filename.startswith('metrics-') or not filename.endswith('.json'):
+                continue
+            path = os.path.join(metrics_dir, filename)
+            try:
+                stale = time.time() - os.path.getmtime(path) > 60
+                with open(path) as source:
+                    rows = json.load(source)
+            except (OSError, ValueError):
+                continue
+            for name, labels, value in rows:
+                definition = self.definitions.get(name)
+                if definition is None or (stale and definition[0] == 'gauge'):
+                    continue
+                key = (name, tuple(tuple(label) for label in labels))
+                if isinstance(value, list):
+                    total = merged.setdefault(key, [[0] * len(value[0]), 0.0, 0])
+                    total[0] = [a + b for a, b in zip(total[0], value[0])]
+                    total[1] += value[1]
+                    total[2] += value[2]
+                else:
+                    merged[key] = merged.get(key, 0) + value
+        return [[name, labels, value] for (name, labels), value in merged.items()]
+
+    def render(self):
+        """All samples in the Prometheus text exposition format"""
+        by_name = {}
+        for name, labels, value in self.merged_samples():
+            by_name.setdefault(name, []).append((tuple(tuple(label) for label in labels), value))
+        lines = []
+        for name, (kind, help_text, buckets) in self.definitions.items():
+            samples = by_name.get(name)
+            if not samples:
+                continue
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for labels, value in sorted(samples):
+                if kind != 'histogram':
+                    lines.append(f'{name}{format_metric_labels(labels)} {format_metric_value(value)}')
+                    continue
+                counts, total, count = value
+                cumulative = 0
+                for bound, bucket_count in zip(buckets + (float('inf'),), counts):
+                    cumulative += bucket_count
+                    bucket_labels = labels + (('le', format_metric_value(bound)),)
+                    lines.append(f'{name}_bucket{format_metric_labels(bucket_labels)} {cumulative}')
+                lines.append(f'{name}_sum{format_metric_labels(labels)} {format_metric_value(total)}')
+                lines.append(f'{name}_count{format_metric_labels(labels)} {count}')
+        return '\n'.join(lines) + '\n'
+
+def format_metric_labels(labels):
+    """Render label pairs as {name="value",...}"""
+    if not labels:
+        return ''
+    escaped = (
+        f'{name}="' + str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for name, value in labels
+    )
+    return '{' + ','.join(escaped) + '}'
+
+def format_metric_value(value):
+    """Render a sample value, using Prometheus spelling for infinity"""
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value) if isinstance(value, float) else str(value)
+
+metrics = MetricsRegistry()
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+metrics.define('http_requests_total', 'counter', 'HTTP requests by endpoint, method and status code.')
+metrics.define('http_request_duration_seconds', 'histogram', 'HTTP request latency by endpoint and method.', LATENCY_BUCKETS)
+metrics.define('http_response_size_bytes', 'histogram', 'HTTP response body size by endpoint.',
+               (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216))
+metrics.define('db_pool_checkout_seconds', 'histogram', 'Time spent waiting for a database connection from the pool.',
+               (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0))
+metrics.define('db_pool_connections_checked_out', 'gauge', 'Database connections currently checked out of the pool.')
+metrics.define('response_cache_events_total', 'counter', 'Response cache hits, misses, evictions, expirations and invalidations.')
+metrics.define('response_cache_entries', 'gauge', 'Responses currently held in the response cache.')
+metrics.define('stats_refresh_duration_seconds', 'histogram', 'Duration of statistics cache rebuilds.', LATENCY_BUCKETS + (30.0, 60.0))
+metrics.define('stats_refresh_failures_total', 'counter', 'Statistics cache rebuilds that failed.')
+metrics.define('export_jobs', 'gauge', 'Report export jobs tracked by this process, by status.')
+metrics.define('login_throttled_total', 'counter', 'Password attempts rejected by the login rate limits, by limit.')
+metrics.define('password_hash_rejected_total', 'counter', 'Password hashing calls turned away because every slot was taken.')
+
+@app.after_request
+def _record_request_metrics(response):
+    """Count the request and record its latency and response size"""
+    if not app.config['METRICS_ENABLED'] or 'request_started' not in g:
+        return response
+    endpoint = request.endpoint or 'unmatched'
+    metrics.inc('http_requests_total', (('endpoint', endpoint), ('method', request.method), ('status', str(response.status_code))))
+    metrics.observe('http_request_duration_seconds', time.perf_counter() - g.request_started,
+                    (('endpoint', endpoint), ('method', request.method)))
+    if response.content_length is not None:
+        metrics.observe('http_response_size_bytes', response.content_length, (('endpoint', endpoint),))
+    metrics.flush()
+    return response
+
+def _time_pool_checkouts(engine):
+    """Record how long the engine waits to get a connection from its pool"""
+    raw_connection = engine.raw_connection
+
+    def timed_raw_connection():
+        started = time.perf_counter()
+        try:
+            return raw_connection()
+        finally:
+            metrics.observe('db_pool_checkout_seconds', time.perf_counter() - started)
+
+    engine.raw_connection = timed_raw_connection
+
+def _collect_runtime_metrics():
+    """Copy pool, response cache and export job state into the registry"""
+    with app.app_context():
+        pool = db.engine.pool
+    if hasattr(pool, 'checkedout'):
+        metrics.set('db_pool_connections_checked_out', pool.checkedout())
+    cache_status = response_cache.status()
+    for event_name in ('hits', 'misses', 'evictions', 'expirations', 'invalidations'):
+        metrics.set('response_cache_events_total', cache_status[event_name], (('event', event_name),))
+    metrics.set('response_cache_entries', cache_status['entries'])
+    with _export_jobs_lock:
+        statuses = [job['status'] for job in export_jobs.values()]
+    for status in ('queued', 'running', 'finished', 'failed'):
+        metrics.set('export_jobs', statuses.count(status), (('status', status),))
+
+metrics.collectors.append(_collect_runtime_metrics)
+
+@app.route('/metrics')
+def get_metrics():
+    """Request, database pool, cache and statistics refresh metrics in Prometheus text format"""
+    token = app.config['METRICS_TOKEN']
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        abort(401)
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+# --- Static Assets ---
+class StaticManifest:
+    """Content hashes of the files under static/, used to fingerprint their URLs.
+
+    The manifest is built when the app starts. A file whose mtime or size has
+    changed since is rehashed on its next lookup, and generation is bumped so
+    cached pages that link to it are rendered again.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.generation = 0
+        self._files = {}
+        self._lock = threading.Lock()
+        self._checked_at = time.monotonic()
+
+    def build(self):
+        for root, _, names in os.walk(self.folder):
+            for name in names:
+                self.fingerprint(os.path.relpath(os.path.join(root, name), self.folder).replace(os.sep, '/'))
+
+    def fingerprint(self, filename):
+        """Short content hash of a static file, or None if there is no such file"""
+        from werkzeug.security import safe_join
+        path = safe_join(self.folder, filename)
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            stat = None
+        if stat is None:
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self._files.get(filename)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        with self._lock:
+            if entry is not None:
+                self.generation += 1
+            self._files[filename] = (version, digest.hexdigest()[:12])
+        return self._files[filename][1]
+
+    def current_generation(self):
+        """generation after rehashing any file changed on disk, looked for at most once a second"""
+        now = time.monotonic()
+        if now - self._checked_at >= 1:
+            self._checked_at = now
+            for filename in list(self._files):
+                self.fingerprint(filename)
+        return self.generation
+
+static_manifest = StaticManifest(app.static_folder)
+
+@app.url_defaults
+def fingerprint_static_urls(endpoint, values):
+    """Add ?v=<content hash> to url_for('static', ...) so changed files get new URLs"""
+    if endpoint == 'static' and 'v' not in values:
+        fingerprint = static_manifest.fingerprint(values.get('filename', ''))
+        if fingerprint:
+            values['v'] = fingerprint
+
+@app.after_request
+def cache_fingerprinted_static(response):
+    """Let browsers keep static files requested under their current fingerprint without revalidating"""
+    if request.endpoint == 'static' and response.status_code in (200, 304):
+        version = request.args.get('v')
+        if version and version == static_manifest.fingerprint(request.view_args['filename']):
+            max_age = app.config['STATIC_CACHE_MAX_AGE']
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+            response.cache_control.immutable = True
+            response.expires = int(time.time() + max_age)
+    return response
+
+# --- Response Compression ---
+def negotiate_content_coding():
+    """The content coding to compress this response with: 'br', 'gzip' or None"""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+def compress_bytes(data, coding):
+    """Compress a whole response body"""
+    if coding == 'br':
+        return brotli.compress(data, quality=app.config['COMPRESS_BROTLI_QUALITY'])
+    return gzip.compress(data, compresslevel=app.config['COMPRESS_LEVEL'], mtime=0)
+
+def compress_chunks(chunks, coding):
+    """Compress a streamed body chunk by chunk, so it is never held in memory whole"""
+    if coding == 'br':
+        compressor = brotli.Compressor(quality=app.config['COMPRESS_BROTLI_QUALITY'])
+        compress, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(app.config['COMPRESS_LEVEL'], zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        compress, finish = compressor.compress, compressor.flush
+    try:
+        for chunk in chunks:
+            data = compress(chunk.encode() if isinstance(chunk, str) else chunk)
+            if data:
+                yield data
+        yield finish()
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+class CachedBody:
+    """A response body built from one version of a file, compressed at most once per content coding"""
+    __slots__ = ('mtime', 'data', 'encoded', 'etag')
+
+    def __init__(self, mtime, data):
+        self.mtime = mtime
+        self.data = data
+        self.encoded = {}
+        self.etag = hashlib.sha256(data).hexdigest()[:16]
+
+    def encode(self, coding):
+        body = self.encoded.get(coding)
+        if body is None:
+            body = self.encoded[coding] = compress_bytes(self.data, coding)
+        return body
+
+class CompressedBodyCache:
+    """LRU of response bodies that only change when their source file's mtime does"""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, path, build):
+        """The cached body for key, rebuilt with build() when path has been modified"""
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime == mtime:
+                self._entries.move_to_end(key)
+                return entry
+        entry = CachedBody(mtime, build())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > app.config['COMPRESS_CACHE_MAX_ENTRIES']:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+compressed_bodies = CompressedBodyCache()
+
+def render_page(template_name, per_user=True):
+    """Render an HTML page template, reusing its rendered and compressed bytes.
+
+    Most pages only vary with the logged-in user's role and name in the nav
+    bar, so those are part of the cache key; pages with no per-user content
+    pass per_user=False and share one entry. Editing the template file, or a
+    static file it links to, renders it again. Browsers revalidate pages with
+    the body's ETag and get 304 while nothing changed.
+    """
+    user_key = None
+    if per_user and current_user.is_authenticated:
+        user_key = (current_user.role, current_user.get_full_name())
+    key = ('page', template_name, request.script_root, static_manifest.current_generation(), user_key)
+    path = os.path.join(app.root_path, app.template_folder, template_name)
+    entry = compressed_bodies.get(key, path, lambda: render_template(template_name).encode())
+    response = app.response_class(entry.data, mimetype='text/html')
+    response.cached_body = entry
+    response.set_etag(entry.etag)
+    response.cache_control.no_cache = True
+    response.cache_control.private = per_user or None
+    return response.make_conditional(request)
+
+def _static_file_body(response):
+    """The cached body for a static file response, or None if the file is not on disk"""
+    from werkzeug.security import safe_join
+    path = safe_join(app.static_folder, request.view_args['filename'])
+    if path is None or not os.path.isfile(path):
+        return None
+
+    def read_file():
+        with open(path, 'rb') as f:
+            return f.read()
+
+    return compressed_bodies.get(('static', path), path, read_file)
+
+@app.after_request
+def compress_response(response):
+    """Compress large text responses for clients that accept gzip or brotli"""
+    if (not app.config['COMPRESS_ENABLED'] or response.status_code != 200
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in app.config['COMPRESS_MIMETYPES']):
+        return response
+    response.vary.add('Accept-Encoding')
+    if 'no-transform' in response.cache_control:
+        return response
+    coding = negotiate_content_coding()
+    if coding is None:
+        return response
+
+    cached_body = getattr(response, 'cached_body', None)
+    if cached_body is None and request.endpoint == 'static' and response.direct_passthrough:
+        cached_body = _static_file_body(response)
+    if cached_body is not None:
+        if len(cached_body.data) < app.config['COMPRESS_MIN_SIZE']:
+            return response
+        response.close()  # Releases the file a static response was going to stream
+        response.direct_passthrough = False
+        response.set_data(cached_body.encode(coding))
+    elif response.direct_passthrough:
+        return response  # Files sent with send_file; they may be answering a Range request
+    elif response.is_streamed:
+        response.response = compress_chunks(response.response, coding)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < app.config['COMPRESS_MIN_SIZE']:
+            return response
+        response.set_data(compress_bytes(data, coding))
+
+    response.headers['Content-Encoding'] = coding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)  # The bytes differ from the uncompressed representation
+    return response
+
 # --- Database Model Definition ---
+# Accepted reportDate formats; the UI submits dd-mm-yyyy
+REPORT_DATE_FORMATS = ('%d-%m-%Y', '%Y-%m-%d', '%d/%m/%Y')
+
+def parse_report_date(value):
+    """Parse a reportDate string into a date, or None if it is empty or unrecognised"""
+    if isinstance(value, date):
+        return value
+    if not value or not isinstance(value, str):
+        return None
+    for date_format in REPORT_DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), date_format).date()
+        except ValueError:
+            continue
+    return None
+
 class Report(db.Model):
+    __table_args__ = (
+        db.Index('ix_report_project_date', 'portfolioName', 'projectName', 'reportDateValue'),
+        db.Index('ix_report_testing_status', 'testingStatus'),
+        db.Index('ix_report_project_id_date', 'project_id', 'reportDateValue'),
+        db.Index('ix_report_portfolio_id', 'portfolio_id'),
+        db.Index('ix_report_release_number', 'releaseNumber'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     
     # Cover Information
@@ -122,17 +1321,20 @@ class Report(db.Model):
     reportName = db.Column(db.String(255)) # New field for custom report name
     cycleNumber = db.Column(db.Integer)
     releaseNumber = db.Column(db.String(50)) # Add missing releaseNumber field
+    portfolio_id = db.Column(db.Integer, db.ForeignKey('portfolio.id'))  # Managed portfolio matching portfolioName
+    project_id = db.Column(db.Integer, db.ForeignKey('project.id'))  # Managed project matching projectName
     reportDate = db.Column(db.String(50))
+    reportDateValue = db.Column(db.Date)  # Normalized from reportDate for sorting and range queries
     
     # Test Summary
     testSummary = db.Column(db.Text)
     testingStatus = db.Column(db.String(50))
     
-    # Dynamic data stored as JSON strings
-    requestData = db.Column(db.Text, default='[]')
-    buildData = db.Column(db.Text, default='[]')
-    testerData = db.Column(db.Text, default='[]')
-    teamMemberData = db.Column(db.Text, default='[]') # New field for team member data
+    # Dynamic data, one child row per list entry (see REPORT_LIST_FIELDS)
+    report_requests = db.relationship('ReportRequest', order_by='ReportRequest.position', cascade='all, delete-orphan')
+    builds = db.relationship('ReportBuild', order_by='ReportBuild.position', cascade='all, delete-orphan')
+    testers = db.relationship('ReportTester', order_by='ReportTester.position', cascade='all, delete-orphan')
+    team_members = db.relationship('ReportTeamMember', order_by='ReportTeamMember.position', cascade='all, delete-orphan')
     
     # User Stories Data (detailed breakdown)
     totalUserStories = db.Column(db.Integer, default=0)
@@ -180,7 +1382,7 @@ class Report(db.Model):
     enhancementsMetric = db.Column(db.Integer, default=0) # Auto-calculated from enhancements
     
     # QA Notes
-    qaNotesData = db.Column(db.Text, default='[]')  # Store multiple QA notes as JSON array
+    qa_notes = db.relationship('ReportQaNote', order_by='ReportQaNote.position', cascade='all, delete-orphan')
     qaNoteFieldsData = db.Column(db.Text, default='[]')  # Store custom QA note fields as JSON array
     
     # Automation Regression Data
@@ -206,6 +1408,31 @@ class Report(db.Model):
     createdAt = db.Column(db.DateTime, default=datetime.utcnow)
     updatedAt = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    @validates('reportDate')
+    def _sync_report_date_value(self, key, value):
+        """Keep the normalized reportDateValue column in step with reportDate"""
+        self.reportDateValue = parse_report_date(value)
+        return value
+
+    def set_list_field(self, field, items):
+        """Replace the child rows behind an API list field such as testerData.
+
+        Raises ValueError when items is not a list.
+        """
+        if items is None:
+            items = []
+        if not isinstance(items, list):
+            raise ValueError(f'{field} must be a list')
+        model = report_list_model(field)
+        setattr(self, REPORT_LIST_FIELDS[field], [model.from_item(item, position) for position, item in enumerate(items)])
+        if self.id is not None:
+            # Child rows alone do not touch the report row; keep updatedAt (and export cache keys) current
+            self.updatedAt = datetime.utcnow()
+
+    def list_field(self, field):
+        """The entries of an API list field such as testerData, in their original order"""
+        return [row.to_item() for row in getattr(self, REPORT_LIST_FIELDS[field])]
+
     def calculate_totals(self):
         """Calculate all total fields automatically"""
         # Calculate User Stories total
@@ -281,89 +1508,188 @@ class Report(db.Model):
 
     def to_dict(self):
         """Converts the Report object to a dictionary for JSON serialization."""
-        return {
-            'id': self.id,
-            'portfolioName': self.portfolioName,
-            'projectName': self.projectName,
-            'sprintNumber': self.sprintNumber,
-            'reportVersion': self.reportVersion,
-            'reportName': self.reportName,
-            'cycleNumber': self.cycleNumber,
-            'releaseNumber': self.releaseNumber,
-            'reportDate': self.reportDate,
-            'testSummary': self.testSummary,
-            'testingStatus': self.testingStatus,
-            
-            # Dynamic data
-            'requestData': json.loads(self.requestData or '[]'),
-            'buildData': json.loads(self.buildData or '[]'),
-            'testerData': json.loads(self.testerData or '[]'),
-            'teamMemberData': json.loads(self.teamMemberData or '[]'),
-            
-            # User Stories
-            'totalUserStories': self.totalUserStories,
-            'passedUserStories': self.passedUserStories,
-            'passedWithIssuesUserStories': self.passedWithIssuesUserStories,
-            'failedUserStories': self.failedUserStories,
-            'blockedUserStories': self.blockedUserStories,
-            'cancelledUserStories': self.cancelledUserStories,
-            'deferredUserStories': self.deferredUserStories,
-            'notTestableUserStories': self.notTestableUserStories,
-            
-            # Test Cases
-            'totalTestCases': self.totalTestCases,
-            'passedTestCases': self.passedTestCases,
-            'passedWithIssuesTestCases': self.passedWithIssuesTestCases,
-            'failedTestCases': self.failedTestCases,
-            'blockedTestCases': self.blockedTestCases,
-            'cancelledTestCases': self.cancelledTestCases,
-            'deferredTestCases': self.deferredTestCases,
-            'notTestableTestCases': self.notTestableTestCases,
-            
-            # Issues
-            'totalIssues': self.totalIssues,
-            'criticalIssues': self.criticalIssues,
-            'highIssues': self.highIssues,
-            'mediumIssues': self.mediumIssues,
-            'lowIssues': self.lowIssues,
-            'newIssues': self.newIssues,
-            'fixedIssues': self.fixedIssues,
-            'notFixedIssues': self.notFixedIssues,
-            'reopenedIssues': self.reopenedIssues,
-            'deferredIssues': self.deferredIssues,
-            
-            # Enhancements
-            'totalEnhancements': self.totalEnhancements,
-            'newEnhancements': self.newEnhancements,
-            'implementedEnhancements': self.implementedEnhancements,
-            'existsEnhancements': self.existsEnhancements,
-            
-            # Metrics
-            'userStoriesMetric': self.userStoriesMetric,
-            'testCasesMetric': self.testCasesMetric,
-            'issuesMetric': self.issuesMetric,
-            'enhancementsMetric': self.enhancementsMetric,
-            'qaNotesData': json.loads(self.qaNotesData or '[]'),
-            'qaNoteFieldsData': json.loads(self.qaNoteFieldsData or '[]'),
-            
-            # Automation Regression Data
-            'automationPassedTestCases': self.automationPassedTestCases,
-            'automationFailedTestCases': self.automationFailedTestCases,
-            'automationSkippedTestCases': self.automationSkippedTestCases,
-            'automationTotalTestCases': self.automationTotalTestCases,
-            'automationPassedPercentage': self.automationPassedPercentage,
-            'automationFailedPercentage': self.automationFailedPercentage,
-            'automationSkippedPercentage': self.automationSkippedPercentage,
-            'automationStableTests': self.automationStableTests,
-            'automationFlakyTests': self.automationFlakyTests,
-            'automationStabilityTotal': self.automationStabilityTotal,
-            'automationStablePercentage': self.automationStablePercentage,
-            'automationFlakyPercentage': self.automationFlakyPercentage,
-            
-            # Metadata
-            'createdAt': self.createdAt.isoformat() if self.createdAt else None,
-            'updatedAt': self.updatedAt.isoformat() if self.updatedAt else None,
-        }
+        return report_payload(self, {field: self.list_field(field) for field in REPORT_LIST_FIELDS})
+
+class ReportListItemMixin:
+    """One entry of a report's dynamic list, e.g. a tester or a build, at its position in the list.
+
+    Keys listed in item_fields as (key, column, type) are stored in typed,
+    indexable columns. Any other keys, values of an unexpected type and entries
+    that are not objects are kept as JSON in `extra`, so entries round-trip
+    through the API unchanged.
+    """
+    item_fields = ()
+
+    id = db.Column(db.Integer, primary_key=True)
+    position = db.Column(db.Integer, nullable=False, default=0)
+    extra = db.Column(db.Text)
+
+    @declared_attr
+    def report_id(cls):
+        return db.Column(db.Integer, db.ForeignKey('report.id', ondelete='CASCADE'), nullable=False)
+
+    @classmethod
+    def from_item(cls, item, position):
+        """Build an unsaved row from one list entry"""
+        row = cls(position=position)
+        if not isinstance(item, dict):
+            row.extra = json.dumps(item)
+            return row
+        extra = dict(item)
+        for key, column, value_type in cls.item_fields:
+            if type(extra.get(key)) is value_type:
+                setattr(row, column, extra.pop(key))
+        if extra:
+            row.extra = json.dumps(extra)
+        return row
+
+    @classmethod
+    def row_to_item(cls, row):
+        """The list entry a row of this table (an instance or a selected row) was built from"""
+        extra = json.loads(row.extra) if row.extra else {}
+        if not isinstance(extra, dict):
+            return extra
+        item = {}
+        for key, column, _ in cls.item_fields:
+            value = getattr(row, column)
+            if value is not None:
+                item[key] = value
+        item.update(extra)
+        return item
+
+    def to_item(self):
+        """The list entry this row was built from"""
+        return self.row_to_item(self)
+
+    def item_values(self):
+        """Column values for inserting this row with a bulk INSERT (report_id still to be set)"""
+        return {column.key: getattr(self, column.key) for column in self.__table__.columns if column.key != 'id'}
+
+class ReportRequest(ReportListItemMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_report_request_report_id', 'report_id', 'position'),
+        db.Index('ix_report_request_request_id', 'request_id'),
+    )
+    item_fields = (('id', 'request_id', str), ('url', 'url', str))
+
+    request_id = db.Column(db.String(100))
+    url = db.Column(db.Text)
+
+class ReportBuild(ReportListItemMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_report_build_report_id', 'report_id', 'position'),
+        db.Index('ix_report_build_request_id', 'request_id'),
+        db.Index('ix_report_build_environment', 'environment'),
+    )
+    item_fields = (('requestId', 'request_id', str), ('requestUrl', 'request_url', str),
+                   ('environment', 'environment', str), ('cycles', 'cycles', str))
+
+    request_id = db.Column(db.String(100))
+    request_url = db.Column(db.Text)
+    environment = db.Column(db.String(100))
+    cycles = db.Column(db.String(50))
+
+class ReportTester(ReportListItemMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_report_tester_report_id', 'report_id', 'position'),
+        db.Index('ix_report_tester_email', 'email'),
+        db.Index('ix_report_tester_name', 'name'),
+        db.Index('ix_report_tester_tester_id', 'tester_id'),
+    )
+    item_fields = (('id', 'tester_id', int), ('name', 'name', str), ('email', 'email', str),
+                   ('is_automation_engineer', 'is_automation_engineer', bool),
+                   ('is_manual_engineer', 'is_manual_engineer', bool))
+
+    tester_id = db.Column(db.Integer)  # The managed tester, as it was when the report was saved
+    name = db.Column(db.String(100))
+    email = db.Column(db.String(120))
+    is_automation_engineer = db.Column(db.Boolean)
+    is_manual_engineer = db.Column(db.Boolean)
+
+class ReportTeamMember(ReportListItemMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_report_team_member_report_id', 'report_id', 'position'),
+        db.Index('ix_report_team_member_email', 'email'),
+        db.Index('ix_report_team_member_team_member_id', 'team_member_id'),
+    )
+    item_fields = (('id', 'team_member_id', int), ('name', 'name', str), ('email', 'email', str), ('role', 'role', str))
+
+    team_member_id = db.Column(db.Integer)  # The managed team member, as it was when the report was saved
+    name = db.Column(db.String(100))
+    email = db.Column(db.String(120))
+    role = db.Column(db.String(100))
+
+class ReportQaNote(ReportListItemMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_report_qa_note_report_id', 'report_id', 'position'),
+    )
+    item_fields = (('note', 'note', str),)
+
+    note = db.Column(db.Text)
+
+# API list fields stored as child rows: payload key -> Report relationship
+REPORT_LIST_FIELDS = {
+    'requestData': 'report_requests',
+    'buildData': 'builds',
+    'testerData': 'testers',
+    'teamMemberData': 'team_members',
+    'qaNotesData': 'qa_notes',
+}
+
+def report_list_model(field):
+    """The child model behind an API list field"""
+    return Report.__mapper__.relationships[REPORT_LIST_FIELDS[field]].mapper.class_
+
+def report_payload(source, lists):
+    """The API form of a report from a Report or a selected report row and its list fields.
+
+    qaNoteFieldsData is passed through as RawJSON, so the stored text is not
+    decoded just to be encoded again.
+    """
+    payload = dict(zip(REPORT_DICT_FIELDS, _report_dict_values(source)))
+    payload['createdAt'] = source.createdAt.isoformat() if source.createdAt else None
+    payload['updatedAt'] = source.updatedAt.isoformat() if source.updatedAt else None
+    payload.update(lists)
+    payload['qaNoteFieldsData'] = RawJSON(source.qaNoteFieldsData or '[]')
+    return payload
+
+def report_payloads(rows, chunk_size=500):
+    """Report.to_dict for many selected report rows (see report_columns_query) without building ORM objects.
+
+    Each list field is read with one query per chunk_size reports.
+    """
+    report_ids = [row.id for row in rows]
+    lists = {report_id: {field: [] for field in REPORT_LIST_FIELDS} for report_id in report_ids}
+    for field in REPORT_LIST_FIELDS:
+        model = report_list_model(field)
+        for start in range(0, len(report_ids), chunk_size):
+            item_rows = db.session.execute(
+                db.select(*model.__table__.columns)
+                .where(model.report_id.in_(report_ids[start:start + chunk_size]))
+                .order_by(model.report_id, model.position)
+            )
+            for item_row in item_rows:
+                lists[item_row.report_id][field].append(model.row_to_item(item_row))
+    return [report_payload(row, lists[row.id]) for row in rows]
+
+def report_columns_query():
+    """A report query selecting plain column rows, for report_payloads"""
+    return Report.query.with_entities(*Report.__table__.columns)
+
+# Report columns holding JSON-encoded lists
+REPORT_JSON_FIELDS = ('qaNoteFieldsData',)
+# Columns that can be selected with fields= on the reports list
+REPORT_SCALAR_FIELDS = [column.key for column in Report.__table__.columns if column.key not in REPORT_JSON_FIELDS]
+# Columns report_payload copies as they are (timestamps, list fields and JSON columns are added separately)
+REPORT_DICT_FIELDS = tuple(
+    field for field in REPORT_SCALAR_FIELDS if field not in ('reportDateValue', 'createdAt', 'updatedAt')
+)
+_report_dict_values = operator.attrgetter(*REPORT_DICT_FIELDS)
+# Columns the reports list page renders
+REPORT_SUMMARY_FIELDS = (
+    'id', 'portfolioName', 'projectName', 'sprintNumber', 'reportVersion', 'reportName',
+    'cycleNumber', 'releaseNumber', 'reportDate', 'testingStatus', 'createdAt', 'updatedAt'
+)
 
 # --- Authentication Routes ---
 
@@ -375,11 +1701,18 @@ def login():
     
     form = LoginForm()
     if form.validate_on_submit():
+        wait = password_attempt_wait(form.email.data)
+        if wait:
+            flash('Too many login attempts. Please wait a moment and try again.', 'error')
+            return render_template('login.html', form=form), 429, too_many_attempts(wait)
         user = User.query.filter_by(email=form.email.data).first()
         if user and user.check_password(form.password.data):
             if not user.is_approved:
                 flash('Your account is pending approval. Please contact an administrator.', 'warning')
                 return render_template('login.html', form=form)
+            if user.needs_rehash():
+                user.set_password(form.password.data)
+                db.session.commit()
             login_user(user)
             next_page = request.args.get('next')
             return redirect(next_page) if next_page else redirect(url_for('dashboard'))
@@ -394,6 +1727,11 @@ def register():
     
     form = RegistrationForm()
     if form.validate_on_submit():
+        wait = password_attempt_wait()
+        if wait:
+            flash('Too many attempts. Please wait a moment and try again.', 'error')
+            return render_template('register.html', form=form), 429, too_many_attempts(wait)
+        
         # Check if user already exists
         if User.query.filter_by(email=form.email.data).first():
             flash('Email already registered.', 'error')
@@ -458,6 +1796,7 @@ def approve_user(user_id):
     user = User.query.get_or_404(user_id)
     user.is_approved = True
     db.session.commit()
+    user_cache.invalidate(user.id)
     return jsonify({'success': True, 'message': 'User approved successfully'})
 
 @app.route('/api/users/<int:user_id>/toggle-role', methods=['POST'])
@@ -469,6 +1808,7 @@ def toggle_user_role(user_id):
     user = User.query.get_or_404(user_id)
     user.role = 'admin' if user.role == 'user' else 'user'
     db.session.commit()
+    user_cache.invalidate(user.id)
     return jsonify({'success': True, 'message': 'User role updated successfully'})
 
 @app.route('/api/users/<int:user_id>', methods=['DELETE'])
@@ -483,6 +1823,7 @@ def delete_user(user_id):
     user = User.query.get_or_404(user_id)
     db.session.delete(user)
     db.session.commit()
+    user_cache.invalidate(user_id)
     return jsonify({'success': True, 'message': 'User deleted successfully'})
 
 @app.route('/api/profile/update', methods=['POST'])
@@ -495,18 +1836,20 @@ def update_profile():
     if not data:
         return jsonify({'success': False, 'message': 'No data provided'}), 400
     
+    user = db.session.get(User, current_user.id)
     try:
-        current_user.first_name = data.get('first_name', current_user.first_name)
-        current_user.last_name = data.get('last_name', current_user.last_name)
-        current_user.email = data.get('email', current_user.email)
+        user.first_name = data.get('first_name', user.first_name)
+        user.last_name = data.get('last_name', user.last_name)
+        user.email = data.get('email', user.email)
         
         # Check if email is already taken by another user
-        if data.get('email') and data.get('email') != current_user.email:
+        if data.get('email') and data.get('email') != user.email:
             existing_user = User.query.filter_by(email=data.get('email')).first()
             if existing_user:
                 return jsonify({'success': False, 'message': 'Email already taken'}), 400
         
         db.session.commit()
+        user_cache.invalidate(user.id)
         return jsonify({'success': True, 'message': 'Profile updated successfully'})
     
     except Exception as e:
@@ -529,15 +1872,21 @@ def change_password():
     if not current_password or not new_password:
         return jsonify({'success': False, 'message': 'Current and new passwords are required'}), 400
     
-    if not current_user.check_password(current_password):
+    wait = password_attempt_wait(current_user.email)
+    if wait:
+        return jsonify({'success': False, 'message': 'Too many attempts. Please wait a moment and try again.'}), 429, too_many_attempts(wait)
+    
+    user = db.session.get(User, current_user.id)
+    if not user.check_password(current_password):
         return jsonify({'success': False, 'message': 'Current password is incorrect'}), 400
     
     if len(new_password) < 6:
         return jsonify({'success': False, 'message': 'New password must be at least 6 characters'}), 400
     
     try:
-        current_user.set_password(new_password)
+        user.set_password(new_password)
         db.session.commit()
+        user_cache.invalidate(user.id)
         return jsonify({'success': True, 'message': 'Password changed successfully'})
     
     except Exception as e:
@@ -571,6 +1920,7 @@ def admin_update_user(user_id):
                 return jsonify({'success': False, 'message': 'Email already taken'}), 400
         
         db.session.commit()
+        user_cache.invalidate(user.id)
         return jsonify({'success': True, 'message': 'User updated successfully'})
     
     except Exception as e:
@@ -601,6 +1951,7 @@ def admin_reset_password(user_id):
     try:
         user.set_password(new_password)
         db.session.commit()
+        user_cache.invalidate(user.id)
         return jsonify({'success': True, 'message': 'Password reset successfully'})
     
     except Exception as e:
@@ -621,7 +1972,7 @@ def index():
 @approved_required
 def dashboard():
     """Serves the dashboard HTML page."""
-    return render_template('dashboard.html')
+    return render_page('dashboard.html')
 
 @app.route('/debug-dashboard')
 def debug_dashboard_page():
@@ -656,12 +2007,12 @@ def debug_theme_page():
 @app.route('/theme-test')
 def theme_test_page():
     """Serves the theme test page."""
-    return render_template('theme_test.html')
+    return render_page('theme_test.html', per_user=False)
 
 @app.route('/test-all-themes')
 def test_all_themes_page():
     """Test page to verify themes work on all components."""
-    return render_template('test_all_themes.html')
+    return render_page('test_all_themes.html', per_user=False)
 
 @app.route('/test-dashboard')
 def test_dashboard_page():
@@ -678,49 +2029,85 @@ def test_dashboard_fix_page():
 @approved_required
 def reports():
     """Serves the reports management HTML page."""
-    return render_template('reports.html')
+    return render_page('reports.html')
 
 @app.route('/create-report')
 @login_required
 @approved_required
 def create_report_page():
     """Serves the create/edit report HTML page."""
-    return render_template('create_report.html')
+    return render_page('create_report.html')
 
 @app.route('/report/<int:report_id>')
 @login_required
 @approved_required
 def view_report(report_id):
     """Serves the report view page."""
-    return render_template('view_report.html', report_id=report_id)
+    return render_page('view_report.html')
 
 @app.route('/api/reports', methods=['GET'])
 @login_required
 @approved_required
 def get_reports():
-    """Fetches reports from the database with pagination and search."""
+    """Fetches reports from the database with pagination, search and filters.
+
+    By default pages are addressed with page/per_page. Passing cursor (empty
+    for the first page, then the returned nextCursor) switches to keyset
+    pagination on Report.id, which skips the COUNT and OFFSET queries; add
+    total=approximate or total=exact to include a total count. fields=summary
+    or fields=<comma separated columns> returns only those scalar columns.
+    """
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
     search_query = request.args.get('search', '', type=str)
 
-    query = Report.query
+    fields = parse_report_fields(request.args.get('fields'))
+    if fields is None:
+        return jsonify({'error': 'Invalid fields parameter'}), 400
 
+    if fields:
+        query = db.session.query(*[getattr(Report, field) for field in fields])
+        serialize = lambda rows: [report_row_dict(row, fields) for row in rows]
+    else:
+        query = report_columns_query()
+        serialize = report_payloads
+
+    query = filter_reports_query(query, request.args)
+
+    search_rank = None
     if search_query:
-        search_term = f"%{search_query}%"
-        query = query.filter(
-            db.or_(
-                Report.portfolioName.ilike(search_term),
-                Report.projectName.ilike(search_term),
-                Report.sprintNumber.ilike(search_term),
-                Report.reportVersion.ilike(search_term)
-            )
-        )
+        query, search_rank = get_report_search().apply(query, search_query)
+
+    if 'cursor' in request.args:
+        cursor = request.args.get('cursor', type=int)
+        keyset_query = query
+        if cursor:
+            keyset_query = keyset_query.filter(Report.id < cursor)
+        rows = keyset_query.order_by(Report.id.desc()).limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
 
-    pagination = query.order_by(Report.id.desc()).paginate(page=page, per_page=per_page, error_out=False)
+        result = {
+            'reports': serialize(rows),
+            'nextCursor': rows[-1].id if has_next else None,
+            'hasNext': has_next,
+            'perPage': per_page
+        }
+        total_mode = request.args.get('total')
+        if total_mode == 'exact':
+            result['total'] = query.order_by(None).count()
+        elif total_mode == 'approximate':
+            result['total'] = approximate_report_count(request.args)
+            result['totalApproximate'] = True
+        return jsonify(result)
+
+    # Search results are ranked by relevance; keyset pages above stay in id order
+    ordering = [search_rank, Report.id.desc()] if search_rank is not None else [Report.id.desc()]
+    pagination = query.order_by(*ordering).paginate(page=page, per_page=per_page, error_out=False)
     reports = pagination.items
     
     return jsonify({
-        'reports': [report.to_dict() for report in reports],
+        'reports': serialize(reports),
         'total': pagination.total,
         'page': page,
         'totalPages': pagination.pages,
@@ -728,165 +2115,769 @@ def get_reports():
         'hasPrev': pagination.has_prev
     })
 
-@app.route('/api/reports/<int:report_id>', methods=['GET'])
+def filter_reports_query(query, args):
+    """Apply the portfolio, project, status and date range filters from request args"""
+    if args.get('portfolio'):
+        query = query.filter(Report.portfolioName == args['portfolio'])
+    if args.get('project'):
+        query = query.filter(Report.projectName == args['project'])
+    if args.get('status'):
+        query = query.filter(Report.testingStatus == args['status'])
+    if args.get('tester'):
+        query = query.filter(Report.testers.any(db.or_(ReportTester.email == args['tester'], ReportTester.name == args['tester'])))
+    date_from = parse_report_date(args.get('date_from'))
+    if date_from:
+        query = query.filter(Report.reportDateValue >= date_from)
+    date_to = parse_report_date(args.get('date_to'))
+    if date_to:
+        query = query.filter(Report.reportDateValue <= date_to)
+    return query
+
+def parse_report_fields(fields_param):
+    """Resolve a fields= parameter to a list of Report columns.
+
+    Returns [] when no projection was requested and None when the parameter
+    names a JSON blob or unknown column.
+    """
+    if not fields_param:
+        return []
+    if fields_param == 'summary':
+        return list(REPORT_SUMMARY_FIELDS)
+    fields = ['id']
+    for field in fields_param.split(','):
+        field = field.strip()
+        if field not in REPORT_SCALAR_FIELDS:
+            return None
+        if field not in fields:
+            fields.append(field)
+    return fields
+
+def report_row_dict(row, fields):
+    """Serialize a projected report row the same way Report.to_dict formats columns"""
+    result = {}
+    for field, value in zip(fields, row):
+        if isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        result[field] = value
+    return result
+
+def approximate_report_count(args):
+    """Estimate a filtered report count from the stats rollups without scanning reports.
+
+    Only portfolio/project filters can be answered from the rollups; returns
+    None for any other filter combination.
+    """
+    from sqlalchemy import func
+
+    if any(args.get(name) for name in ('search', 'status', 'tester', 'date_from', 'date_to')):
+        return None
+    if args.get('portfolio') and args.get('project'):
+        stats = ProjectStats.query.filter_by(portfolio_name=args['portfolio'], project_name=args['project']).first()
+        return stats.total_reports if stats else 0
+    if args.get('portfolio'):
+        stats = PortfolioStats.query.filter_by(portfolio_name=args['portfolio']).first()
+        return stats.total_reports if stats else 0
+    if args.get('project'):
+        return db.session.query(func.sum(ProjectStats.total_reports)).filter(
+            ProjectStats.project_name == args['project']
+        ).scalar() or 0
+    return get_dashboard_rollup().total_reports or 0
+
+# --- Report Export ---
+# Rows fetched per database round trip while exporting
+REPORT_EXPORT_BATCH_SIZE = 500
+REPORT_EXPORT_MIMETYPES = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+def report_export_query(args, columns=None):
+    """Build the export query from the same filters, search and fields= as get_reports.
+
+    Exports default to every scalar column; pass `columns` to select other
+    Report columns instead. Returns (query, fields), or (None, None) when
+    fields= is invalid.
+    """
+    fields = parse_report_fields(args.get('fields')) if args.get('fields') else list(REPORT_SCALAR_FIELDS)
+    if fields is None:
+        return None, None
+    query = db.session.query(*(columns or [getattr(Report, field) for field in fields]))
+    query = filter_reports_query(query, args)
+    search_rank = None
+    if args.get('search'):
+        query, search_rank = get_report_search().apply(query, args['search'])
+    ordering = [search_rank, Report.id.desc()] if search_rank is not None else [Report.id.desc()]
+    return query.order_by(*ordering).yield_per(REPORT_EXPORT_BATCH_SIZE), fields
+
+def spreadsheet_safe(value):
+    """Keep text cells from being evaluated as formulas by spreadsheet applications"""
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@'):
+        return "'" + value
+    return value
+
+def export_filename(extension):
+    """Timestamped download name for a report export"""
+    return f"reports-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.{extension}"
+
+def csv_export_chunks(rows, fields):
+    """Yield CSV text for the header and rows, one batch of rows per chunk"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for count, row in enumerate(rows, 1):
+        writer.writerow([
+            value.isoformat() if isinstance(value, (date, datetime)) else spreadsheet_safe(value)
+            for value in row
+        ])
+        if count % REPORT_EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def write_xlsx_export(rows, fields, output):
+    """Write the header and rows to `output` through a write-only workbook, which spools rows to disk"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Reports')
+    worksheet.append(fields)
+    for row in rows:
+        worksheet.append([spreadsheet_safe(value) for value in row])
+    workbook.save(output)
+
+def stream_file(output, chunk_size=64 * 1024):
+    """Yield an open binary file in chunks and close it afterwards"""
+    with output:
+        while True:
+            chunk = output.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+@app.route('/api/reports/export.csv', methods=['GET'])
 @login_required
 @approved_required
-def get_report(report_id):
-    """Fetches a specific report by ID."""
-    report = Report.query.get_or_404(report_id)
-    return jsonify(report.to_dict())
+def export_reports_csv():
+    """Stream the filtered reports as CSV, one batch of rows at a time"""
+    query, fields = report_export_query(request.args)
+    if query is None:
+        return jsonify({'error': 'Invalid fields parameter'}), 400
 
-@app.route('/api/dashboard/stats', methods=['GET'])
+    return Response(stream_with_context(csv_export_chunks(query, fields)), mimetype=REPORT_EXPORT_MIMETYPES['csv'], headers={
+        'Content-Disposition': f'attachment; filename="{export_filename("csv")}"'
+    })
+
+@app.route('/api/reports/export.xlsx', methods=['GET'])
 @login_required
 @approved_required
-def get_dashboard_stats():
-    """Get dashboard statistics for all projects and individual projects."""
-    # Use optimized database queries instead of loading all data into memory
-    from sqlalchemy import func
-    
-    # Get overall stats with single queries
-    total_reports = db.session.query(func.count(Report.id)).scalar()
-    completed_reports = db.session.query(func.count(Report.id)).filter(Report.testingStatus == 'passed').scalar()
-    in_progress_reports = db.session.query(func.count(Report.id)).filter(Report.testingStatus == 'passed-with-issues').scalar()
-    pending_reports = total_reports - completed_reports - in_progress_reports
-    
-    # Get aggregate metrics with database aggregation
-    aggregate_result = db.session.query(
-        func.sum(Report.totalUserStories).label('total_user_stories'),
-        func.sum(Report.passedUserStories).label('passed_user_stories'),
-        func.sum(Report.passedWithIssuesUserStories).label('passed_with_issues_user_stories'),
-        func.sum(Report.failedUserStories).label('failed_user_stories'),
-        func.sum(Report.blockedUserStories).label('blocked_user_stories'),
-        func.sum(Report.cancelledUserStories).label('cancelled_user_stories'),
-        func.sum(Report.deferredUserStories).label('deferred_user_stories'),
-        func.sum(Report.notTestableUserStories).label('not_testable_user_stories'),
-        func.sum(Report.totalTestCases).label('total_test_cases'),
-        func.sum(Report.passedTestCases).label('passed_test_cases'),
-        func.sum(Report.passedWithIssuesTestCases).label('passed_with_issues_test_cases'),
-        func.sum(Report.failedTestCases).label('failed_test_cases'),
-        func.sum(Report.blockedTestCases).label('blocked_test_cases'),
-        func.sum(Report.cancelledTestCases).label('cancelled_test_cases'),
-        func.sum(Report.deferredTestCases).label('deferred_test_cases'),
-        func.sum(Report.notTestableTestCases).label('not_testable_test_cases'),
-        func.sum(Report.totalIssues).label('total_issues'),
-        func.sum(Report.criticalIssues).label('critical_issues'),
-        func.sum(Report.highIssues).label('high_issues'),
-        func.sum(Report.mediumIssues).label('medium_issues'),
-        func.sum(Report.lowIssues).label('low_issues'),
-        func.sum(Report.newIssues).label('new_issues'),
-        func.sum(Report.fixedIssues).label('fixed_issues'),
-        func.sum(Report.notFixedIssues).label('not_fixed_issues'),
-        func.sum(Report.reopenedIssues).label('reopened_issues'),
-        func.sum(Report.deferredIssues).label('deferred_issues'),
-        func.sum(Report.totalEnhancements).label('total_enhancements'),
-        func.sum(Report.newEnhancements).label('new_enhancements'),
-        func.sum(Report.implementedEnhancements).label('implemented_enhancements'),
-        func.sum(Report.existsEnhancements).label('exists_enhancements'),
-        func.sum(Report.automationTotalTestCases).label('total_automation_test_cases'),
-        func.sum(Report.automationPassedTestCases).label('automation_passed_test_cases'),
-        func.sum(Report.automationFailedTestCases).label('automation_failed_test_cases'),
-        func.sum(Report.automationSkippedTestCases).label('automation_skipped_test_cases'),
-        func.sum(Report.automationStableTests).label('automation_stable_tests'),
-        func.sum(Report.automationFlakyTests).label('automation_flaky_tests'),
-    ).first()
-    
-    # Project-specific metrics using optimized query
-    project_stats = db.session.query(
-        Report.portfolioName,
-        Report.projectName,
-        func.count(Report.id).label('totalReports'),
-        func.sum(Report.totalUserStories).label('totalUserStories'),
-        func.sum(Report.totalTestCases).label('totalTestCases'),
-        func.sum(Report.totalIssues).label('totalIssues'),
-        func.sum(Report.totalEnhancements).label('totalEnhancements'),
-        func.max(Report.reportDate).label('lastReportDate')
-    ).group_by(Report.portfolioName, Report.projectName).all()
-    
-    # Get latest testing status for each project
-    latest_reports_subquery = db.session.query(
-        Report.portfolioName,
-        Report.projectName,
-        Report.testingStatus,
-        func.row_number().over(
-            partition_by=[Report.portfolioName, Report.projectName],
-            order_by=Report.reportDate.desc()
-        ).label('rn')
-    ).subquery()
+def export_reports_xlsx():
+    """Export the filtered reports as an Excel workbook.
+
+    Rows go through a write-only workbook, which spools them to disk, and the
+    finished file is streamed back in chunks. A workbook is only complete once
+    every row is written, so exports of more than EXPORT_XLSX_SYNC_MAX_ROWS
+    reports are run as export jobs instead. The file is returned at once when
+    the same export is cached already; otherwise the response is a 303
+    redirect to the job, which is polled until it has a downloadUrl.
+    """
+    query, fields = report_export_query(request.args)
+    if query is None:
+        return jsonify({'error': 'Invalid fields parameter'}), 400
+    total = count_export_reports(request.args)
+    if total > app.config['EXPORT_XLSX_SYNC_MAX_ROWS']:
+        filters = export_filters(request.args)
+        job = start_export_job('xlsx', fields, total, export_cache_key('xlsx', fields, filters), filters=filters)
+        if not job['cached']:
+            return redirect(url_for('get_export_job', job_id=job['id']), 303)
+        output = open(job['path'], 'rb')
+    else:
+        output = tempfile.TemporaryFile()
+        write_xlsx_export(query, fields, output)
+        output.seek(0)
+
+    return Response(stream_file(output), mimetype=REPORT_EXPORT_MIMETYPES['xlsx'], headers={
+        'Content-Disposition': f'attachment; filename="{export_filename("xlsx")}"'
+    })
+
+# --- Export Jobs ---
+# Each job's state is saved as JSON under EXPORT_CACHE_DIR/jobs, next to the
+# finished files, so any worker process can report its progress and serve its
+# file. export_jobs only holds the jobs this process runs, for its metrics.
+export_jobs = {}
+_export_jobs_lock = threading.Lock()
+_export_executor = None
+
+def get_export_executor():
+    """Return the worker pool that runs export jobs, starting it on first use"""
+    global _export_executor
+    with _export_jobs_lock:
+        if _export_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _export_executor = ThreadPoolExecutor(
+                max_workers=app.config['EXPORT_WORKERS'], thread_name_prefix='report-export'
+            )
+    return _export_executor
+
+def export_filters(args):
+    """The filter and search parameters of an export request, without fields="""
+    return {name: value for name, value in args.items() if value and name != 'fields'}
+
+def count_export_reports(args):
+    """Number of reports an export with these filters and search covers"""
+    from sqlalchemy import func
+
+    query, _ = report_export_query(args, columns=[func.count(Report.id)])
+    return query.order_by(None).scalar()
+
+def export_cache_key(export_format, fields, selection):
+    """Cache key for an export of the reports `selection` picks (filters or a list of report ids).
+
+    The data version is bumped by every report write, so a key built from it
+    changes whenever the export's contents could.
+    """
+    return hashlib.sha256(json.dumps(
+        [export_format, fields, selection, get_data_version()], sort_keys=True
+    ).encode()).hexdigest()
+
+def export_cache_path(cache_key, export_format):
+    """Location of the cached file for an export"""
+    return os.path.join(app.config['EXPORT_CACHE_DIR'], f'{cache_key}.{export_format}')
+
+def export_job_file(job_id):
+    """Location of the saved state of an export job"""
+    return os.path.join(app.config['EXPORT_CACHE_DIR'], 'jobs', f'{job_id}.json')
+
+def save_export_job(job):
+    """Write an export job's state where every worker process can read it"""
+    path = export_job_file(job['id'])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial_path = f'{path}.{os.getpid()}.part'
+    with open(partial_path, 'w', encoding='utf-8') as output:
+        json.dump(job, output)
+    os.replace(partial_path, path)
+
+def load_export_job(job_id):
+    """The saved state of an export job, or None if there is no such job"""
+    if not job_id.isalnum():  # Job ids are uuid hex; anything else could name another file
+        return None
+    try:
+        with open(export_job_file(job_id), encoding='utf-8') as saved:
+            return json.load(saved)
+    except (OSError, ValueError):
+        return None
+
+def _export_job_expired(job, now):
+    """Whether a job finished, or was abandoned, long enough ago to forget it"""
+    if now - (job['finished_at'] or job['created_at']) > app.config['EXPORT_CACHE_TTL']:
+        return True
+    return job['status'] == 'finished' and not os.path.exists(job['path'])
+
+def evict_export_cache():
+    """Delete cached export files past EXPORT_CACHE_TTL, then the least recently used
+    ones until the cache fits in EXPORT_CACHE_MAX_BYTES. Returns the number removed."""
+    cache_dir = app.config['EXPORT_CACHE_DIR']
+    if not os.path.isdir(cache_dir):
+        return 0
+    now = time.time()
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and not entry.name.endswith('.part'):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort()
+
+    removed = 0
+    total_size = sum(size for _, size, _ in entries)
+    for modified, size, path in entries:
+        if now - modified <= app.config['EXPORT_CACHE_TTL'] and total_size <= app.config['EXPORT_CACHE_MAX_BYTES']:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
+        removed += 1
+
+    # Forget jobs whose files are gone or that finished too long ago
+    jobs_dir = os.path.join(cache_dir, 'jobs')
+    if os.path.isdir(jobs_dir):
+        for entry in os.scandir(jobs_dir):
+            if not entry.name.endswith('.json'):
+                continue
+            job = load_export_job(entry.name[:-len('.json')])
+            if job is not None and _export_job_expired(job, now):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+    with _export_jobs_lock:
+        for job_id, job in list(export_jobs.items()):
+            if _export_job_expired(job, now):
+                del export_jobs[job_id]
+    return removed
+
+def export_job_dict(job):
+    """Public view of an export job"""
+    return {
+        'id': job['id'],
+        'status': job['status'],
+        'format': job['format'],
+        'total': job['total'],
+        'processed': job['processed'],
+        'progress': round(job['processed'] / job['total'] * 100, 1) if job['total'] else 100.0,
+        'cached': job['cached'],
+        'error': job['error'],
+        'createdAt': datetime.utcfromtimestamp(job['created_at']).isoformat(),
+        'finishedAt': datetime.utcfromtimestamp(job['finished_at']).isoformat() if job['finished_at'] else None,
+        'downloadUrl': url_for('download_export_job', job_id=job['id']) if job['status'] == 'finished' else None,
+    }
+
+def _filtered_export_rows(job, filters, fields):
+    """Yield export rows for the reports the filters match, recording progress after each batch"""
+    query, _ = report_export_query(filters, columns=[getattr(Report, field) for field in fields])
+    processed = 0
+    for processed, row in enumerate(query, 1):
+        yield row
+        if processed % REPORT_EXPORT_BATCH_SIZE == 0:
+            job['processed'] = processed
+            save_export_job(job)
+    job['processed'] = processed
+    save_export_job(job)
+
+def _export_job_rows(job, report_ids, fields):
+    """Yield export rows for report_ids in the given order, fetching one batch at a time"""
+    columns = [getattr(Report, field) for field in fields]
+    id_position = fields.index('id')
+    for start in range(0, len(report_ids), REPORT_EXPORT_BATCH_SIZE):
+        batch = report_ids[start:start + REPORT_EXPORT_BATCH_SIZE]
+        rows = {row[id_position]: row for row in db.session.query(*columns).filter(Report.id.in_(batch))}
+        for report_id in batch:
+            if report_id in rows:
+                yield rows[report_id]
+        job['processed'] = start + len(batch)
+        save_export_job(job)
+
+def run_export_job(job, fields, report_ids=None, filters=None):
+    """Worker body: write the export to a temporary file and move it into the cache"""
+    partial_path = job['path'] + f".{job['id']}.part"
+    job['status'] = 'running'
+    save_export_job(job)
+    try:
+        with app.app_context():
+            if report_ids is not None:
+                rows = _export_job_rows(job, report_ids, fields)
+            else:
+                rows = _filtered_export_rows(job, filters, fields)
+            if job['format'] == 'csv':
+                with open(partial_path, 'w', newline='', encoding='utf-8') as output:
+                    for chunk in csv_export_chunks(rows, fields):
+                        output.write(chunk)
+            else:
+                with open(partial_path, 'wb') as output:
+                    write_xlsx_export(rows, fields, output)
+        os.replace(partial_path, job['path'])
+        job['status'] = 'finished'
+    except Exception as e:
+        job['status'] = 'failed'
+        job['error'] = str(e)
+        app.logger.error(f"Export job {job['id']} failed: {e}")
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    finally:
+        job['finished_at'] = time.time()
+        save_export_job(job)
+    evict_export_cache()
+
+@app.route('/api/exports', methods=['POST'])
+@login_required
+@approved_required
+def create_export_job():
+    """Queue an export of reports, chosen by report_ids or by filters, as csv or xlsx.
+
+    The body may also carry fields (as for GET /api/reports). When an
+    identical export of the same report versions is already cached the job
+    is returned finished straight away.
+    """
+    data = request.get_json() or {}
+    export_format = data.get('format', 'xlsx')
+    if export_format not in REPORT_EXPORT_MIMETYPES:
+        return jsonify({'error': f"Unsupported export format: {export_format}"}), 400
+
+    filters = data.get('filters') or {}
+    if not isinstance(filters, dict):
+        return jsonify({'error': 'filters must be an object'}), 400
+    args = dict(filters, fields=data.get('fields'))
+    query, fields = report_export_query(args, columns=[Report.id])
+    if query is None:
+        return jsonify({'error': 'Invalid fields parameter'}), 400
+    if 'id' not in fields:
+        fields = ['id'] + fields
+
+    if data.get('report_ids') is not None:
+        try:
+            requested_ids = list(dict.fromkeys(int(report_id) for report_id in data['report_ids']))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'report_ids must be a list of integers'}), 400
+        existing = set()
+        for start in range(0, len(requested_ids), REPORT_EXPORT_BATCH_SIZE):
+            batch = requested_ids[start:start + REPORT_EXPORT_BATCH_SIZE]
+            existing.update(report_id for report_id, in db.session.query(Report.id).filter(Report.id.in_(batch)))
+        report_ids = [report_id for report_id in requested_ids if report_id in existing]
+        job = start_export_job(export_format, fields, len(report_ids), export_cache_key(export_format, fields, report_ids), report_ids=report_ids)
+    else:
+        filters = export_filters(filters)
+        job = start_export_job(export_format, fields, count_export_reports(filters), export_cache_key(export_format, fields, filters), filters=filters)
+    return jsonify(export_job_dict(job)), 202
+
+def start_export_job(export_format, fields, total, cache_key, report_ids=None, filters=None):
+    """Queue an export of `total` reports, given as report_ids in order or as filters, and return the job.
+
+    When an export with the same cache_key is already cached the job is
+    returned finished straight away.
+    """
+    now = time.time()
+    job = {
+        'id': uuid.uuid4().hex,
+        'user_id': current_user.id,
+        'status': 'queued',
+        'format': export_format,
+        'path': export_cache_path(cache_key, export_format),
+        'total': total,
+        'processed': 0,
+        'cached': False,
+        'error': None,
+        'created_at': now,
+        'finished_at': None,
+    }
+    if os.path.exists(job['path']):
+        os.utime(job['path'])
+        job.update(status='finished', processed=job['total'], cached=True, finished_at=now)
+
+    save_export_job(job)
+    if not job['cached']:
+        with _export_jobs_lock:
+            export_jobs[job['id']] = job
+        get_export_executor().submit(run_export_job, job, fields, report_ids=report_ids, filters=filters)
+    return job
+
+def get_export_job_or_404(job_id):
+    """Look up an export job visible to the current user, whichever process runs it"""
+    job = load_export_job(job_id)
+    if job is None or (job['user_id'] != current_user.id and current_user.role != 'admin'):
+        abort(404)
+    return job
+
+@app.route('/api/exports/<job_id>', methods=['GET'])
+@login_required
+@approved_required
+def get_export_job(job_id):
+    """Report the status and progress of an export job"""
+    return jsonify(export_job_dict(get_export_job_or_404(job_id)))
+
+@app.route('/api/exports/<job_id>/download', methods=['GET'])
+@login_required
+@approved_required
+def download_export_job(job_id):
+    """Download the file produced by a finished export job"""
+    job = get_export_job_or_404(job_id)
+    if job['status'] != 'finished':
+        return jsonify({'error': f"Export is {job['status']}"}), 409
+    try:
+        os.utime(job['path'])  # Recently downloaded files are evicted last
+        output = open(job['path'], 'rb')
+    except OSError:
+        return jsonify({'error': 'Export file has expired'}), 410
+    return Response(stream_file(output), mimetype=REPORT_EXPORT_MIMETYPES[job['format']], headers={
+        'Content-Disposition': f'attachment; filename="{export_filename(job["format"])}"'
+    })
+
+# --- Report Search ---
+class LikeReportSearch:
+    """Portable report search using case-insensitive substring matches (full scan)"""
+    name = 'like'
+
+    def install(self):
+        return False
+
+    def rebuild(self):
+        return 0
+
+    def apply(self, query, term):
+        """Filter query to reports matching term; returns (query, ranking order or None)"""
+        search_term = f"%{term}%"
+        return query.filter(
+            db.or_(
+                Report.portfolioName.ilike(search_term),
+                Report.projectName.ilike(search_term),
+                db.cast(Report.sprintNumber, db.String).ilike(search_term),
+                Report.reportVersion.ilike(search_term),
+                Report.reportName.ilike(search_term),
+                Report.releaseNumber.ilike(search_term),
+                Report.testSummary.ilike(search_term),
+                Report.qa_notes.any(db.or_(ReportQaNote.note.ilike(search_term), ReportQaNote.extra.ilike(search_term)))
+            )
+        ), None
+
+class Fts5ReportSearch:
+    """SQLite FTS5 index over report text, kept in sync by triggers on the report and QA note tables"""
+    name = 'fts5'
+
+    # Indexed columns and their bm25 weights (names and scope rank above free text)
+    COLUMNS = [
+        ('reportName', 5.0),
+        ('portfolioName', 3.0),
+        ('projectName', 3.0),
+        ('sprintNumber', 2.0),
+        ('reportVersion', 2.0),
+        ('releaseNumber', 2.0),
+        ('testSummary', 1.0),
+        ('qaNotes', 1.0),
+    ]
+    # Plain text of a report's QA notes ({"note": ...} objects or bare strings kept in extra)
+    QA_NOTES_SQL = (
+        "(SELECT group_concat(text, ' ') FROM (SELECT coalesce(note, CASE WHEN json_valid(extra) THEN "
+        "CASE json_type(extra) WHEN 'text' THEN json_extract(extra, '$') END END) AS text "
+        "FROM report_qa_note WHERE report_id = {report_id} ORDER BY position))"
+    )
+
+    def _values_sql(self, row):
+        values = [f'{row}.{column}' for column, _ in self.COLUMNS[:-1]]
+        values.append(self.QA_NOTES_SQL.format(report_id=f'{row}.id'))
+        return ', '.join(values)
+
+    def install(self):
+        """Create the FTS table and sync triggers; returns True if the table is new"""
+        columns = ', '.join(column for column, _ in self.COLUMNS)
+        created = not db.session.execute(db.text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'report_search'"
+        )).first()
+        statements = [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS report_search USING fts5({columns}, prefix='2 3')",
+            f"""CREATE TRIGGER IF NOT EXISTS report_search_ai AFTER INSERT ON report BEGIN
+                INSERT INTO report_search(rowid, {columns}) VALUES (new.id, {self._values_sql('new')});
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS report_search_ad AFTER DELETE ON report BEGIN
+                DELETE FROM report_search WHERE rowid = old.id;
+            END""",
+            f"""CREATE TRIGGER IF NOT EXISTS report_search_au AFTER UPDATE ON report BEGIN
+                DELETE FROM report_search WHERE rowid = old.id;
+                INSERT INTO report_search(rowid, {columns}) VALUES (new.id, {self._values_sql('new')});
+            END""",
+        ]
+        # QA notes are saved after their report, so re-index the report's notes when they change
+        for trigger, event_name, row in (('ai', 'INSERT', 'new'), ('ad', 'DELETE', 'old'), ('au', 'UPDATE', 'new')):
+            statements.append(f"""CREATE TRIGGER IF NOT EXISTS report_search_qa_note_{trigger} AFTER {event_name} ON report_qa_note BEGIN
+                UPDATE report_search SET qaNotes = {self.QA_NOTES_SQL.format(report_id=f'{row}.report_id')}
+                WHERE rowid = {row}.report_id;
+            END""")
+        for statement in statements:
+            db.session.execute(db.text(statement))
+        db.session.commit()
+        return created
+
+    def rebuild(self):
+        """Repopulate the FTS table from the report table; returns the rows indexed"""
+        columns = ', '.join(column for column, _ in self.COLUMNS)
+        db.session.execute(db.text("DELETE FROM report_search"))
+        result = db.session.execute(db.text(
+            f"INSERT INTO report_search(rowid, {columns}) SELECT report.id, {self._values_sql('report')} FROM report"
+        ))
+        db.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def match_expression(term):
+        """Turn user input into an FTS5 query that prefix-matches every whitespace-separated term.
+
+        The tokenizer splits on punctuation, so each term becomes a phrase of
+        its words: "portfolio-00" must match those words next to each other,
+        as the LIKE backend requires, not anywhere in the report.
+        """
+        phrases = [' '.join(re.findall(r'\w+', chunk)) for chunk in term.split()]
+        return ' '.join(f'"{phrase}"*' for phrase in phrases if phrase)
+
+    def apply(self, query, term):
+        """Filter query to reports matching term; returns (query, ranking order or None)"""
+        match = self.match_expression(term)
+        if not match:
+            # Nothing searchable (only punctuation) matches no report
+            return query.filter(db.false()), None
+        weights = ', '.join(str(weight) for _, weight in self.COLUMNS)
+        hits = db.text(
+            f"SELECT rowid AS report_id, bm25(report_search, {weights}) AS rank "
+            "FROM report_search WHERE report_search MATCH :match"
+        ).bindparams(match=match).columns(report_id=db.Integer, rank=db.Float).subquery('report_search_hits')
+        return query.join(hits, Report.id == hits.c.report_id), hits.c.rank
+
+_report_search = None
+
+def get_report_search():
+    """Return the configured report search backend.
+
+    REPORT_SEARCH_BACKEND may be 'fts5', 'like' or 'auto' (FTS5 on SQLite once
+    its index exists, LIKE otherwise).
+    """
+    global _report_search
+    if _report_search is None:
+        backend = app.config['REPORT_SEARCH_BACKEND']
+        if backend == 'auto':
+            backend = 'like'
+            if db.engine.dialect.name == 'sqlite' and db.session.execute(db.text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'report_search'"
+            )).first():
+                backend = 'fts5'
+        _report_search = Fts5ReportSearch() if backend == 'fts5' else LikeReportSearch()
+    return _report_search
+
+def install_report_search():
+    """Create the FTS5 search index on SQLite and populate it the first time"""
+    global _report_search
+    if app.config['REPORT_SEARCH_BACKEND'] == 'like' or db.engine.dialect.name != 'sqlite':
+        return
+    search = Fts5ReportSearch()
+    try:
+        if search.install():
+            app.logger.info(f"Indexed {search.rebuild()} reports for full-text search")
+    except Exception as e:
+        db.session.rollback()
+        app.logger.warning(f"Full-text search unavailable, using LIKE search: {e}")
+        return
+    _report_search = search
+
+@app.cli.command('rebuild-search-index')
+def rebuild_search_index_command():
+    """Rebuild the full-text report search index."""
+    create_app()
+    install_report_search()
+    search = get_report_search()
+    if search.name != 'fts5':
+        raise click.ClickException('Full-text search is not enabled for this database')
+    click.echo(f"Indexed {search.rebuild()} reports for full-text search")
+
+@app.route('/api/reports/<int:report_id>', methods=['GET'])
+@login_required
+@approved_required
+@conditional_on_data_version
+def get_report(report_id):
+    """Fetches a specific report by ID."""
+    report = Report.query.get_or_404(report_id)
+    return jsonify(report.to_dict())
+
+@app.route('/api/dashboard/stats', methods=['GET'])
+@login_required
+@approved_required
+@conditional_on_data_version
+def get_dashboard_stats():
+    """Get dashboard statistics for all projects and individual projects."""
+    # Read the delta-maintained rollup tables instead of aggregating the report table
+    dashboard_stats = get_dashboard_rollup()
+    project_stats = ProjectStats.query.order_by(ProjectStats.portfolio_name, ProjectStats.project_name).all()
     
-    latest_statuses = db.session.query(
-        latest_reports_subquery.c.portfolioName,
-        latest_reports_subquery.c.projectName,
-        latest_reports_subquery.c.testingStatus
-    ).filter(latest_reports_subquery.c.rn == 1).all()
-    
-    # Create projects dictionary with optimized data
-    projects = {}
-    for stat in project_stats:
-        project_key = f"{stat.portfolioName}_{stat.projectName}"
-        projects[project_key] = {
-            'portfolioName': stat.portfolioName,
-            'projectName': stat.projectName,
-            'totalReports': stat.totalReports or 0,
-            'totalUserStories': stat.totalUserStories or 0,
-            'totalTestCases': stat.totalTestCases or 0,
-            'totalIssues': stat.totalIssues or 0,
-            'totalEnhancements': stat.totalEnhancements or 0,
-            'lastReportDate': stat.lastReportDate,
-            'testingStatus': 'pending'  # Will be updated below
-        }
+    overall = {
+        'totalReports': dashboard_stats.total_reports or 0,
+        'completedReports': dashboard_stats.completed_reports or 0,
+        'inProgressReports': dashboard_stats.in_progress_reports or 0,
+        'pendingReports': dashboard_stats.pending_reports or 0,
+    }
+    overall.update(dashboard_stats.metrics_dict())
+    overall['totalAutomationTestCases'] = overall.pop('automationTotalTestCases')
     
-    # Update with latest testing statuses
-    for status in latest_statuses:
-        project_key = f"{status.portfolioName}_{status.projectName}"
-        if project_key in projects:
-            projects[project_key]['testingStatus'] = status.testingStatus
+    projects = [{
+        'portfolioName': stat.portfolio_name,
+        'projectName': stat.project_name,
+        'totalReports': stat.total_reports or 0,
+        'totalUserStories': stat.total_user_stories or 0,
+        'totalTestCases': stat.total_test_cases or 0,
+        'totalIssues': stat.total_issues or 0,
+        'totalEnhancements': stat.total_enhancements or 0,
+        'lastReportDate': stat.last_report_date,
+        'testingStatus': stat.latest_testing_status
+    } for stat in project_stats]
     
     return jsonify({
-        'overall': {
-            'totalReports': total_reports,
-            'completedReports': completed_reports,
-            'inProgressReports': in_progress_reports,
-            'pendingReports': pending_reports,
-            'totalUserStories': aggregate_result.total_user_stories or 0,
-            'passedUserStories': aggregate_result.passed_user_stories or 0,
-            'passedWithIssuesUserStories': aggregate_result.passed_with_issues_user_stories or 0,
-            'failedUserStories': aggregate_result.failed_user_stories or 0,
-            'blockedUserStories': aggregate_result.blocked_user_stories or 0,
-            'cancelledUserStories': aggregate_result.cancelled_user_stories or 0,
-            'deferredUserStories': aggregate_result.deferred_user_stories or 0,
-            'notTestableUserStories': aggregate_result.not_testable_user_stories or 0,
-            'totalTestCases': aggregate_result.total_test_cases or 0,
-            'passedTestCases': aggregate_result.passed_test_cases or 0,
-            'passedWithIssuesTestCases': aggregate_result.passed_with_issues_test_cases or 0,
-            'failedTestCases': aggregate_result.failed_test_cases or 0,
-            'blockedTestCases': aggregate_result.blocked_test_cases or 0,
-            'cancelledTestCases': aggregate_result.cancelled_test_cases or 0,
-            'deferredTestCases': aggregate_result.deferred_test_cases or 0,
-            'notTestableTestCases': aggregate_result.not_testable_test_cases or 0,
-            'totalIssues': aggregate_result.total_issues or 0,
-            'criticalIssues': aggregate_result.critical_issues or 0,
-            'highIssues': aggregate_result.high_issues or 0,
-            'mediumIssues': aggregate_result.medium_issues or 0,
-            'lowIssues': aggregate_result.low_issues or 0,
-            'newIssues': aggregate_result.new_issues or 0,
-            'fixedIssues': aggregate_result.fixed_issues or 0,
-            'notFixedIssues': aggregate_result.not_fixed_issues or 0,
-            'reopenedIssues': aggregate_result.reopened_issues or 0,
-            'deferredIssues': aggregate_result.deferred_issues or 0,
-            'totalEnhancements': aggregate_result.total_enhancements or 0,
-            'newEnhancements': aggregate_result.new_enhancements or 0,
-            'implementedEnhancements': aggregate_result.implemented_enhancements or 0,
-            'existsEnhancements': aggregate_result.exists_enhancements or 0,
-            'totalAutomationTestCases': aggregate_result.total_automation_test_cases or 0,
-            'automationPassedTestCases': aggregate_result.automation_passed_test_cases or 0,
-            'automationFailedTestCases': aggregate_result.automation_failed_test_cases or 0,
-            'automationSkippedTestCases': aggregate_result.automation_skipped_test_cases or 0,
-            'automationStableTests': aggregate_result.automation_stable_tests or 0,
-            'automationFlakyTests': aggregate_result.automation_flaky_tests or 0,
-        },
-        'projects': list(projects.values())
+        'overall': overall,
+        'projects': projects
     })
 
+def report_from_data(data, link_maps=None):
+    """Validate a report payload and build an unsaved Report with its totals and links.
+
+    Raises ValueError when a required field is missing or a number is invalid.
+    """
+    # Validate required fields
+    required_fields = ['portfolioName', 'projectName', 'sprintNumber']
+    for field in required_fields:
+        if not data.get(field):
+            raise ValueError(f'Missing required field: {field}')
+    
+    new_report = Report(
+        portfolioName=data.get('portfolioName'),
+        projectName=data.get('projectName'),
+        sprintNumber=int(data.get('sprintNumber') or 0),
+        reportVersion=data.get('reportVersion'),
+        reportName=data.get('reportName'), # New field
+        cycleNumber=int(data.get('cycleNumber') or 0),
+        releaseNumber=data.get('releaseNumber'), # Add releaseNumber field
+        reportDate=data.get('reportDate'),
+        testSummary=data.get('testSummary'),
+        testingStatus=data.get('testingStatus'),
+        
+        # User Stories
+        passedUserStories=int(data.get('passedUserStories') or 0),
+        passedWithIssuesUserStories=int(data.get('passedWithIssuesUserStories') or 0),
+        failedUserStories=int(data.get('failedUserStories') or 0),
+        blockedUserStories=int(data.get('blockedUserStories') or 0),
+        cancelledUserStories=int(data.get('cancelledUserStories') or 0),
+        deferredUserStories=int(data.get('deferredUserStories') or 0),
+        notTestableUserStories=int(data.get('notTestableUserStories') or 0),
+        
+        # Test Cases
+        passedTestCases=int(data.get('passedTestCases') or 0),
+        passedWithIssuesTestCases=int(data.get('passedWithIssuesTestCases') or 0),
+        failedTestCases=int(data.get('failedTestCases') or 0),
+        blockedTestCases=int(data.get('blockedTestCases') or 0),
+        cancelledTestCases=int(data.get('cancelledTestCases') or 0),
+        deferredTestCases=int(data.get('deferredTestCases') or 0),
+        notTestableTestCases=int(data.get('notTestableTestCases') or 0),
+        
+        # Issues
+        criticalIssues=int(data.get('criticalIssues') or 0),
+        highIssues=int(data.get('highIssues') or 0),
+        mediumIssues=int(data.get('mediumIssues') or 0),
+        lowIssues=int(data.get('lowIssues') or 0),
+        newIssues=int(data.get('newIssues') or 0),
+        fixedIssues=int(data.get('fixedIssues') or 0),
+        notFixedIssues=int(data.get('notFixedIssues') or 0),
+        reopenedIssues=int(data.get('reopenedIssues') or 0),
+        deferredIssues=int(data.get('deferredIssues') or 0),
+        
+        # Enhancements
+        newEnhancements=int(data.get('newEnhancements') or 0),
+        implementedEnhancements=int(data.get('implementedEnhancements') or 0),
+        existsEnhancements=int(data.get('existsEnhancements') or 0),
+        
+        # Other metrics
+        qaNoteFieldsData=dump_json_blob(data.get('qaNoteFieldsData', [])),
+        
+        # Automation Regression Data
+        automationPassedTestCases=int(data.get('automationPassedTestCases') or 0),
+        automationFailedTestCases=int(data.get('automationFailedTestCases') or 0),
+        automationSkippedTestCases=int(data.get('automationSkippedTestCases') or 0),
+        automationStableTests=int(data.get('automationStableTests') or 0),
+        automationFlakyTests=int(data.get('automationFlakyTests') or 0),
+        
+    )
+    
+    # Dynamic data
+    for field in REPORT_LIST_FIELDS:
+        new_report.set_list_field(field, data.get(field, []))
+    
+    # Calculate totals and scores
+    new_report.calculate_totals()
+    link_report(new_report, link_maps)
+    return new_report
+
 @app.route('/api/reports', methods=['POST'])
 @login_required
 @approved_required
@@ -898,90 +2889,159 @@ def create_report():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Validate required fields
-        required_fields = ['portfolioName', 'projectName', 'sprintNumber']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'error': f'Missing required field: {field}'}), 400
-        
-        new_report = Report(
-            portfolioName=data.get('portfolioName'),
-            projectName=data.get('projectName'),
-            sprintNumber=int(data.get('sprintNumber') or 0),
-            reportVersion=data.get('reportVersion'),
-            reportName=data.get('reportName'), # New field
-            cycleNumber=int(data.get('cycleNumber') or 0),
-            releaseNumber=data.get('releaseNumber'), # Add releaseNumber field
-            reportDate=data.get('reportDate'),
-            testSummary=data.get('testSummary'),
-            testingStatus=data.get('testingStatus'),
-            
-            # Dynamic data
-            requestData=json.dumps(data.get('requestData', [])),
-            buildData=json.dumps(data.get('buildData', [])),
-            testerData=json.dumps(data.get('testerData', [])),
-            teamMemberData=json.dumps(data.get('teamMemberData', [])), # New field
-            
-            # User Stories
-            passedUserStories=int(data.get('passedUserStories') or 0),
-            passedWithIssuesUserStories=int(data.get('passedWithIssuesUserStories') or 0),
-            failedUserStories=int(data.get('failedUserStories') or 0),
-            blockedUserStories=int(data.get('blockedUserStories') or 0),
-            cancelledUserStories=int(data.get('cancelledUserStories') or 0),
-            deferredUserStories=int(data.get('deferredUserStories') or 0),
-            notTestableUserStories=int(data.get('notTestableUserStories') or 0),
-            
-            # Test Cases
-            passedTestCases=int(data.get('passedTestCases') or 0),
-            passedWithIssuesTestCases=int(data.get('passedWithIssuesTestCases') or 0),
-            failedTestCases=int(data.get('failedTestCases') or 0),
-            blockedTestCases=int(data.get('blockedTestCases') or 0),
-            cancelledTestCases=int(data.get('cancelledTestCases') or 0),
-            deferredTestCases=int(data.get('deferredTestCases') or 0),
-            notTestableTestCases=int(data.get('notTestableTestCases') or 0),
-            
-            # Issues
-            criticalIssues=int(data.get('criticalIssues') or 0),
-            highIssues=int(data.get('highIssues') or 0),
-            mediumIssues=int(data.get('mediumIssues') or 0),
-            lowIssues=int(data.get('lowIssues') or 0),
-            newIssues=int(data.get('newIssues') or 0),
-            fixedIssues=int(data.get('fixedIssues') or 0),
-            notFixedIssues=int(data.get('notFixedIssues') or 0),
-            reopenedIssues=int(data.get('reopenedIssues') or 0),
-            deferredIssues=int(data.get('deferredIssues') or 0),
-            
-            # Enhancements
-            newEnhancements=int(data.get('newEnhancements') or 0),
-            implementedEnhancements=int(data.get('implementedEnhancements') or 0),
-            existsEnhancements=int(data.get('existsEnhancements') or 0),
-            
-            # Other metrics
-            qaNotesData=json.dumps(data.get('qaNotesData', [])),
-            qaNoteFieldsData=json.dumps(data.get('qaNoteFieldsData', [])),
-            
-            # Automation Regression Data
-            automationPassedTestCases=int(data.get('automationPassedTestCases') or 0),
-            automationFailedTestCases=int(data.get('automationFailedTestCases') or 0),
-            automationSkippedTestCases=int(data.get('automationSkippedTestCases') or 0),
-            automationStableTests=int(data.get('automationStableTests') or 0),
-            automationFlakyTests=int(data.get('automationFlakyTests') or 0),
-            
-        )
-        
-        # Calculate totals and scores
-        new_report.calculate_totals()
+        new_report = report_from_data(data)
         
         db.session.add(new_report)
+        apply_report_rollup(new_snapshot=report_rollup_snapshot(new_report))
         db.session.commit()
         
         return jsonify(new_report.to_dict()), 201
         
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
-        print(f"Error creating report: {str(e)}")
+        app.logger.error(f"Error creating report: {str(e)}")
         return jsonify({'error': f'Failed to create report: {str(e)}'}), 500
 
+# Reports inserted per transaction by the bulk endpoint
+REPORT_BULK_CHUNK_SIZE = 500
+
+def report_insert_values(report, now):
+    """Column values for inserting a built Report with a bulk INSERT"""
+    values = {}
+    for column in Report.__table__.columns:
+        if column.key == 'id':
+            continue
+        value = getattr(report, column.key)
+        if value is None and column.default is not None and column.default.is_scalar:
+            value = column.default.arg
+        values[column.key] = value
+    values['createdAt'] = values['updatedAt'] = now
+    return values
+
+class BulkBatchTooLarge(ValueError):
+    """The bulk request holds more reports than REPORT_BULK_MAX_REPORTS"""
+
+def bulk_report_payloads():
+    """Yield (index, payload) for each report in the request body.
+
+    Accepts a JSON array, or NDJSON (application/x-ndjson) read line by line
+    from the request stream. Payloads that cannot be decoded are yielded as
+    ValueError instances. Raises BulkBatchTooLarge past REPORT_BULK_MAX_REPORTS
+    reports: before any is yielded for an array, at the first extra line for NDJSON.
+    """
+    max_reports = app.config['REPORT_BULK_MAX_REPORTS']
+    if request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+        index = 0
+        for line in request.stream:
+            if not line.strip():
+                continue
+            if index >= max_reports:
+                raise BulkBatchTooLarge(f'At most {max_reports} reports can be created per request')
+            try:
+                yield index, json.loads(line)
+            except ValueError as e:
+                yield index, ValueError(f'Invalid JSON: {e}')
+            index += 1
+        return
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        raise ValueError('Expected a JSON array of reports or an NDJSON body')
+    if len(data) > max_reports:
+        raise BulkBatchTooLarge(f'At most {max_reports} reports can be created per request')
+    yield from enumerate(data)
+
+def insert_reports(reports):
+    """Insert built reports and their list entries with bulk INSERTs; returns the new report ids"""
+    from sqlalchemy import insert
+
+    now = datetime.utcnow()
+    report_ids = db.session.execute(
+        insert(Report).returning(Report.id, sort_by_parameter_order=True),
+        [report_insert_values(report, now) for report in reports]
+    ).scalars().all()
+    for field, relationship in REPORT_LIST_FIELDS.items():
+        rows = [
+            dict(row.item_values(), report_id=report_id)
+            for report, report_id in zip(reports, report_ids)
+            for row in getattr(report, relationship)
+        ]
+        if rows:
+            db.session.execute(insert(report_list_model(field)), rows)
+    return report_ids
+
+def _insert_report_chunk(chunk, results):
+    """Insert one chunk of built reports and their rollup deltas in a single transaction"""
+    try:
+        inserted = insert_reports([report for _, report in chunk])
+        apply_report_rollups([(None, report_rollup_snapshot(report)) for _, report in chunk])
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"Error creating reports in bulk: {e}")
+        for index, _ in chunk:
+            results.append({'index': index, 'error': f'Failed to create report: {e}'})
+        return
+    for (index, _), report_id in zip(chunk, inserted):
+        results.append({'index': index, 'id': report_id})
+
+@app.route('/api/reports/bulk', methods=['POST'])
+@login_required
+@approved_required
+def create_reports_bulk():
+    """Create many reports from a JSON array or an NDJSON body.
+
+    Each report is validated like POST /api/reports. Valid reports are
+    inserted REPORT_BULK_CHUNK_SIZE at a time, one transaction per chunk, so
+    a failing chunk does not undo earlier ones. Returns one result per input
+    row, holding either the new report id or an error.
+
+    Bodies may be up to REPORT_BULK_MAX_BYTES and hold up to
+    REPORT_BULK_MAX_REPORTS reports; larger ones get a 413. An NDJSON body
+    that runs past the report limit keeps the reports before it, which are
+    listed in the 413 response.
+    """
+    request.max_content_length = app.config['REPORT_BULK_MAX_BYTES']
+    link_maps = build_report_link_maps()
+    results = []
+    chunk = []
+    try:
+        for index, payload in bulk_report_payloads():
+            try:
+                if isinstance(payload, ValueError):
+                    raise payload
+                if not isinstance(payload, dict) or not payload:
+                    raise ValueError('No data provided')
+                chunk.append((index, report_from_data(payload, link_maps)))
+            except (TypeError, ValueError) as e:
+                results.append({'index': index, 'error': str(e)})
+                continue
+            if len(chunk) >= REPORT_BULK_CHUNK_SIZE:
+                _insert_report_chunk(chunk, results)
+                chunk = []
+    except BulkBatchTooLarge as e:
+        if chunk:
+            _insert_report_chunk(chunk, results)
+        results.sort(key=lambda result: result['index'])
+        return jsonify({'error': str(e), 'results': results}), 413
+    except RequestEntityTooLarge:
+        return jsonify({'error': f"Request body exceeds {app.config['REPORT_BULK_MAX_BYTES']} bytes; split the reports into smaller batches"}), 413
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if chunk:
+        _insert_report_chunk(chunk, results)
+
+    results.sort(key=lambda result: result['index'])
+    created = sum(1 for result in results if 'id' in result)
+    return jsonify({
+        'created': created,
+        'failed': len(results) - created,
+        'results': results
+    }), 201 if created else 400
+
+
 class Portfolio(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False, unique=True)
@@ -1084,45 +3144,130 @@ class TeamMember(db.Model):
             raise ValueError(f"Invalid role: {self.role}")
 
 # --- Statistical Cache Models ---
-class DashboardStats(db.Model):
-    """Cache for overall dashboard statistics"""
+# Report counters that are rolled up into the stats tables, as
+# (Report attribute, rollup column) pairs.
+REPORT_ROLLUP_FIELDS = [
+    ('totalUserStories', 'total_user_stories'),
+    ('passedUserStories', 'passed_user_stories'),
+    ('passedWithIssuesUserStories', 'passed_with_issues_user_stories'),
+    ('failedUserStories', 'failed_user_stories'),
+    ('blockedUserStories', 'blocked_user_stories'),
+    ('cancelledUserStories', 'cancelled_user_stories'),
+    ('deferredUserStories', 'deferred_user_stories'),
+    ('notTestableUserStories', 'not_testable_user_stories'),
+    ('totalTestCases', 'total_test_cases'),
+    ('passedTestCases', 'passed_test_cases'),
+    ('passedWithIssuesTestCases', 'passed_with_issues_test_cases'),
+    ('failedTestCases', 'failed_test_cases'),
+    ('blockedTestCases', 'blocked_test_cases'),
+    ('cancelledTestCases', 'cancelled_test_cases'),
+    ('deferredTestCases', 'deferred_test_cases'),
+    ('notTestableTestCases', 'not_testable_test_cases'),
+    ('totalIssues', 'total_issues'),
+    ('criticalIssues', 'critical_issues'),
+    ('highIssues', 'high_issues'),
+    ('mediumIssues', 'medium_issues'),
+    ('lowIssues', 'low_issues'),
+    ('newIssues', 'new_issues'),
+    ('fixedIssues', 'fixed_issues'),
+    ('notFixedIssues', 'not_fixed_issues'),
+    ('reopenedIssues', 'reopened_issues'),
+    ('deferredIssues', 'deferred_issues'),
+    ('totalEnhancements', 'total_enhancements'),
+    ('newEnhancements', 'new_enhancements'),
+    ('implementedEnhancements', 'implemented_enhancements'),
+    ('existsEnhancements', 'exists_enhancements'),
+    ('automationTotalTestCases', 'automation_total_test_cases'),
+    ('automationPassedTestCases', 'automation_passed_test_cases'),
+    ('automationFailedTestCases', 'automation_failed_test_cases'),
+    ('automationSkippedTestCases', 'automation_skipped_test_cases'),
+    ('automationStableTests', 'automation_stable_tests'),
+    ('automationFlakyTests', 'automation_flaky_tests'),
+]
+
+# Report status counters that only the overall DashboardStats row tracks
+DASHBOARD_STATUS_COUNTERS = ('completed_reports', 'in_progress_reports', 'pending_reports')
+
+class ReportMetricsMixin:
+    """Summed report counters shared by the stats tables"""
+    # User Stories
+    total_user_stories = db.Column(db.Integer, default=0)
+    passed_user_stories = db.Column(db.Integer, default=0)
+    passed_with_issues_user_stories = db.Column(db.Integer, default=0)
+    failed_user_stories = db.Column(db.Integer, default=0)
+    blocked_user_stories = db.Column(db.Integer, default=0)
+    cancelled_user_stories = db.Column(db.Integer, default=0)
+    deferred_user_stories = db.Column(db.Integer, default=0)
+    not_testable_user_stories = db.Column(db.Integer, default=0)
+    
+    # Test Cases
+    total_test_cases = db.Column(db.Integer, default=0)
+    passed_test_cases = db.Column(db.Integer, default=0)
+    passed_with_issues_test_cases = db.Column(db.Integer, default=0)
+    failed_test_cases = db.Column(db.Integer, default=0)
+    blocked_test_cases = db.Column(db.Integer, default=0)
+    cancelled_test_cases = db.Column(db.Integer, default=0)
+    deferred_test_cases = db.Column(db.Integer, default=0)
+    not_testable_test_cases = db.Column(db.Integer, default=0)
+    
+    # Issues
+    total_issues = db.Column(db.Integer, default=0)
+    critical_issues = db.Column(db.Integer, default=0)
+    high_issues = db.Column(db.Integer, default=0)
+    medium_issues = db.Column(db.Integer, default=0)
+    low_issues = db.Column(db.Integer, default=0)
+    new_issues = db.Column(db.Integer, default=0)
+    fixed_issues = db.Column(db.Integer, default=0)
+    not_fixed_issues = db.Column(db.Integer, default=0)
+    reopened_issues = db.Column(db.Integer, default=0)
+    deferred_issues = db.Column(db.Integer, default=0)
+    
+    # Enhancements
+    total_enhancements = db.Column(db.Integer, default=0)
+    new_enhancements = db.Column(db.Integer, default=0)
+    implemented_enhancements = db.Column(db.Integer, default=0)
+    exists_enhancements = db.Column(db.Integer, default=0)
+    
+    # Automation Regression
+    automation_total_test_cases = db.Column(db.Integer, default=0)
+    automation_passed_test_cases = db.Column(db.Integer, default=0)
+    automation_failed_test_cases = db.Column(db.Integer, default=0)
+    automation_skipped_test_cases = db.Column(db.Integer, default=0)
+    automation_stable_tests = db.Column(db.Integer, default=0)
+    automation_flaky_tests = db.Column(db.Integer, default=0)
+
+    def metrics_dict(self):
+        """Return the summed counters keyed by their Report attribute name"""
+        return {attr: getattr(self, column) or 0 for attr, column in REPORT_ROLLUP_FIELDS}
+
+class DashboardStats(ReportMetricsMixin, db.Model):
+    """Rollup of overall dashboard statistics (single row)"""
     id = db.Column(db.Integer, primary_key=True)
     total_reports = db.Column(db.Integer, default=0)
     completed_reports = db.Column(db.Integer, default=0)
     in_progress_reports = db.Column(db.Integer, default=0)
     pending_reports = db.Column(db.Integer, default=0)
-    total_user_stories = db.Column(db.Integer, default=0)
-    total_test_cases = db.Column(db.Integer, default=0)
-    total_issues = db.Column(db.Integer, default=0)
-    total_enhancements = db.Column(db.Integer, default=0)
     last_updated = db.Column(db.DateTime, default=datetime.utcnow)
 
-class PortfolioStats(db.Model):
-    """Cache for portfolio-level statistics"""
+class PortfolioStats(ReportMetricsMixin, db.Model):
+    """Rollup of portfolio-level statistics, keyed by report portfolio name"""
     id = db.Column(db.Integer, primary_key=True)
-    portfolio_id = db.Column(db.Integer, db.ForeignKey('portfolio.id'), nullable=False)
-    portfolio_name = db.Column(db.String(100), nullable=False)
+    portfolio_id = db.Column(db.Integer, db.ForeignKey('portfolio.id'), nullable=True)
+    portfolio_name = db.Column(db.String(100), nullable=False, unique=True)
     total_reports = db.Column(db.Integer, default=0)
-    total_projects = db.Column(db.Integer, default=0)
-    total_user_stories = db.Column(db.Integer, default=0)
-    total_test_cases = db.Column(db.Integer, default=0)
-    total_issues = db.Column(db.Integer, default=0)
-    total_enhancements = db.Column(db.Integer, default=0)
+    total_projects = db.Column(db.Integer, default=0)  # Projects with at least one report
     last_report_date = db.Column(db.String(50))
     last_updated = db.Column(db.DateTime, default=datetime.utcnow)
 
-class ProjectStats(db.Model):
-    """Cache for project-level statistics"""
+class ProjectStats(ReportMetricsMixin, db.Model):
+    """Rollup of project-level statistics, keyed by report portfolio/project name"""
+    __table_args__ = (db.UniqueConstraint('portfolio_name', 'project_name'),)
     id = db.Column(db.Integer, primary_key=True)
-    project_id = db.Column(db.Integer, db.ForeignKey('project.id'), nullable=False)
-    portfolio_id = db.Column(db.Integer, db.ForeignKey('portfolio.id'), nullable=False)
+    project_id = db.Column(db.Integer, db.ForeignKey('project.id'), nullable=True)
+    portfolio_id = db.Column(db.Integer, db.ForeignKey('portfolio.id'), nullable=True)
     portfolio_name = db.Column(db.String(100), nullable=False)
     project_name = db.Column(db.String(100), nullable=False)
     total_reports = db.Column(db.Integer, default=0)
-    total_user_stories = db.Column(db.Integer, default=0)
-    total_test_cases = db.Column(db.Integer, default=0)
-    total_issues = db.Column(db.Integer, default=0)
-    total_enhancements = db.Column(db.Integer, default=0)
     last_report_date = db.Column(db.String(50))
     latest_testing_status = db.Column(db.String(50))
     last_updated = db.Column(db.DateTime, default=datetime.utcnow)
@@ -1142,6 +3287,8 @@ def manage_portfolios():
             
             portfolio = Portfolio(name=data['name'], description=data.get('description', ''))
             db.session.add(portfolio)
+            db.session.flush()
+            relink_reports(**portfolio_link_scope(portfolio))
             db.session.commit()
             return jsonify({'id': portfolio.id, 'name': portfolio.name, 'description': portfolio.description}), 201
         except Exception as e:
@@ -1150,9 +3297,10 @@ def manage_portfolios():
 
 # Projects API Routes
 @app.route('/api/projects', methods=['GET', 'POST'])
+@query_budget(GET=1)
 def manage_projects():
     if request.method == 'GET':
-        projects = Project.query.all()
+        projects = Project.query.options(joinedload(Project.portfolio)).all()
         return jsonify([{
             'id': p.id, 
             'name': p.name, 
@@ -1173,6 +3321,8 @@ def manage_projects():
                 portfolio_id=data.get('portfolio_id') if data.get('portfolio_id') else None
             )
             db.session.add(project)
+            db.session.flush()
+            relink_reports(**project_link_scope(project, project.portfolio_id))
             db.session.commit()
             return jsonify({
                 'id': project.id, 
@@ -1200,13 +3350,21 @@ def manage_project(project_id):
     
     elif request.method == 'PUT':
         data = request.get_json()
+        old_portfolio_id = project.portfolio_id
         project.name = data.get('name', project.name)
         project.description = data.get('description', project.description)
         project.portfolio_id = data.get('portfolio_id', project.portfolio_id)
+        db.session.flush()
+        relink_reports(**project_link_scope(project, old_portfolio_id))
         db.session.commit()
         return jsonify({'id': project.id, 'name': project.name})
     
     elif request.method == 'DELETE':
+        # Move reports and rollup rows off the project before deleting the row they reference
+        relink_reports(
+            **project_link_scope(project, project.portfolio_id),
+            link_maps=build_report_link_maps(skip_project_id=project.id)
+        )
         db.session.delete(project)
         db.session.commit()
         return jsonify({'message': 'Project deleted successfully'}), 200
@@ -1233,9 +3391,10 @@ def get_projects_without_portfolio():
 
 # Testers API Routes
 @app.route('/api/testers', methods=['GET', 'POST'])
+@query_budget(GET=2)
 def manage_testers():
     if request.method == 'GET':
-        testers = Tester.query.all()
+        testers = Tester.query.options(selectinload(Tester.projects)).all()
         return jsonify([{
             'id': t.id,
             'name': t.name,
@@ -1398,8 +3557,11 @@ def manage_tester(tester_id):
 
 # Tester-Project relationship endpoints
 @app.route('/api/testers/<int:tester_id>/projects', methods=['GET', 'POST'])
+@query_budget(GET=2, POST=6)
 def manage_tester_projects(tester_id):
-    tester = Tester.query.get_or_404(tester_id)
+    tester = Tester.query.options(
+        selectinload(Tester.projects).joinedload(Project.portfolio)
+    ).get_or_404(tester_id)
     
     if request.method == 'GET':
         return jsonify([{
@@ -1413,19 +3575,14 @@ def manage_tester_projects(tester_id):
         data = request.get_json()
         project_ids = data.get('project_ids', [])
         
-        # Clear existing relationships
-        tester.projects.clear()
-        
-        # Add new relationships
-        for project_id in project_ids:
-            project = Project.query.get(project_id)
-            if project:
-                tester.projects.append(project)
+        # Replace the assignments with the projects that exist, loaded in one query
+        tester.projects = Project.query.filter(Project.id.in_(project_ids)).all() if project_ids else []
         
         db.session.commit()
         return jsonify({'message': 'Tester projects updated successfully'}), 200
 
 @app.route('/api/projects/<int:project_id>/testers', methods=['GET'])
+@query_budget(GET=2)
 def get_project_testers(project_id):
     """Get all testers assigned to a specific project"""
     project = Project.query.get_or_404(project_id)
@@ -1552,6 +3709,8 @@ def manage_portfolio(portfolio_id):
         
         portfolio.name = data.get('name', portfolio.name)
         portfolio.description = data.get('description', portfolio.description)
+        db.session.flush()
+        relink_reports(**portfolio_link_scope(portfolio))
         db.session.commit()
         return jsonify({
             'id': portfolio.id,
@@ -1564,12 +3723,20 @@ def manage_portfolio(portfolio_id):
         if portfolio.projects:
             return jsonify({'error': 'Cannot delete portfolio with existing projects'}), 400
         
+        # Move reports and rollup rows off the portfolio before deleting the row they reference
+        relink_reports(
+            **portfolio_link_scope(portfolio),
+            link_maps=build_report_link_maps(skip_portfolio_id=portfolio.id)
+        )
         db.session.delete(portfolio)
         db.session.commit()
         return jsonify({'message': 'Portfolio deleted successfully'}), 200
 
 # Utility route to get all data for dropdowns
 @app.route('/api/form-data', methods=['GET'])
+@conditional_on_data_version
+@cached_response('portfolio', 'project', 'tester', 'team_member')
+@query_budget(GET=4)
 def get_form_data():
     """Get all data needed for form dropdowns"""
     portfolios = Portfolio.query.all()
@@ -1588,23 +3755,17 @@ def get_form_data():
 def get_latest_project_data(portfolio_name, project_name):
     """Get latest report data for a specific project to auto-populate new reports"""
     try:
-        print(f"DEBUG: Looking for reports with portfolio='{portfolio_name}', project='{project_name}'")
+        from sqlalchemy import func
         
-        # Get all reports for this project to find the highest values
-        all_reports = Report.query.filter_by(
+        project_reports = Report.query.filter_by(
             portfolioName=portfolio_name,
             projectName=project_name
-        ).all()
-        
-        print(f"DEBUG: Found {len(all_reports)} reports")
+        )
         
-        # Also check what reports exist in the database
-        all_existing_reports = Report.query.all()
-        print(f"DEBUG: Total reports in database: {len(all_existing_reports)}")
-        for report in all_existing_reports[:5]:  # Show first 5 reports
-            print(f"DEBUG: Report - Portfolio: '{report.portfolioName}', Project: '{report.projectName}'")
+        # The most recent report by ID supplies the carried-over values
+        latest_report = project_reports.order_by(Report.id.desc()).first()
         
-        if not all_reports:
+        if latest_report is None:
             # No previous reports - return default values
             from datetime import datetime
             today = datetime.now().strftime('%d-%m-%Y')
@@ -1628,19 +3789,16 @@ def get_latest_project_data(portfolio_name, project_name):
                 }
             })
         
-        # Get the latest report first (most recent by ID)
-        latest_report = max(all_reports, key=lambda r: r.id)
-        
         # Find the highest sprint number across all reports
-        max_sprint = max((r.sprintNumber or 0) for r in all_reports)
+        max_sprint = project_reports.with_entities(func.max(Report.sprintNumber)).scalar() or 0
         
         # Get the last cycle number and release number from the most recent report
         last_cycle = latest_report.cycleNumber or 1
         last_release = latest_report.releaseNumber or '1.0'
         
-        # Parse existing data
-        tester_data = json.loads(latest_report.testerData or '[]')
-        team_member_data = json.loads(latest_report.teamMemberData or '[]')
+        # Carry over the latest report's testers and team members
+        tester_data = latest_report.list_field('testerData')
+        team_member_data = latest_report.list_field('teamMemberData')
         
         # Get project to find assigned testers (merge with existing tester data)
         project = Project.query.filter_by(name=project_name).first()
@@ -1674,7 +3832,7 @@ def get_latest_project_data(portfolio_name, project_name):
         })
         
     except Exception as e:
-        print(f"Error getting latest project data: {e}")
+        app.logger.error(f"Error getting latest project data: {e}")
         from datetime import datetime
         today = datetime.now().strftime('%d-%m-%Y')
         return jsonify({
@@ -1694,7 +3852,7 @@ def get_latest_project_data(portfolio_name, project_name):
 @app.route('/manage')
 def manage_data_page():
     """Serves the manage data page."""
-    return render_template('manage_data.html')
+    return render_page('manage_data.html', per_user=False)
 
 # Similar routes for projects, testers, team members
 
@@ -1703,6 +3861,7 @@ def update_report(id):
     """Updates an existing report by its ID."""
     report = Report.query.get_or_404(id)
     data = request.get_json()
+    old_snapshot = report_rollup_snapshot(report)
 
     # Update fields
     for field in ['portfolioName', 'projectName', 'sprintNumber', 'reportVersion', 
@@ -1720,24 +3879,23 @@ def update_report(id):
         if field in data:
             setattr(report, field, data[field])
     
-    # Update JSON fields
-    if 'requestData' in data:
-        report.requestData = json.dumps(data['requestData'])
-    if 'buildData' in data:
-        report.buildData = json.dumps(data['buildData'])
-    if 'testerData' in data:
-        report.testerData = json.dumps(data['testerData'])
-    if 'teamMemberData' in data:
-        report.teamMemberData = json.dumps(data['teamMemberData'])
-    if 'qaNotesData' in data:
-        report.qaNotesData = json.dumps(data['qaNotesData'])
+    # Update list fields
+    for field in REPORT_LIST_FIELDS:
+        if field in data:
+            try:
+                report.set_list_field(field, data[field])
+            except ValueError as e:
+                db.session.rollback()
+                return jsonify({'error': str(e)}), 400
     if 'qaNoteFieldsData' in data:
-        report.qaNoteFieldsData = json.dumps(data['qaNoteFieldsData'])
+        report.qaNoteFieldsData = dump_json_blob(data['qaNoteFieldsData'])
 
 
     # Recalculate totals and scores
     report.calculate_totals()
+    link_report(report)
     
+    apply_report_rollup(old_snapshot, report_rollup_snapshot(report))
     db.session.commit()
     return jsonify(report.to_dict())
 
@@ -1745,154 +3903,722 @@ def update_report(id):
 def delete_report(id):
     """Deletes a report by its ID."""
     report = Report.query.get_or_404(id)
+    old_snapshot = report_rollup_snapshot(report)
     db.session.delete(report)
+    apply_report_rollup(old_snapshot=old_snapshot)
     db.session.commit()
     return jsonify({'message': 'Report deleted successfully'}), 200
 
+# --- Report Links ---
+def normalize_link_name(name):
+    """Case- and whitespace-insensitive form of a portfolio or project name"""
+    return ' '.join((name or '').split()).casefold()
+
+def build_report_link_maps(skip_portfolio_id=None, skip_project_id=None):
+    """Index managed portfolios and projects by normalized name for resolve_report_links.
+
+    skip_portfolio_id and skip_project_id leave out a row that is about to be deleted.
+    """
+    portfolio_ids = {}
+    for portfolio_id, name in db.session.query(Portfolio.id, Portfolio.name).order_by(Portfolio.id):
+        if portfolio_id != skip_portfolio_id:
+            portfolio_ids.setdefault(normalize_link_name(name), portfolio_id)
+    project_ids = {}
+    for project_id, name, portfolio_id in db.session.query(
+        Project.id, Project.name, Project.portfolio_id
+    ).order_by(Project.id):
+        if project_id != skip_project_id:
+            project_ids.setdefault((portfolio_id, normalize_link_name(name)), project_id)
+    return portfolio_ids, project_ids
+
+def resolve_report_links(portfolio_name, project_name, link_maps=None):
+    """Return the (portfolio_id, project_id) a report with these names belongs to.
+
+    The project must sit in the matching portfolio; a project without a
+    portfolio is used only when the portfolio has no project of that name.
+    """
+    portfolio_ids, project_ids = link_maps or build_report_link_maps()
+    portfolio_id = portfolio_ids.get(normalize_link_name(portfolio_name))
+    project_key = normalize_link_name(project_name)
+    project_id = project_ids.get((portfolio_id, project_key))
+    if project_id is None and portfolio_id is not None:
+        project_id = project_ids.get((None, project_key))
+    return portfolio_id, project_id
+
+def link_report(report, link_maps=None):
+    """Set a report's portfolio_id and project_id from its portfolio and project names"""
+    report.portfolio_id, report.project_id = resolve_report_links(
+        report.portfolioName, report.projectName, link_maps
+    )
+
+def portfolio_link_scope(portfolio):
+    """relink_reports arguments covering the rows a created, renamed or deleted portfolio can affect.
+
+    Those are the rows linked to it, rows linked to no portfolio (which its
+    name may now claim) and rows linked to a portfolio whose name it shares.
+    """
+    name = normalize_link_name(portfolio.name)
+    portfolio_ids = {portfolio.id, None}
+    for portfolio_id, other_name in db.session.query(Portfolio.id, Portfolio.name):
+        if normalize_link_name(other_name) == name:
+            portfolio_ids.add(portfolio_id)
+    return {'portfolio_ids': portfolio_ids, 'project_ids': ()}
+
+def project_link_scope(project, old_portfolio_id):
+    """relink_reports arguments covering the rows a created, changed or deleted project can affect.
+
+    Those are the rows in its old and new portfolio. A project without a
+    portfolio is the fallback for every portfolio, so then rows linked to no
+    project or to another project without a portfolio are covered too.
+    """
+    portfolio_ids = {old_portfolio_id, project.portfolio_id} - {None}
+    project_ids = {project.id}
+    if old_portfolio_id is None or project.portfolio_id is None:
+        project_ids.add(None)
+        project_ids.update(project_id for project_id, in db.session.query(Project.id).filter(Project.portfolio_id.is_(None)))
+    return {'portfolio_ids': portfolio_ids, 'project_ids': project_ids}
+
+def _link_filter(model, portfolio_ids, project_ids):
+    """Rows of model linked to one of the ids; None stands for rows not linked at all"""
+    from sqlalchemy import false, or_
+
+    clauses = []
+    for column, ids in ((model.portfolio_id, portfolio_ids), (getattr(model, 'project_id', None), project_ids)):
+        if column is None or not ids:
+            continue
+        linked_ids = [link_id for link_id in ids if link_id is not None]
+        if linked_ids:
+            clauses.append(column.in_(linked_ids))
+        if None in ids:
+            clauses.append(column.is_(None))
+    return or_(false(), *clauses)
+
+def relink_reports(portfolio_ids=None, project_ids=None, link_maps=None):
+    """Recompute portfolio_id/project_id on report and rollup rows.
+
+    Called after portfolios or projects are created, renamed, moved or
+    deleted, with the scope from portfolio_link_scope or project_link_scope
+    so that only rows currently linked to those ids are checked; without one
+    every row is. Issues one UPDATE per distinct name pair whose links
+    changed, inside the caller's transaction, and returns the number of such
+    pairs. Deletes pass link_maps built without the row being deleted and
+    relink before deleting it, so no row references it by then.
+    """
+    from sqlalchemy import update, bindparam
+
+    scoped = portfolio_ids is not None or project_ids is not None
+
+    def in_scope(query, model):
+        return query.filter(_link_filter(model, portfolio_ids, project_ids)) if scoped else query
+
+    link_maps = link_maps or build_report_link_maps()
+    changes = {}
+    for row in in_scope(db.session.query(
+        Report.portfolioName, Report.projectName, Report.portfolio_id, Report.project_id
+    ), Report).distinct():
+        links = resolve_report_links(row.portfolioName, row.projectName, link_maps)
+        if links != (row.portfolio_id, row.project_id):
+            changes[(row.portfolioName, row.projectName)] = links
+    if changes:
+        report_table = Report.__table__
+        db.session.execute(
+            update(report_table).where(
+                report_table.c.portfolioName == bindparam('b_portfolio_name'),
+                report_table.c.projectName == bindparam('b_project_name')
+            ).values(
+                portfolio_id=bindparam('b_portfolio_id'),
+                project_id=bindparam('b_project_id'),
+                updatedAt=report_table.c.updatedAt  # Relinking is not an edit
+            ),
+            [
+                {'b_portfolio_name': portfolio_name, 'b_project_name': project_name,
+                 'b_portfolio_id': portfolio_id, 'b_project_id': project_id}
+                for (portfolio_name, project_name), (portfolio_id, project_id) in changes.items()
+            ]
+        )
+
+    # Keep the ids on the rollup rows in step with the reports they summarize
+    project_stats_updates = []
+    for stats_id, portfolio_name, project_name, portfolio_id, project_id in in_scope(db.session.query(
+        ProjectStats.id, ProjectStats.portfolio_name, ProjectStats.project_name,
+        ProjectStats.portfolio_id, ProjectStats.project_id
+    ), ProjectStats):
+        links = resolve_report_links(portfolio_name, project_name, link_maps)
+        if links != (portfolio_id, project_id):
+            project_stats_updates.append({'id': stats_id, 'portfolio_id': links[0], 'project_id': links[1]})
+    portfolio_stats_updates = []
+    for stats_id, portfolio_name, portfolio_id in in_scope(db.session.query(
+        PortfolioStats.id, PortfolioStats.portfolio_name, PortfolioStats.portfolio_id
+    ), PortfolioStats):
+        linked_id = link_maps[0].get(normalize_link_name(portfolio_name))
+        if linked_id != portfolio_id:
+            portfolio_stats_updates.append({'id': stats_id, 'portfolio_id': linked_id})
+    if project_stats_updates:
+        db.session.execute(update(ProjectStats), project_stats_updates)
+    if portfolio_stats_updates:
+        db.session.execute(update(PortfolioStats), portfolio_stats_updates)
+    return len(changes)
+
 # --- Statistical Cache Update Functions ---
-def update_stats_cache():
-    """Update all statistical cache tables"""
-    from sqlalchemy import func
+def report_rollup_snapshot(report):
+    """Capture the values a report contributes to the rollup tables"""
+    return {
+        'portfolioName': report.portfolioName,
+        'projectName': report.projectName,
+        'portfolio_id': report.portfolio_id,
+        'project_id': report.project_id,
+        'testingStatus': report.testingStatus,
+        'metrics': {attr: int(getattr(report, attr) or 0) for attr, _ in REPORT_ROLLUP_FIELDS},
+    }
+
+def latest_report_date(report_dates):
+    """Return the most recent of several reportDate strings, compared as dates"""
+    parsed = [(parse_report_date(value), value) for value in report_dates]
+    parsed = [item for item in parsed if item[0] is not None]
+    return max(parsed)[1] if parsed else None
+
+def _ensure_rollup_row(model, links, **keys):
+    """Return the id of the rollup row with these key columns, inserting an empty one with `links` if missing.
+
+    The insert is INSERT ... ON CONFLICT DO NOTHING where the database has it,
+    so a concurrent transaction creating the same row first is not an error.
+    """
+    row_id = db.session.query(model.id).filter_by(**keys).scalar()
+    if row_id is not None:
+        return row_id
+    dialect = db.engine.dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy import insert
+    values = dict(keys, **links, total_reports=0, last_updated=datetime.utcnow())
+    values.update({column: 0 for _, column in REPORT_ROLLUP_FIELDS})
+    statement = insert(model.__table__).values(values)
+    if dialect in ('sqlite', 'postgresql'):
+        statement = statement.on_conflict_do_nothing()
+    db.session.execute(statement)
+    return db.session.query(model.id).filter_by(**keys).scalar()
+
+# Prepared UPDATE statements for _apply_rollup_deltas, keyed by model, column set and returned column
+_rollup_delta_statements = {}
+
+def _apply_rollup_deltas(model, row_id, deltas, returning=None):
+    """Add deltas to a rollup row with a single atomic UPDATE.
+
+    With `returning`, returns that column's value after the update.
+    """
+    from sqlalchemy import update, bindparam
+
+    columns = tuple(sorted(column for column, delta in deltas.items() if delta))
+    statement = _rollup_delta_statements.get((model, columns, returning))
+    if statement is None:
+        table = model.__table__
+        values = {column: table.c[column] + bindparam(f'delta_{column}') for column in columns}
+        values['last_updated'] = bindparam('b_last_updated')
+        statement = update(table).where(table.c.id == bindparam('b_id')).values(values)
+        if returning:
+            statement = statement.returning(table.c[returning])
+        _rollup_delta_statements[(model, columns, returning)] = statement
+    params = {f'delta_{column}': deltas[column] for column in columns}
+    params.update(b_id=row_id, b_last_updated=datetime.utcnow())
+    result = db.session.execute(statement, params)
+    return result.scalar() if returning else None
+
+def _refresh_latest_report(project_stats):
+    """Recompute the latest report date and status of one project rollup"""
+    latest = db.session.query(Report.reportDate, Report.testingStatus).filter(
+        Report.portfolioName == project_stats.portfolio_name,
+        Report.projectName == project_stats.project_name
+    ).order_by(Report.reportDateValue.desc().nulls_last(), Report.id.desc()).first()
+    project_stats.last_report_date = latest.reportDate if latest else None
+    project_stats.latest_testing_status = latest.testingStatus if latest else None
+
+def _snapshot_deltas(snapshot, sign):
+    """Per-column deltas for adding (sign=1) or removing (sign=-1) a snapshot"""
+    deltas = {column: sign * snapshot['metrics'][attr] for attr, column in REPORT_ROLLUP_FIELDS}
+    deltas['total_reports'] = sign
+    if snapshot['testingStatus'] == 'passed':
+        deltas['completed_reports'] = sign
+    elif snapshot['testingStatus'] == 'passed-with-issues':
+        deltas['in_progress_reports'] = sign
+    else:
+        deltas['pending_reports'] = sign
+    return deltas
+
+def _apply_project_rollup(portfolio_name, project_name, links, deltas):
+    """Apply deltas to one project rollup and its portfolio rollup.
+
+    Whether the project gained its first report or lost its last is read
+    from the total the UPDATE returns, not from an earlier read, so concurrent
+    report writes for one project keep total_projects right.
+    """
+    from sqlalchemy import delete
+
+    deltas = {column: delta for column, delta in deltas.items() if column not in DASHBOARD_STATUS_COUNTERS}
+    portfolio_stats_id = _ensure_rollup_row(
+        PortfolioStats, {'portfolio_id': links['portfolio_id']}, portfolio_name=portfolio_name
+    )
+    project_stats_id = _ensure_rollup_row(
+        ProjectStats, links, portfolio_name=portfolio_name, project_name=project_name
+    )
+
+    reports_after = _apply_rollup_deltas(ProjectStats, project_stats_id, deltas, returning='total_reports')
+    reports_before = reports_after - deltas['total_reports']
+    portfolio_deltas = dict(deltas)
+    if reports_before <= 0 < reports_after:
+        portfolio_deltas['total_projects'] = 1
+    elif reports_after <= 0 < reports_before:
+        portfolio_deltas['total_projects'] = -1
+    portfolio_reports_after = _apply_rollup_deltas(
+        PortfolioStats, portfolio_stats_id, portfolio_deltas, returning='total_reports'
+    )
+
+    for model, row_id, remaining in (
+        (ProjectStats, project_stats_id, reports_after),
+        (PortfolioStats, portfolio_stats_id, portfolio_reports_after),
+    ):
+        stats = db.session.identity_map.get(db.session.identity_key(model, row_id))
+        if stats is not None:
+            db.session.expire(stats)
+        if remaining <= 0:
+            table = model.__table__
+            db.session.execute(delete(table).where(table.c.id == row_id, table.c.total_reports <= 0))
+
+    if reports_after > 0:
+        _refresh_latest_report(db.session.get(ProjectStats, project_stats_id))
+    if portfolio_reports_after > 0:
+        db.session.get(PortfolioStats, portfolio_stats_id).last_report_date = latest_report_date(
+            row.last_report_date for row in db.session.query(ProjectStats.last_report_date).filter(
+                ProjectStats.portfolio_name == portfolio_name
+            )
+        )
+
+def apply_report_rollup(old_snapshot=None, new_snapshot=None):
+    """Move a report's contribution in the rollup tables from old_snapshot to new_snapshot.
+
+    Pass only new_snapshot for a created report and only old_snapshot for a
+    deleted one. Runs inside the caller's transaction so the rollups commit
+    together with the report change; the caller is responsible for committing.
+    """
+    apply_report_rollups([(old_snapshot, new_snapshot)])
+
+def apply_report_rollups(changes):
+    """Apply several (old_snapshot, new_snapshot) report changes to the rollups at once.
+
+    Deltas are summed per project first, so each affected rollup row is
+    updated once however many reports changed.
+    """
+    dashboard_stats = DashboardStats.query.first()
+    if dashboard_stats is None:
+        # Rollups have never been built; a full rebuild already reflects this change
+        rebuild_stats_tables()
+        return
+
+    dashboard_deltas = {}
+    project_deltas = {}
+    project_links = {}
+    for snapshot, sign in (
+        (snapshot, sign) for old_snapshot, new_snapshot in changes
+        for snapshot, sign in ((old_snapshot, -1), (new_snapshot, 1))
+    ):
+        if snapshot is None:
+            continue
+        key = (snapshot['portfolioName'], snapshot['projectName'])
+        project_links[key] = {'portfolio_id': snapshot['portfolio_id'], 'project_id': snapshot['project_id']}
+        deltas = project_deltas.setdefault(key, {})
+        for column, delta in _snapshot_deltas(snapshot, sign).items():
+            deltas[column] = deltas.get(column, 0) + delta
+            dashboard_deltas[column] = dashboard_deltas.get(column, 0) + delta
+
+    _apply_rollup_deltas(DashboardStats, dashboard_stats.id, dashboard_deltas)
+    db.session.expire(dashboard_stats)
+    for (portfolio_name, project_name), deltas in project_deltas.items():
+        _apply_project_rollup(portfolio_name, project_name, project_links[(portfolio_name, project_name)], deltas)
+
+def _upsert_stats_rows(model, key_columns, rows):
+    """Bring a stats table in line with `rows` using bulk INSERT/UPDATE/DELETE.
+
+    `rows` maps each key tuple to the full set of column values for that row.
+    Rows whose values are unchanged are left alone. Returns the number of
+    inserted, updated and deleted rows.
+    """
+    from sqlalchemy import insert, update, delete
+
+    compare_columns = [column for column in next(iter(rows.values()), {}) if column != 'last_updated']
+    existing = db.session.query(model.id, *[getattr(model, column) for column in compare_columns]).all()
+
+    to_update = []
+    stale_ids = []
+    seen_keys = set()
+    for row in existing:
+        values = row._mapping
+        key = tuple(values[column] for column in key_columns)
+        if key not in rows or key in seen_keys:
+            stale_ids.append(row.id)
+            continue
+        seen_keys.add(key)
+        if any(values[column] != rows[key][column] for column in compare_columns):
+            to_update.append(dict(rows[key], id=row.id))
+    to_insert = [values for key, values in rows.items() if key not in seen_keys]
+
+    if to_insert:
+        db.session.execute(insert(model), to_insert)
+    if to_update:
+        db.session.execute(update(model), to_update)
+    if stale_ids:
+        db.session.execute(delete(model).where(model.id.in_(stale_ids)))
+    return len(to_insert), len(to_update), len(stale_ids)
+
+def rebuild_stats_tables():
+    """Recompute all three stats tables from the report table.
+
+    Uses a fixed number of grouped queries regardless of how many portfolios,
+    projects or reports exist, then bulk upserts the results. Runs inside the
+    caller's transaction and returns the inserted/updated/deleted row counts.
+    """
+    from sqlalchemy import func, case
+
+    now = datetime.utcnow()
+    metric_sums = [func.sum(getattr(Report, attr)).label(column) for attr, column in REPORT_ROLLUP_FIELDS]
+
+    # Overall totals
+    overall = db.session.query(
+        func.count(Report.id).label('total_reports'),
+        func.sum(case((Report.testingStatus == 'passed', 1), else_=0)).label('completed_reports'),
+        func.sum(case((Report.testingStatus == 'passed-with-issues', 1), else_=0)).label('in_progress_reports'),
+        *metric_sums
+    ).one()
+    total_reports = overall.total_reports or 0
+    completed_reports = overall.completed_reports or 0
+    in_progress_reports = overall.in_progress_reports or 0
+    dashboard_row = {
+        'total_reports': total_reports,
+        'completed_reports': completed_reports,
+        'in_progress_reports': in_progress_reports,
+        'pending_reports': total_reports - completed_reports - in_progress_reports,
+        'last_updated': now,
+    }
+    for _, column in REPORT_ROLLUP_FIELDS:
+        dashboard_row[column] = getattr(overall, column) or 0
+
+    # Per-project totals; the links are the same for every report sharing both names
+    project_aggregates = db.session.query(
+        Report.portfolioName,
+        Report.projectName,
+        func.max(Report.portfolio_id).label('portfolio_id'),
+        func.max(Report.project_id).label('project_id'),
+        func.count(Report.id).label('total_reports'),
+        *metric_sums
+    ).group_by(Report.portfolioName, Report.projectName).all()
+
+    # Latest report date and testing status for each project
+    latest_reports_subquery = db.session.query(
+        Report.portfolioName,
+        Report.projectName,
+        Report.reportDate,
+        Report.testingStatus,
+        func.row_number().over(
+            partition_by=[Report.portfolioName, Report.projectName],
+            order_by=[Report.reportDateValue.desc().nulls_last(), Report.id.desc()]
+        ).label('rn')
+    ).subquery()
+    latest_reports = {
+        (row.portfolioName, row.projectName): row
+        for row in db.session.query(
+            latest_reports_subquery.c.portfolioName,
+            latest_reports_subquery.c.projectName,
+            latest_reports_subquery.c.reportDate,
+            latest_reports_subquery.c.testingStatus
+        ).filter(latest_reports_subquery.c.rn == 1)
+    }
+
+    project_rows = {}
+    portfolio_rows = {}
+    for row in project_aggregates:
+        latest = latest_reports.get((row.portfolioName, row.projectName))
+        last_report_date = latest.reportDate if latest else None
+        project_row = {
+            'portfolio_name': row.portfolioName,
+            'project_name': row.projectName,
+            'project_id': row.project_id,
+            'portfolio_id': row.portfolio_id,
+            'total_reports': row.total_reports,
+            'last_report_date': last_report_date,
+            'latest_testing_status': latest.testingStatus if latest else None,
+            'last_updated': now,
+        }
+
+        portfolio_row = portfolio_rows.get((row.portfolioName,))
+        if portfolio_row is None:
+            portfolio_row = {
+                'portfolio_name': row.portfolioName,
+                'portfolio_id': row.portfolio_id,
+                'total_reports': 0,
+                'total_projects': 0,
+                'last_report_date': None,
+                'last_updated': now,
+            }
+            for _, column in REPORT_ROLLUP_FIELDS:
+                portfolio_row[column] = 0
+            portfolio_rows[(row.portfolioName,)] = portfolio_row
+        portfolio_row['total_reports'] += row.total_reports
+        portfolio_row['total_projects'] += 1
+        portfolio_row['last_report_date'] = latest_report_date([portfolio_row['last_report_date'], last_report_date])
+
+        for _, column in REPORT_ROLLUP_FIELDS:
+            value = getattr(row, column) or 0
+            project_row[column] = value
+            portfolio_row[column] += value
+        project_rows[(row.portfolioName, row.projectName)] = project_row
+
+    counts = {'inserted': 0, 'updated': 0, 'deleted': 0}
+    for model, key_columns, rows in (
+        (DashboardStats, (), {(): dashboard_row}),
+        (PortfolioStats, ('portfolio_name',), portfolio_rows),
+        (ProjectStats, ('portfolio_name', 'project_name'), project_rows),
+    ):
+        if not rows:
+            deleted = model.query.delete()
+            counts['deleted'] += deleted
+            continue
+        inserted, updated, deleted = _upsert_stats_rows(model, key_columns, rows)
+        counts['inserted'] += inserted
+        counts['updated'] += updated
+        counts['deleted'] += deleted
+    return counts
+
+# Single-flight guards and bookkeeping for update_stats_cache: the threading lock covers this
+# process, the file lock every process on the host
+_stats_refresh_lock = threading.Lock()
+_stats_refresh_stop = None
+stats_refresh_status = {
+    'runs': 0,
+    'last_run': None,
+    'duration_ms': None,
+    'inserted': None,
+    'updated': None,
+    'deleted': None,
+    'rows_touched': None,
+    'error': None,
+}
+
+def stats_refresh_lock_path():
+    """The lock file update_stats_cache holds while it runs, which also records when one last succeeded"""
+    if app.config['STATS_REFRESH_LOCK_FILE']:
+        return app.config['STATS_REFRESH_LOCK_FILE']
+    database = hashlib.sha256(app.config['SQLALCHEMY_DATABASE_URI'].encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f'reports-stats-refresh-{database}.lock')
+
+def _acquire_stats_refresh_lock():
+    """Take the refresh lock without waiting; returns the open lock file, or None if a refresh holds it"""
+    if not _stats_refresh_lock.acquire(blocking=False):
+        return None
     try:
-        # Update Dashboard Stats
-        dashboard_stats = DashboardStats.query.first()
-        if not dashboard_stats:
-            dashboard_stats = DashboardStats()
-            db.session.add(dashboard_stats)
-        
-        # Calculate overall stats
-        total_reports = db.session.query(func.count(Report.id)).scalar()
-        completed_reports = db.session.query(func.count(Report.id)).filter(Report.testingStatus == 'passed').scalar()
-        in_progress_reports = db.session.query(func.count(Report.id)).filter(Report.testingStatus == 'passed-with-issues').scalar()
-        
-        aggregate_result = db.session.query(
-            func.sum(Report.totalUserStories).label('total_user_stories'),
-            func.sum(Report.totalTestCases).label('total_test_cases'),
-            func.sum(Report.totalIssues).label('total_issues'),
-            func.sum(Report.totalEnhancements).label('total_enhancements')
-        ).first()
-        
-        dashboard_stats.total_reports = total_reports
-        dashboard_stats.completed_reports = completed_reports or 0
-        dashboard_stats.in_progress_reports = in_progress_reports or 0
-        dashboard_stats.pending_reports = total_reports - (completed_reports or 0) - (in_progress_reports or 0)
-        dashboard_stats.total_user_stories = aggregate_result.total_user_stories or 0
-        dashboard_stats.total_test_cases = aggregate_result.total_test_cases or 0
-        dashboard_stats.total_issues = aggregate_result.total_issues or 0
-        dashboard_stats.total_enhancements = aggregate_result.total_enhancements or 0
-        dashboard_stats.last_updated = datetime.utcnow()
-        
-        # Update Portfolio Stats
-        portfolios = Portfolio.query.all()
-        for portfolio in portfolios:
-            portfolio_stats = PortfolioStats.query.filter_by(portfolio_id=portfolio.id).first()
-            if not portfolio_stats:
-                portfolio_stats = PortfolioStats(portfolio_id=portfolio.id, portfolio_name=portfolio.name)
-                db.session.add(portfolio_stats)
-            
-            # Get stats for this portfolio
-            portfolio_aggregate = db.session.query(
-                func.count(Report.id).label('total_reports'),
-                func.sum(Report.totalUserStories).label('total_user_stories'),
-                func.sum(Report.totalTestCases).label('total_test_cases'),
-                func.sum(Report.totalIssues).label('total_issues'),
-                func.sum(Report.totalEnhancements).label('total_enhancements'),
-                func.max(Report.reportDate).label('last_report_date')
-            ).filter(Report.portfolioName == portfolio.name).first()
-            
-            project_count = Project.query.filter_by(portfolio_id=portfolio.id).count()
-            
-            portfolio_stats.portfolio_name = portfolio.name
-            portfolio_stats.total_reports = portfolio_aggregate.total_reports or 0
-            portfolio_stats.total_projects = project_count
-            portfolio_stats.total_user_stories = portfolio_aggregate.total_user_stories or 0
-            portfolio_stats.total_test_cases = portfolio_aggregate.total_test_cases or 0
-            portfolio_stats.total_issues = portfolio_aggregate.total_issues or 0
-            portfolio_stats.total_enhancements = portfolio_aggregate.total_enhancements or 0
-            portfolio_stats.last_report_date = portfolio_aggregate.last_report_date
-            portfolio_stats.last_updated = datetime.utcnow()
-        
-        # Update Project Stats
-        projects = Project.query.all()
-        for project in projects:
-            project_name = project.name.strip()
-            # Try exact match first
-            reports = Report.query.filter(Report.projectName == project_name).all()
-            
-            # If no matches, try case-insensitive search
-            if not reports:
-                reports = Report.query.filter(Report.projectName.ilike(f'%{project_name}%')).all()
-                
-            # If still no matches, try in-memory filtering
-            if not reports:
-                all_reports = Report.query.all()
-                reports = [r for r in all_reports if r.projectName and r.projectName.strip().lower() == project_name.lower()]
-                
-            if not reports:
-                print(f"No reports found for project: {project_name}")
-                continue
-                
-            project_stats = ProjectStats.query.filter_by(project_id=project.id).first()
-            if not project_stats:
-                project_stats = ProjectStats(
-                    project_id=project.id, 
-                    portfolio_id=project.portfolio_id,
-                    portfolio_name=project.portfolio.name,
-                    project_name=project.name
-                )
-                db.session.add(project_stats)
-            
-            # Get stats for this project
-            project_aggregate = db.session.query(
-                func.count(Report.id).label('total_reports'),
-                func.sum(Report.totalUserStories).label('total_user_stories'),
-                func.sum(Report.totalTestCases).label('total_test_cases'),
-                func.sum(Report.totalIssues).label('total_issues'),
-                func.sum(Report.totalEnhancements).label('total_enhancements'),
-                func.max(Report.reportDate).label('last_report_date')
-            ).filter(Report.portfolioName == project.portfolio.name, Report.projectName == project.name).first()
-            
-            # Get latest testing status
-            latest_report = Report.query.filter_by(
-                portfolioName=project.portfolio.name, 
-                projectName=project.name
-            ).order_by(Report.reportDate.desc()).first()
-            
-            project_stats.portfolio_name = project.portfolio.name
-            project_stats.project_name = project.name
-            project_stats.total_reports = project_aggregate.total_reports or 0
-            project_stats.total_user_stories = project_aggregate.total_user_stories or 0
-            project_stats.total_test_cases = project_aggregate.total_test_cases or 0
-            project_stats.total_issues = project_aggregate.total_issues or 0
-            project_stats.total_enhancements = project_aggregate.total_enhancements or 0
-            project_stats.last_report_date = project_aggregate.last_report_date
-            project_stats.latest_testing_status = latest_report.testingStatus if latest_report else 'pending'
-            project_stats.last_updated = datetime.utcnow()
-        
+        lock_file = open(stats_refresh_lock_path(), 'a+')
+    except OSError as e:
+        _stats_refresh_lock.release()
+        app.logger.error(f"Cannot open the statistics refresh lock file: {e}")
+        return None
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:  # Another process is refreshing
+            lock_file.close()
+            _stats_refresh_lock.release()
+            return None
+    return lock_file
+
+def _release_stats_refresh_lock(lock_file, succeeded):
+    """Record a successful refresh in the lock file, then release both locks"""
+    try:
+        if succeeded:
+            lock_file.seek(0)
+            lock_file.truncate()
+            lock_file.write(str(time.time()))
+            lock_file.flush()
+    finally:
+        lock_file.close()
+        _stats_refresh_lock.release()
+
+def _seconds_since_stats_refresh(lock_file):
+    """Seconds since any process last refreshed the cache tables, or None if none has"""
+    lock_file.seek(0)
+    try:
+        return time.time() - float(lock_file.read())
+    except ValueError:
+        return None
+
+def update_stats_cache(skip_if_newer_than=None):
+    """Rebuild all statistical cache tables and commit.
+
+    Only one refresh runs at a time across the processes on this host; a call
+    made while another refresh is in progress returns None immediately, as
+    does one made within skip_if_newer_than seconds of another process's
+    refresh. Otherwise returns a dict with the refresh duration and the number
+    of rows touched. A refresh that changes rows bumps the data version, so
+    responses built from the rollups get a new ETag.
+    """
+    lock_file = _acquire_stats_refresh_lock()
+    if lock_file is None:
+        app.logger.info("Statistics cache refresh already running, skipping")
+        return None
+    if skip_if_newer_than is not None:
+        age = _seconds_since_stats_refresh(lock_file)
+        if age is not None and age < skip_if_newer_than:
+            _release_stats_refresh_lock(lock_file, succeeded=False)
+            return None
+    
+    started = time.perf_counter()
+    succeeded = False
+    try:
+        counts = rebuild_stats_tables()
+        if counts['inserted'] or counts['updated'] or counts['deleted']:
+            db.session.execute(DATA_VERSION_BUMP)
         db.session.commit()
-        print("Statistics cache updated successfully")
-        
+        succeeded = True
     except Exception as e:
         db.session.rollback()
-        print(f"Error updating stats cache: {e}")
+        stats_refresh_status['error'] = str(e)
+        metrics.inc('stats_refresh_failures_total')
+        app.logger.error(f"Error updating stats cache: {e}")
+        return None
+    finally:
+        _release_stats_refresh_lock(lock_file, succeeded)
+    
+    result = dict(counts)
+    result['rows_touched'] = counts['inserted'] + counts['updated'] + counts['deleted']
+    elapsed = time.perf_counter() - started
+    result['duration_ms'] = round(elapsed * 1000, 2)
+    metrics.observe('stats_refresh_duration_seconds', elapsed)
+    stats_refresh_status.update(result)
+    stats_refresh_status['runs'] += 1
+    stats_refresh_status['last_run'] = datetime.utcnow().isoformat()
+    stats_refresh_status['error'] = None
+    app.logger.info(f"Statistics cache updated in {result['duration_ms']} ms ({result['rows_touched']} rows touched)")
+    return result
+
+def start_stats_refresh_scheduler(interval=None):
+    """Refresh the statistical cache tables every `interval` seconds in a daemon thread.
+
+    Defaults to the STATS_REFRESH_INTERVAL setting; an interval of 0 disables
+    the scheduler. Every worker process runs one, and a run is skipped when
+    another process refreshed within the last half interval, so the tables are
+    rebuilt about once per interval however many workers there are. Returns
+    the event that stops the thread, or None.
+    """
+    global _stats_refresh_stop
+    if interval is None:
+        interval = app.config['STATS_REFRESH_INTERVAL']
+    if interval <= 0 or _stats_refresh_stop is not None:
+        return _stats_refresh_stop
+    
+    stop_event = threading.Event()
+    
+    def run():
+        while not stop_event.wait(interval):
+            with app.app_context():
+                update_stats_cache(skip_if_newer_than=interval / 2)
+    
+    threading.Thread(target=run, name='stats-refresh', daemon=True).start()
+    _stats_refresh_stop = stop_event
+    return stop_event
+
+def get_dashboard_rollup():
+    """Return the overall rollup row, building the rollups on first use"""
+    dashboard_stats = DashboardStats.query.first()
+    if dashboard_stats is None:
+        update_stats_cache()
+        dashboard_stats = DashboardStats.query.first() or DashboardStats()
+    return dashboard_stats
+
+@app.cli.command('refresh-stats')
+def refresh_stats_command():
+    """Rebuild the statistical cache tables from the report table."""
+    create_app()
+    result = update_stats_cache()
+    if result is None:
+        raise click.ClickException(stats_refresh_status['error'] or 'A statistics refresh is already running')
+    click.echo(
+        f"Statistics cache refreshed in {result['duration_ms']} ms: "
+        f"{result['inserted']} inserted, {result['updated']} updated, {result['deleted']} deleted"
+    )
+
+@app.route('/api/admin/stats-cache', methods=['GET'])
+@login_required
+@admin_required
+@approved_required
+def get_stats_cache_status():
+    """Report when the statistical cache was last refreshed and how long it took"""
+    return jsonify(dict(stats_refresh_status, interval=app.config['STATS_REFRESH_INTERVAL']))
+
+@app.route('/api/admin/perf', methods=['GET'])
+@login_required
+@admin_required
+@approved_required
+def get_perf_summary():
+    """List endpoints by p95 latency with their query counts, plus recent slow queries"""
+    limit = request.args.get('limit', 20, type=int)
+    with _profiling_lock:
+        endpoints = []
+        for endpoint, timings in endpoint_timings.items():
+            durations = list(timings['durations'])
+            endpoints.append({
+                'endpoint': endpoint,
+                'requests': timings['count'],
+                'p50_ms': round(percentile(durations, 0.50), 2),
+                'p95_ms': round(percentile(durations, 0.95), 2),
+                'max_ms': round(max(durations), 2),
+                'avg_queries': round(timings['queries'] / timings['count'], 2),
+                'avg_db_ms': round(timings['db_ms'] / timings['count'], 2),
+                'rows_fetched': timings['rows_fetched'],
+                'rows_written': timings['rows_written'],
+                'objects_loaded': timings['objects_loaded'],
+                'slowest_statements': [
+                    {'duration_ms': round(duration, 2), 'statement': ' '.join(statement.split())[:300]}
+                    for duration, statement in timings['slowest']
+                ],
+            })
+        recent_slow_queries = list(slow_queries)
+    endpoints.sort(key=lambda item: item['p95_ms'], reverse=True)
+    return jsonify({
+        'endpoints': endpoints[:limit],
+        'slowQueries': recent_slow_queries[::-1],
+        'slowQueryThresholdMs': app.config['SLOW_QUERY_MS'],
+        'boot': boot_stats,
+    })
+
+@app.route('/api/admin/response-cache', methods=['GET', 'DELETE'])
+@login_required
+@admin_required
+@approved_required
+def manage_response_cache():
+    """Show the response cache counters, or clear the cache with DELETE"""
+    if request.method == 'DELETE':
+        response_cache.clear()
+    return jsonify(dict(response_cache.status(), enabled=app.config['RESPONSE_CACHE_ENABLED'], shared=app.config['RESPONSE_CACHE_SHARED']))
 
 # Optimized API endpoints
 @app.route('/api/portfolios/minimal', methods=['GET'])
+@cached_response('portfolio')
 def get_portfolios_minimal():
     """Get minimal portfolio data for fast loading"""
     portfolios = Portfolio.query.with_entities(Portfolio.id, Portfolio.name).all()
     return jsonify([{'id': p.id, 'name': p.name} for p in portfolios])
 
 @app.route('/api/projects/by-portfolio/<int:portfolio_id>', methods=['GET'])
+@cached_response('project')
 def get_projects_by_portfolio(portfolio_id):
     """Get projects for a specific portfolio - optimized for dropdowns"""
     projects = Project.query.filter_by(portfolio_id=portfolio_id).with_entities(Project.id, Project.name).all()
     return jsonify([{'id': p.id, 'name': p.name} for p in projects])
 
 @app.route('/api/portfolios/<int:portfolio_id>/projects/detailed', methods=['GET'])
+@query_budget(GET=2)
 def get_portfolio_projects_detailed(portfolio_id):
     """Get detailed projects for a specific portfolio including testers"""
-    projects = Project.query.filter_by(portfolio_id=portfolio_id).all()
+    projects = Project.query.options(selectinload(Project.testers)).filter_by(portfolio_id=portfolio_id).all()
     result = []
     for p in projects:
         result.append({
@@ -1904,266 +4630,118 @@ def get_portfolio_projects_detailed(portfolio_id):
     return jsonify(result)
 
 @app.route('/api/dashboard/stats/cached', methods=['GET'])
+@conditional_on_data_version
 def get_cached_dashboard_stats():
-    """Get dashboard statistics with detailed breakdown - simplified approach"""
-    from sqlalchemy import func
+    """Get dashboard statistics with detailed breakdown from the rollup tables"""
     try:
-        # Get overall stats directly from reports
-        total_reports = db.session.query(func.count(Report.id)).scalar()
-        completed_reports = db.session.query(func.count(Report.id)).filter(Report.testingStatus == 'passed').scalar()
-        in_progress_reports = db.session.query(func.count(Report.id)).filter(Report.testingStatus == 'passed-with-issues').scalar()
-        pending_reports = total_reports - completed_reports - in_progress_reports
-        
-        # Get aggregate metrics with database aggregation
-        aggregate_result = db.session.query(
-            func.sum(Report.totalUserStories).label('total_user_stories'),
-            func.sum(Report.passedUserStories).label('passed_user_stories'),
-            func.sum(Report.passedWithIssuesUserStories).label('passed_with_issues_user_stories'),
-            func.sum(Report.failedUserStories).label('failed_user_stories'),
-            func.sum(Report.blockedUserStories).label('blocked_user_stories'),
-            func.sum(Report.cancelledUserStories).label('cancelled_user_stories'),
-            func.sum(Report.deferredUserStories).label('deferred_user_stories'),
-            func.sum(Report.notTestableUserStories).label('not_testable_user_stories'),
-            func.sum(Report.totalTestCases).label('total_test_cases'),
-            func.sum(Report.passedTestCases).label('passed_test_cases'),
-            func.sum(Report.passedWithIssuesTestCases).label('passed_with_issues_test_cases'),
-            func.sum(Report.failedTestCases).label('failed_test_cases'),
-            func.sum(Report.blockedTestCases).label('blocked_test_cases'),
-            func.sum(Report.cancelledTestCases).label('cancelled_test_cases'),
-            func.sum(Report.deferredTestCases).label('deferred_test_cases'),
-            func.sum(Report.notTestableTestCases).label('not_testable_test_cases'),
-            func.sum(Report.totalIssues).label('total_issues'),
-            func.sum(Report.criticalIssues).label('critical_issues'),
-            func.sum(Report.highIssues).label('high_issues'),
-            func.sum(Report.mediumIssues).label('medium_issues'),
-            func.sum(Report.lowIssues).label('low_issues'),
-            func.sum(Report.newIssues).label('new_issues'),
-            func.sum(Report.fixedIssues).label('fixed_issues'),
-            func.sum(Report.notFixedIssues).label('not_fixed_issues'),
-            func.sum(Report.reopenedIssues).label('reopened_issues'),
-            func.sum(Report.deferredIssues).label('deferred_issues'),
-            func.sum(Report.totalEnhancements).label('total_enhancements'),
-            func.sum(Report.newEnhancements).label('new_enhancements'),
-            func.sum(Report.implementedEnhancements).label('implemented_enhancements'),
-            func.sum(Report.existsEnhancements).label('exists_enhancements'),
-            func.sum(Report.automationTotalTestCases).label('total_automation_test_cases'),
-            func.sum(Report.automationPassedTestCases).label('automation_passed_test_cases'),
-            func.sum(Report.automationFailedTestCases).label('automation_failed_test_cases'),
-            func.sum(Report.automationSkippedTestCases).label('automation_skipped_test_cases'),
-            func.sum(Report.automationStableTests).label('automation_stable_tests'),
-            func.sum(Report.automationFlakyTests).label('automation_flaky_tests'),
-        ).first()
+        dashboard_stats = get_dashboard_rollup()
         
         overall_stats = {
-            'totalReports': total_reports,
-            'completedReports': completed_reports,
-            'inProgressReports': in_progress_reports,
-            'pendingReports': pending_reports,
-            'totalUserStories': aggregate_result.total_user_stories or 0,
-            'passedUserStories': aggregate_result.passed_user_stories or 0,
-            'passedWithIssuesUserStories': aggregate_result.passed_with_issues_user_stories or 0,
-            'failedUserStories': aggregate_result.failed_user_stories or 0,
-            'blockedUserStories': aggregate_result.blocked_user_stories or 0,
-            'cancelledUserStories': aggregate_result.cancelled_user_stories or 0,
-            'deferredUserStories': aggregate_result.deferred_user_stories or 0,
-            'notTestableUserStories': aggregate_result.not_testable_user_stories or 0,
-            'totalTestCases': aggregate_result.total_test_cases or 0,
-            'passedTestCases': aggregate_result.passed_test_cases or 0,
-            'passedWithIssuesTestCases': aggregate_result.passed_with_issues_test_cases or 0,
-            'failedTestCases': aggregate_result.failed_test_cases or 0,
-            'blockedTestCases': aggregate_result.blocked_test_cases or 0,
-            'cancelledTestCases': aggregate_result.cancelled_test_cases or 0,
-            'deferredTestCases': aggregate_result.deferred_test_cases or 0,
-            'notTestableTestCases': aggregate_result.not_testable_test_cases or 0,
-            'totalIssues': aggregate_result.total_issues or 0,
-            'criticalIssues': aggregate_result.critical_issues or 0,
-            'highIssues': aggregate_result.high_issues or 0,
-            'mediumIssues': aggregate_result.medium_issues or 0,
-            'lowIssues': aggregate_result.low_issues or 0,
-            'newIssues': aggregate_result.new_issues or 0,
-            'fixedIssues': aggregate_result.fixed_issues or 0,
-            'notFixedIssues': aggregate_result.not_fixed_issues or 0,
-            'reopenedIssues': aggregate_result.reopened_issues or 0,
-            'deferredIssues': aggregate_result.deferred_issues or 0,
-            'totalEnhancements': aggregate_result.total_enhancements or 0,
-            'newEnhancements': aggregate_result.new_enhancements or 0,
-            'implementedEnhancements': aggregate_result.implemented_enhancements or 0,
-            'existsEnhancements': aggregate_result.exists_enhancements or 0,
-            'automationTotalTestCases': aggregate_result.total_automation_test_cases or 0,
-            'automationPassedTestCases': aggregate_result.automation_passed_test_cases or 0,
-            'automationFailedTestCases': aggregate_result.automation_failed_test_cases or 0,
-            'automationSkippedTestCases': aggregate_result.automation_skipped_test_cases or 0,
-            'automationStableTests': aggregate_result.automation_stable_tests or 0,
-            'automationFlakyTests': aggregate_result.automation_flaky_tests or 0,
+            'totalReports': dashboard_stats.total_reports or 0,
+            'completedReports': dashboard_stats.completed_reports or 0,
+            'inProgressReports': dashboard_stats.in_progress_reports or 0,
+            'pendingReports': dashboard_stats.pending_reports or 0,
         }
+        overall_stats.update(dashboard_stats.metrics_dict())
         
-        # Get project-specific metrics directly from reports
-        project_stats = db.session.query(
-            Report.portfolioName,
-            Report.projectName,
-            func.count(Report.id).label('totalReports'),
-            func.max(Report.reportDate).label('lastReportDate'),
-            # User Stories - ALL fields
-            func.sum(Report.totalUserStories).label('totalUserStories'),
-            func.sum(Report.passedUserStories).label('passedUserStories'),
-            func.sum(Report.passedWithIssuesUserStories).label('passedWithIssuesUserStories'),
-            func.sum(Report.failedUserStories).label('failedUserStories'),
-            func.sum(Report.blockedUserStories).label('blockedUserStories'),
-            func.sum(Report.cancelledUserStories).label('cancelledUserStories'),
-            func.sum(Report.deferredUserStories).label('deferredUserStories'),
-            func.sum(Report.notTestableUserStories).label('notTestableUserStories'),
-            # Test Cases - ALL fields
-            func.sum(Report.totalTestCases).label('totalTestCases'),
-            func.sum(Report.passedTestCases).label('passedTestCases'),
-            func.sum(Report.passedWithIssuesTestCases).label('passedWithIssuesTestCases'),
-            func.sum(Report.failedTestCases).label('failedTestCases'),
-            func.sum(Report.blockedTestCases).label('blockedTestCases'),
-            func.sum(Report.cancelledTestCases).label('cancelledTestCases'),
-            func.sum(Report.deferredTestCases).label('deferredTestCases'),
-            func.sum(Report.notTestableTestCases).label('notTestableTestCases'),
-            # Issues - ALL fields
-            func.sum(Report.totalIssues).label('totalIssues'),
-            func.sum(Report.criticalIssues).label('criticalIssues'),
-            func.sum(Report.highIssues).label('highIssues'),
-            func.sum(Report.mediumIssues).label('mediumIssues'),
-            func.sum(Report.lowIssues).label('lowIssues'),
-            func.sum(Report.newIssues).label('newIssues'),
-            func.sum(Report.fixedIssues).label('fixedIssues'),
-            func.sum(Report.notFixedIssues).label('notFixedIssues'),
-            func.sum(Report.reopenedIssues).label('reopenedIssues'),
-            func.sum(Report.deferredIssues).label('deferredIssues'),
-            # Enhancements - ALL fields
-            func.sum(Report.totalEnhancements).label('totalEnhancements'),
-            func.sum(Report.newEnhancements).label('newEnhancements'),
-            func.sum(Report.implementedEnhancements).label('implementedEnhancements'),
-            func.sum(Report.existsEnhancements).label('existsEnhancements'),
-            # Automation - ALL fields
-            func.sum(Report.automationTotalTestCases).label('automationTotalTests'),
-            func.sum(Report.automationPassedTestCases).label('automationPassedTests'),
-            func.sum(Report.automationFailedTestCases).label('automationFailedTests'),
-            func.sum(Report.automationSkippedTestCases).label('automationSkippedTests'),
-            func.sum(Report.automationStableTests).label('automationStableTests'),
-            func.sum(Report.automationFlakyTests).label('automationFlakyTests'),
-        ).group_by(Report.portfolioName, Report.projectName).all()
-        
-        # Get latest testing status for each project
-        latest_reports_subquery = db.session.query(
-            Report.portfolioName,
-            Report.projectName,
-            Report.testingStatus,
-            func.row_number().over(
-                partition_by=[Report.portfolioName, Report.projectName],
-                order_by=Report.reportDate.desc()
-            ).label('rn')
-        ).subquery()
-        
-        latest_statuses = db.session.query(
-            latest_reports_subquery.c.portfolioName,
-            latest_reports_subquery.c.projectName,
-            latest_reports_subquery.c.testingStatus
-        ).filter(latest_reports_subquery.c.rn == 1).all()
+        project_stats = ProjectStats.query.order_by(ProjectStats.portfolio_name, ProjectStats.project_name).all()
         
         # Create projects dictionary with detailed data
         projects_data = []
         for stat in project_stats:
+            metrics = stat.metrics_dict()
+            
             # Calculate success rates
-            total_user_stories = stat.totalUserStories or 0
-            total_test_cases = stat.totalTestCases or 0
-            total_issues = stat.totalIssues or 0
-            automation_total = stat.automationTotalTests or 0
+            total_user_stories = metrics['totalUserStories']
+            total_test_cases = metrics['totalTestCases']
+            total_issues = metrics['totalIssues']
+            automation_total = metrics['automationTotalTestCases']
             
             user_stories_success_rate = 0
             if total_user_stories > 0:
-                successful_user_stories = (stat.passedUserStories or 0) + (stat.passedWithIssuesUserStories or 0)
+                successful_user_stories = metrics['passedUserStories'] + metrics['passedWithIssuesUserStories']
                 user_stories_success_rate = round((successful_user_stories / total_user_stories) * 100, 1)
             
             test_cases_success_rate = 0
             if total_test_cases > 0:
-                successful_test_cases = (stat.passedTestCases or 0) + (stat.passedWithIssuesTestCases or 0)
+                successful_test_cases = metrics['passedTestCases'] + metrics['passedWithIssuesTestCases']
                 test_cases_success_rate = round((successful_test_cases / total_test_cases) * 100, 1)
             
             issues_resolution_rate = 0
             if total_issues > 0:
-                issues_resolution_rate = round(((stat.fixedIssues or 0) / total_issues) * 100, 1)
+                issues_resolution_rate = round((metrics['fixedIssues'] / total_issues) * 100, 1)
             
             automation_pass_rate = 0
             if automation_total > 0:
-                automation_pass_rate = round(((stat.automationPassedTests or 0) / automation_total) * 100, 1)
+                automation_pass_rate = round((metrics['automationPassedTestCases'] / automation_total) * 100, 1)
             
             # Determine risk level
             risk_level = 'Low'
-            if (stat.criticalIssues or 0) > 0:
+            if metrics['criticalIssues'] > 0:
                 risk_level = 'High'
-            elif (stat.highIssues or 0) > 0:
+            elif metrics['highIssues'] > 0:
                 risk_level = 'Medium'
             
-            # Get testing status
-            testing_status = 'pending'
-            for status in latest_statuses:
-                if status.portfolioName == stat.portfolioName and status.projectName == stat.projectName:
-                    testing_status = status.testingStatus
-                    break
-            
             projects_data.append({
-                'portfolioName': stat.portfolioName,
-                'projectName': stat.projectName,
-                'totalReports': stat.totalReports or 0,
-                'lastReportDate': stat.lastReportDate,
-                'testingStatus': testing_status,
+                'portfolioName': stat.portfolio_name,
+                'projectName': stat.project_name,
+                'totalReports': stat.total_reports or 0,
+                'lastReportDate': stat.last_report_date,
+                'testingStatus': stat.latest_testing_status,
                 'riskLevel': risk_level,
                 
                 # TOTALS - Main counts
                 'totalUserStories': total_user_stories,
                 'totalTestCases': total_test_cases,
                 'totalIssues': total_issues,
-                'totalEnhancements': stat.totalEnhancements or 0,
+                'totalEnhancements': metrics['totalEnhancements'],
                 
                 # USER STORIES - Complete breakdown
-                'passedUserStories': stat.passedUserStories or 0,
-                'passedWithIssuesUserStories': stat.passedWithIssuesUserStories or 0,
-                'failedUserStories': stat.failedUserStories or 0,
-                'blockedUserStories': stat.blockedUserStories or 0,
-                'cancelledUserStories': stat.cancelledUserStories or 0,
-                'deferredUserStories': stat.deferredUserStories or 0,
-                'notTestableUserStories': stat.notTestableUserStories or 0,
+                'passedUserStories': metrics['passedUserStories'],
+                'passedWithIssuesUserStories': metrics['passedWithIssuesUserStories'],
+                'failedUserStories': metrics['failedUserStories'],
+                'blockedUserStories': metrics['blockedUserStories'],
+                'cancelledUserStories': metrics['cancelledUserStories'],
+                'deferredUserStories': metrics['deferredUserStories'],
+                'notTestableUserStories': metrics['notTestableUserStories'],
                 'userStoriesSuccessRate': user_stories_success_rate,
                 
                 # TEST CASES - Complete breakdown
-                'passedTestCases': stat.passedTestCases or 0,
-                'passedWithIssuesTestCases': stat.passedWithIssuesTestCases or 0,
-                'failedTestCases': stat.failedTestCases or 0,
-                'blockedTestCases': stat.blockedTestCases or 0,
-                'cancelledTestCases': stat.cancelledTestCases or 0,
-                'deferredTestCases': stat.deferredTestCases or 0,
-                'notTestableTestCases': stat.notTestableTestCases or 0,
+                'passedTestCases': metrics['passedTestCases'],
+                'passedWithIssuesTestCases': metrics['passedWithIssuesTestCases'],
+                'failedTestCases': metrics['failedTestCases'],
+                'blockedTestCases': metrics['blockedTestCases'],
+                'cancelledTestCases': metrics['cancelledTestCases'],
+                'deferredTestCases': metrics['deferredTestCases'],
+                'notTestableTestCases': metrics['notTestableTestCases'],
                 'testCasesSuccessRate': test_cases_success_rate,
                 
                 # ISSUES - By Priority
-                'criticalIssues': stat.criticalIssues or 0,
-                'highIssues': stat.highIssues or 0,
-                'mediumIssues': stat.mediumIssues or 0,
-                'lowIssues': stat.lowIssues or 0,
+                'criticalIssues': metrics['criticalIssues'],
+                'highIssues': metrics['highIssues'],
+                'mediumIssues': metrics['mediumIssues'],
+                'lowIssues': metrics['lowIssues'],
                 
                 # ISSUES - By Status
-                'newIssues': stat.newIssues or 0,
-                'fixedIssues': stat.fixedIssues or 0,
-                'notFixedIssues': stat.notFixedIssues or 0,
-                'reopenedIssues': stat.reopenedIssues or 0,
-                'deferredIssues': stat.deferredIssues or 0,
+                'newIssues': metrics['newIssues'],
+                'fixedIssues': metrics['fixedIssues'],
+                'notFixedIssues': metrics['notFixedIssues'],
+                'reopenedIssues': metrics['reopenedIssues'],
+                'deferredIssues': metrics['deferredIssues'],
                 'issuesResolutionRate': issues_resolution_rate,
                 
                 # ENHANCEMENTS - Complete breakdown
-                'newEnhancements': stat.newEnhancements or 0,
-                'implementedEnhancements': stat.implementedEnhancements or 0,
-                'existsEnhancements': stat.existsEnhancements or 0,
+                'newEnhancements': metrics['newEnhancements'],
+                'implementedEnhancements': metrics['implementedEnhancements'],
+                'existsEnhancements': metrics['existsEnhancements'],
                 
                 # AUTOMATION - Complete breakdown
                 'automationTotalTests': automation_total,
-                'automationPassedTests': stat.automationPassedTests or 0,
-                'automationFailedTests': stat.automationFailedTests or 0,
-                'automationSkippedTests': stat.automationSkippedTests or 0,
-                'automationStableTests': stat.automationStableTests or 0,
-                'automationFlakyTests': stat.automationFlakyTests or 0,
+                'automationPassedTests': metrics['automationPassedTestCases'],
+                'automationFailedTests': metrics['automationFailedTestCases'],
+                'automationSkippedTests': metrics['automationSkippedTestCases'],
+                'automationStableTests': metrics['automationStableTests'],
+                'automationFlakyTests': metrics['automationFlakyTests'],
                 'automationPassRate': automation_pass_rate
             })
         
@@ -2174,7 +4752,8 @@ def get_cached_dashboard_stats():
         
     except Exception as e:
         # Fallback to original method if this fails
-        print(f"Cached endpoint failed, falling back to original method: {e}")
+        app.logger.warning(f"Cached endpoint failed, falling back to original method: {e}")
+        db.session.rollback()
         return get_dashboard_stats()
 
 @app.route('/project-statistics')
@@ -2182,42 +4761,31 @@ def get_cached_dashboard_stats():
 @approved_required
 def project_statistics():
     """Serves the project statistics HTML page."""
-    return render_template('project_statistics.html')
+    return render_page('project_statistics.html')
+
+def project_reports_filter(project):
+    """SQL condition selecting the reports linked to a managed project"""
+    return Report.project_id == project.id
 
 @app.route('/api/project-stats/<int:project_id>', methods=['GET'])
+@conditional_on_data_version
 def get_project_stats(project_id):
-    """Get all statistics for a specific project."""
-    print(f"Requesting stats for project ID: {project_id}")
+    """Get all statistics for a specific project.
+
+    Totals, chart data and time buckets come from grouped SQL queries. The
+    reports list holds summary columns by default; pass reports=full for
+    complete report dictionaries or reports=none to omit it.
+    """
+    from sqlalchemy import func
+
     project = Project.query.get_or_404(project_id)
-    print(f"Fetching stats for project: {project.name}")
-    
-    # Debug: check all reports and their project names
-    all_reports = Report.query.all()
-    print(f"Total reports in database: {len(all_reports)}")
-    for r in all_reports:
-        print(f"Report ID: {r.id}, Project Name: '{r.projectName}' (type: {type(r.projectName)})")
-    
-    # Make the query case-insensitive and trim whitespace
-    project_name = project.name.strip()
-    print(f"Looking for reports with project name: '{project_name}' (type: {type(project_name)})")
-    
-    # First try exact match
-    reports = Report.query.filter(Report.projectName == project_name).all()
-    
-    # If no matches, try case-insensitive search
-    if not reports:
-        print("No reports found with exact match, trying case-insensitive search")
-        reports = Report.query.filter(Report.projectName.ilike(f'%{project_name}%')).all()
-    
-    # If still no matches, try trimming and normalizing whitespace
-    if not reports:
-        print("No reports found with case-insensitive match, trying trimmed search")
-        reports = [r for r in all_reports if r.projectName and r.projectName.strip().lower() == project_name.lower()]
-    
-    print(f"Found {len(reports)} reports for project name: '{project_name}'")
+    reports_mode = request.args.get('reports', 'summary')
+    report_filter = project_reports_filter(project)
 
-    if not reports:
-        print(f"No reports found for project ID: {project_id}, project name: {project.name}")
+    metric_sums = [func.sum(getattr(Report, attr)).label(attr) for attr, _ in REPORT_ROLLUP_FIELDS]
+    aggregate = db.session.query(func.count(Report.id).label('totalReports'), *metric_sums).filter(report_filter).one()
+
+    if not aggregate.totalReports:
         # Instead of returning 404, return empty stats
         return jsonify({
             'overall': {
@@ -2258,20 +4826,25 @@ def get_project_stats(project_id):
             'time_stats': {'monthly': {}, 'quarterly': {}}
         })
 
+    totals = {attr: getattr(aggregate, attr) or 0 for attr, _ in REPORT_ROLLUP_FIELDS}
+
     # Calculate overall stats
-    total_reports = len(reports)
-    total_user_stories = sum(r.totalUserStories for r in reports)
-    total_test_cases = sum(r.totalTestCases for r in reports)
-    total_issues = sum(r.totalIssues for r in reports)
-    total_enhancements = sum(r.totalEnhancements for r in reports)
-    last_release = reports[-1].reportVersion if reports else 'N/A'
-    latest_release_number = reports[-1].releaseNumber if reports else 'N/A'
+    total_reports = aggregate.totalReports
+    total_user_stories = totals['totalUserStories']
+    total_test_cases = totals['totalTestCases']
+    total_issues = totals['totalIssues']
+    total_enhancements = totals['totalEnhancements']
+    latest_report = db.session.query(Report.reportVersion, Report.releaseNumber).filter(
+        report_filter
+    ).order_by(Report.id.desc()).first()
+    last_release = latest_report.reportVersion
+    latest_release_number = latest_report.releaseNumber
     
     # Calculate success rates
-    passed_user_stories = sum(r.passedUserStories for r in reports)
-    passed_test_cases = sum(r.passedTestCases for r in reports)
-    fixed_issues = sum(r.fixedIssues for r in reports)
-    implemented_enhancements = sum(r.implementedEnhancements for r in reports)
+    passed_user_stories = totals['passedUserStories']
+    passed_test_cases = totals['passedTestCases']
+    fixed_issues = totals['fixedIssues']
+    implemented_enhancements = totals['implementedEnhancements']
     
     user_story_success_rate = (passed_user_stories / total_user_stories * 100) if total_user_stories > 0 else 0
     test_case_success_rate = (passed_test_cases / total_test_cases * 100) if total_test_cases > 0 else 0
@@ -2279,38 +4852,53 @@ def get_project_stats(project_id):
     enhancement_completion_rate = (implemented_enhancements / total_enhancements * 100) if total_enhancements > 0 else 0
     
     # Calculate automation regression stats
-    total_automation_test_cases = sum(r.automationTotalTestCases or 0 for r in reports)
-    automation_passed_test_cases = sum(r.automationPassedTestCases or 0 for r in reports)
-    automation_failed_test_cases = sum(r.automationFailedTestCases or 0 for r in reports)
-    automation_skipped_test_cases = sum(r.automationSkippedTestCases or 0 for r in reports)
-    automation_stable_tests = sum(r.automationStableTests or 0 for r in reports)
-    automation_flaky_tests = sum(r.automationFlakyTests or 0 for r in reports)
+    total_automation_test_cases = totals['automationTotalTestCases']
+    automation_passed_test_cases = totals['automationPassedTestCases']
+    automation_failed_test_cases = totals['automationFailedTestCases']
+    automation_skipped_test_cases = totals['automationSkippedTestCases']
+    automation_stable_tests = totals['automationStableTests']
+    automation_flaky_tests = totals['automationFlakyTests']
     
     # Calculate automation rates
     automation_pass_rate = (automation_passed_test_cases / total_automation_test_cases * 100) if total_automation_test_cases > 0 else 0
     automation_stability_rate = (automation_stable_tests / (automation_stable_tests + automation_flaky_tests) * 100) if (automation_stable_tests + automation_flaky_tests) > 0 else 0
     
-    # Get unique testers
+    # Get unique testers (first occurrence by email, or by name when a report has none, in report order)
     testers = []
     tester_emails = set()
-    for r in reports:
-        for tester in json.loads(r.testerData):
-            if tester['email'] not in tester_emails:
-                testers.append(tester)
-                tester_emails.add(tester['email'])
+    report_testers = ReportTester.query.join(Report, ReportTester.report_id == Report.id).filter(
+        report_filter
+    ).order_by(ReportTester.report_id, ReportTester.position)
+    for report_tester in report_testers:
+        tester = report_tester.to_item()
+        tester_key = tester.get('email') or tester.get('name') if isinstance(tester, dict) else None
+        if tester_key is not None and tester_key not in tester_emails:
+            testers.append(tester)
+            tester_emails.add(tester_key)
 
-    # Time-based stats
+    # Time-based stats, bucketed from per-date counts
     monthly_stats = {}
     quarterly_stats = {}
-    for r in reports:
-        try:
-            report_date = datetime.strptime(r.reportDate, '%d-%m-%Y')
-            month_key = report_date.strftime('%Y-%m')
-            quarter_key = f"{report_date.year}-Q{ (report_date.month - 1) // 3 + 1 }"
-            monthly_stats[month_key] = monthly_stats.get(month_key, 0) + 1
-            quarterly_stats[quarter_key] = quarterly_stats.get(quarter_key, 0) + 1
-        except (ValueError, TypeError):
-            continue
+    date_counts = db.session.query(Report.reportDateValue, func.count(Report.id)).filter(
+        report_filter, Report.reportDateValue.isnot(None)
+    ).group_by(Report.reportDateValue).order_by(Report.reportDateValue)
+    for report_date, count in date_counts:
+        month_key = report_date.strftime('%Y-%m')
+        quarter_key = f"{report_date.year}-Q{ (report_date.month - 1) // 3 + 1 }"
+        monthly_stats[month_key] = monthly_stats.get(month_key, 0) + count
+        quarterly_stats[quarter_key] = quarterly_stats.get(quarter_key, 0) + count
+
+    # Reports list
+    if reports_mode == 'full':
+        reports = report_payloads(report_columns_query().filter(report_filter).order_by(Report.id).all())
+    elif reports_mode == 'none':
+        reports = []
+    else:
+        fields = list(REPORT_SUMMARY_FIELDS)
+        reports = [
+            report_row_dict(row, fields)
+            for row in db.session.query(*[getattr(Report, field) for field in fields]).filter(report_filter).order_by(Report.id)
+        ]
 
     # Prepare data for charts
     chart_data = {
@@ -2318,13 +4906,13 @@ def get_project_stats(project_id):
             'labels': ['Passed', 'Passed with Issues', 'Failed', 'Blocked', 'Cancelled', 'Deferred', 'Not Testable'],
             'datasets': [{
                 'data': [
-                    sum(r.passedUserStories for r in reports),
-                    sum(r.passedWithIssuesUserStories for r in reports),
-                    sum(r.failedUserStories for r in reports),
-                    sum(r.blockedUserStories for r in reports),
-                    sum(r.cancelledUserStories for r in reports),
-                    sum(r.deferredUserStories for r in reports),
-                    sum(r.notTestableUserStories for r in reports)
+                    totals['passedUserStories'],
+                    totals['passedWithIssuesUserStories'],
+                    totals['failedUserStories'],
+                    totals['blockedUserStories'],
+                    totals['cancelledUserStories'],
+                    totals['deferredUserStories'],
+                    totals['notTestableUserStories']
                 ],
                 'backgroundColor': ['#4CAF50', '#FFC107', '#F44336', '#9E9E9E', '#2196F3', '#673AB7', '#00BCD4'],
                 'borderWidth': 3,
@@ -2335,13 +4923,13 @@ def get_project_stats(project_id):
             'labels': ['Passed', 'Passed with Issues', 'Failed', 'Blocked', 'Cancelled', 'Deferred', 'Not Testable'],
             'datasets': [{
                 'data': [
-                    sum(r.passedTestCases for r in reports),
-                    sum(r.passedWithIssuesTestCases for r in reports),
-                    sum(r.failedTestCases for r in reports),
-                    sum(r.blockedTestCases for r in reports),
-                    sum(r.cancelledTestCases for r in reports),
-                    sum(r.deferredTestCases for r in reports),
-                    sum(r.notTestableTestCases for r in reports)
+                    totals['passedTestCases'],
+                    totals['passedWithIssuesTestCases'],
+                    totals['failedTestCases'],
+                    totals['blockedTestCases'],
+                    totals['cancelledTestCases'],
+                    totals['deferredTestCases'],
+                    totals['notTestableTestCases']
                 ],
                 'backgroundColor': ['#8BC34A', '#FFEB3B', '#E91E63', '#607D8B', '#9C27B0', '#FF5722', '#795548'],
                 'borderWidth': 3,
@@ -2352,10 +4940,10 @@ def get_project_stats(project_id):
             'labels': ['Critical', 'High', 'Medium', 'Low'],
             'datasets': [{
                 'data': [
-                    sum(r.criticalIssues for r in reports),
-                    sum(r.highIssues for r in reports),
-                    sum(r.mediumIssues for r in reports),
-                    sum(r.lowIssues for r in reports)
+                    totals['criticalIssues'],
+                    totals['highIssues'],
+                    totals['mediumIssues'],
+                    totals['lowIssues']
                 ],
                 'backgroundColor': ['#F44336', '#FF9800', '#FFC107', '#4CAF50'],
                 'borderWidth': 3,
@@ -2366,11 +4954,11 @@ def get_project_stats(project_id):
             'labels': ['New', 'Fixed', 'Not Fixed', 'Re-opened', 'Deferred'],
             'datasets': [{
                 'data': [
-                    sum(r.newIssues for r in reports),
-                    sum(r.fixedIssues for r in reports),
-                    sum(r.notFixedIssues for r in reports),
-                    sum(r.reopenedIssues for r in reports),
-                    sum(r.deferredIssues for r in reports)
+                    totals['newIssues'],
+                    totals['fixedIssues'],
+                    totals['notFixedIssues'],
+                    totals['reopenedIssues'],
+                    totals['deferredIssues']
                 ],
                 'backgroundColor': ['#2196F3', '#4CAF50', '#E91E63', '#FF5722', '#673AB7'],
                 'borderWidth': 3,
@@ -2432,106 +5020,529 @@ def get_project_stats(project_id):
         },
         'charts': chart_data,
         'testers': testers,
-        'reports': [r.to_dict() for r in reports],
+        'reports': reports,
         'time_stats': {
             'monthly': monthly_stats,
             'quarterly': quarterly_stats
         }
     })
 
+# --- Schema Migrations ---
+def move_report_lists_to_child_tables(blob_columns):
+    """Copy report list fields stored as JSON columns into their child tables, then drop the columns.
 
+    Returns the number of child rows written. A value that is not valid JSON
+    is kept as a single entry holding its raw text, so it survives the
+    columns being dropped. Columns that SQLite cannot drop (before 3.35) are
+    emptied instead so they are not copied again.
+    """
+    from sqlalchemy import insert
 
-def migrate_database():
-    """Handle database migration for new fields"""
-    import sqlite3
-    import os
-    
-    db_path = os.path.join(basedir, 'reports.db')
-    
-    if os.path.exists(db_path):
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Check existing columns in report table
-        cursor.execute("PRAGMA table_info(report)")
-        columns = [column[1] for column in cursor.fetchall()]
-        
-        # Add missing columns to report table
-        migrations = [
-            ('releaseNumber', 'VARCHAR(50)'),
-            ('qaNotesData', 'TEXT DEFAULT "[]"'),
-            ('qaNoteFieldsData', 'TEXT DEFAULT "[]"'),
-            ('automationPassedTestCases', 'INTEGER DEFAULT 0'),
-            ('automationFailedTestCases', 'INTEGER DEFAULT 0'),
-            ('automationSkippedTestCases', 'INTEGER DEFAULT 0'),
-            ('automationTotalTestCases', 'INTEGER DEFAULT 0'),
-            ('automationPassedPercentage', 'REAL DEFAULT 0.0'),
-            ('automationFailedPercentage', 'REAL DEFAULT 0.0'),
-            ('automationSkippedPercentage', 'REAL DEFAULT 0.0'),
-            ('automationStableTests', 'INTEGER DEFAULT 0'),
-            ('automationFlakyTests', 'INTEGER DEFAULT 0'),
-            ('automationStabilityTotal', 'INTEGER DEFAULT 0'),
-            ('automationStablePercentage', 'REAL DEFAULT 0.0'),
-            ('automationFlakyPercentage', 'REAL DEFAULT 0.0')
-        ]
-        
-        for column_name, column_type in migrations:
-            if column_name not in columns:
+    moved = 0
+    for field in blob_columns:
+        model = report_list_model(field)
+        unreadable = []
+        last_id = 0
+        while True:
+            batch = db.session.execute(db.text(
+                f'SELECT id, "{field}" FROM report WHERE id > :last_id AND "{field}" IS NOT NULL ORDER BY id LIMIT 1000'
+            ), {'last_id': last_id}).all()
+            if not batch:
+                break
+            last_id = batch[-1][0]
+            rows = []
+            for report_id, blob in batch:
                 try:
-                    cursor.execute(f"ALTER TABLE report ADD COLUMN {column_name} {column_type}")
-                    conn.commit()
-                    print(f"Added {column_name} column to existing database")
-                except sqlite3.Error as e:
-                    print(f"Error adding {column_name} column: {e}")
-        
-        # Check existing columns in tester table and add role fields
-        cursor.execute("PRAGMA table_info(tester)")
-        tester_columns = [column[1] for column in cursor.fetchall()]
-        
-        tester_migrations = [
-            ('is_automation_engineer', 'BOOLEAN DEFAULT 0'),
-            ('is_manual_engineer', 'BOOLEAN DEFAULT 0'),
-            ('is_performance_tester', 'BOOLEAN DEFAULT 0'),
-            ('is_security_tester', 'BOOLEAN DEFAULT 0'),
-            ('is_api_tester', 'BOOLEAN DEFAULT 0'),
-            ('is_mobile_tester', 'BOOLEAN DEFAULT 0'),
-            ('is_web_tester', 'BOOLEAN DEFAULT 0'),
-            ('is_accessibility_tester', 'BOOLEAN DEFAULT 0'),
-            ('is_usability_tester', 'BOOLEAN DEFAULT 0'),
-            ('is_test_lead', 'BOOLEAN DEFAULT 0')
+                    items = json.loads(blob)
+                except ValueError:
+                    unreadable.append(report_id)
+                    items = [blob]
+                if not isinstance(items, list):
+                    items = [items]
+                rows.extend(
+                    dict(model.from_item(item, position).item_values(), report_id=report_id)
+                    for position, item in enumerate(items)
+                )
+            if rows:
+                db.session.execute(insert(model), rows)
+                moved += len(rows)
+        if unreadable:
+            app.logger.error(
+                f"{field} of {len(unreadable)} reports is not valid JSON; kept as a single entry holding "
+                f"the raw text. Report ids: {', '.join(map(str, unreadable))}"
+            )
+        db.session.execute(db.text(f'UPDATE report SET "{field}" = NULL'))
+    db.session.commit()
+    
+    # The old search triggers read qaNotesData; install_report_search recreates them
+    for trigger in ('report_search_ai', 'report_search_au'):
+        db.session.execute(db.text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    db.session.commit()
+    for field in blob_columns:
+        try:
+            db.session.execute(db.text(f'ALTER TABLE report DROP COLUMN "{field}"'))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.warning(f"Kept emptied {field} column: {e}")
+    return moved
+
+def normalize_report_json_columns():
+    """Rewrite report JSON columns that are not stored the way dump_json_blob writes them.
+
+    to_dict splices these columns into responses unchanged, so they must hold
+    valid JSON in the response encoding. An unreadable value becomes a list
+    holding its raw text as the single entry. Returns the number of values
+    rewritten.
+    """
+    rewritten = 0
+    for field in REPORT_JSON_FIELDS:
+        unreadable = []
+        try:
+            candidates = db.session.execute(db.text(
+                f'SELECT id, "{field}" FROM report WHERE "{field}" IS NOT NULL AND "{field}" != \'[]\' '
+                f'AND (NOT json_valid("{field}") OR "{field}" != json("{field}") OR instr("{field}", \'\\u\') > 0)'
+            )).all()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.warning(f"Could not check {field} values: {e}")
+            continue
+        for report_id, text in candidates:
+            try:
+                canonical = dump_json_blob(json.loads(text))
+            except ValueError:
+                unreadable.append(report_id)
+                canonical = dump_json_blob([text])
+            if canonical != text:
+                db.session.execute(db.text(f'UPDATE report SET "{field}" = :value WHERE id = :id'), {'value': canonical, 'id': report_id})
+                rewritten += 1
+        if unreadable:
+            app.logger.error(
+                f"{field} of {len(unreadable)} reports is not valid JSON; wrapped the raw text in a list. "
+                f"Report ids: {', '.join(map(str, unreadable))}"
+            )
+    db.session.commit()
+    return rewritten
+
+class SchemaVersion(db.Model):
+    """One row per applied schema migration"""
+    __tablename__ = 'schema_version'
+    version = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    name = db.Column(db.String(100), nullable=False)
+    applied_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    duration_ms = db.Column(db.Float)
+
+class Migration:
+    """A numbered schema change, with an estimate of the rows it touches for dry runs"""
+
+    def __init__(self, version, name, apply, estimate, transactional):
+        self.version = version
+        self.name = name
+        self.apply = apply
+        self.estimate = estimate
+        self.transactional = transactional
+
+MIGRATIONS = []
+# Rows read and written per commit by migrations that backfill large tables
+MIGRATION_BATCH_SIZE = 1000
+
+def migration(version, name, estimate=None, transactional=True):
+    """Register the decorated function as schema migration `version`.
+
+    Transactional migrations run in one transaction, DDL included, together
+    with their schema_version row. Long backfills pass transactional=False and
+    commit each batch themselves, so they must be safe to run again if
+    interrupted.
+    """
+    def register(apply):
+        MIGRATIONS.append(Migration(version, name, apply, estimate or (lambda: 0), transactional))
+        MIGRATIONS.sort(key=lambda item: item.version)
+        return apply
+    return register
+
+def table_columns(table_name):
+    """Column names of table_name, or an empty set if it does not exist"""
+    from sqlalchemy import inspect
+    inspector = inspect(db.session.connection())
+    if not inspector.has_table(table_name):
+        return set()
+    return {column['name'] for column in inspector.get_columns(table_name)}
+
+def count_rows(sql, params=None):
+    """The count a migration estimate queries for, or None if the tables are not in that shape yet"""
+    from sqlalchemy.exc import DBAPIError
+    try:
+        return db.session.execute(db.text(sql), params or {}).scalar() or 0
+    except DBAPIError:
+        db.session.rollback()
+        return None
+
+def backfill_in_batches(select_sql, update_batch):
+    """Pass the rows of select_sql to update_batch a batch at a time, committing after each.
+
+    select_sql must select the id first, filter on id > :last_id and order by
+    id, and is run with :batch_size as its LIMIT. Returns the rows processed.
+    """
+    processed = 0
+    last_id = 0
+    while True:
+        batch = db.session.execute(db.text(select_sql), {'last_id': last_id, 'batch_size': MIGRATION_BATCH_SIZE}).all()
+        if not batch:
+            return processed
+        update_batch(batch)
+        db.session.commit()
+        last_id = batch[-1][0]
+        processed += len(batch)
+
+LEGACY_REPORT_COLUMNS = [
+    ('releaseNumber', 'VARCHAR(50)'),
+    ('qaNoteFieldsData', "TEXT DEFAULT '[]'"),
+    ('automationPassedTestCases', 'INTEGER DEFAULT 0'),
+    ('automationFailedTestCases', 'INTEGER DEFAULT 0'),
+    ('automationSkippedTestCases', 'INTEGER DEFAULT 0'),
+    ('automationTotalTestCases', 'INTEGER DEFAULT 0'),
+    ('automationPassedPercentage', 'REAL DEFAULT 0.0'),
+    ('automationFailedPercentage', 'REAL DEFAULT 0.0'),
+    ('automationSkippedPercentage', 'REAL DEFAULT 0.0'),
+    ('automationStableTests', 'INTEGER DEFAULT 0'),
+    ('automationFlakyTests', 'INTEGER DEFAULT 0'),
+    ('automationStabilityTotal', 'INTEGER DEFAULT 0'),
+    ('automationStablePercentage', 'REAL DEFAULT 0.0'),
+    ('automationFlakyPercentage', 'REAL DEFAULT 0.0'),
+    ('reportDateValue', 'DATE'),
+    ('portfolio_id', 'INTEGER REFERENCES portfolio(id)'),
+    ('project_id', 'INTEGER REFERENCES project(id)')
+]
+
+LEGACY_TESTER_COLUMNS = [
+    ('is_automation_engineer', 'BOOLEAN DEFAULT 0'),
+    ('is_manual_engineer', 'BOOLEAN DEFAULT 0'),
+    ('is_performance_tester', 'BOOLEAN DEFAULT 0'),
+    ('is_security_tester', 'BOOLEAN DEFAULT 0'),
+    ('is_api_tester', 'BOOLEAN DEFAULT 0'),
+    ('is_mobile_tester', 'BOOLEAN DEFAULT 0'),
+    ('is_web_tester', 'BOOLEAN DEFAULT 0'),
+    ('is_accessibility_tester', 'BOOLEAN DEFAULT 0'),
+    ('is_usability_tester', 'BOOLEAN DEFAULT 0'),
+    ('is_test_lead', 'BOOLEAN DEFAULT 0')
+]
+
+def add_missing_columns(table_name, columns):
+    existing = table_columns(table_name)
+    for column_name, column_type in columns:
+        if column_name not in existing:
+            db.session.execute(db.text(f'ALTER TABLE {table_name} ADD COLUMN "{column_name}" {column_type}'))
+            app.logger.info(f"Added {column_name} column to {table_name} table")
+
+@migration(1, 'add_report_columns')
+def add_report_columns():
+    add_missing_columns('report', LEGACY_REPORT_COLUMNS)
+
+REPORT_DATE_BACKFILL_WHERE = '"reportDate" IS NOT NULL AND "reportDateValue" IS NULL'
+
+def _count_report_dates_to_backfill():
+    if 'reportDateValue' not in table_columns('report'):
+        return count_rows('SELECT count(*) FROM report WHERE "reportDate" IS NOT NULL')
+    return count_rows(f'SELECT count(*) FROM report WHERE {REPORT_DATE_BACKFILL_WHERE}')
+
+@migration(2, 'backfill_report_date_value', transactional=False, estimate=_count_report_dates_to_backfill)
+def backfill_report_date_value():
+    def update_batch(batch):
+        updates = [
+            {'id': report_id, 'value': parsed}
+            for report_id, report_date in batch
+            if (parsed := parse_report_date(report_date))
         ]
-        
-        for column_name, column_type in tester_migrations:
-            if column_name not in tester_columns:
-                try:
-                    cursor.execute(f"ALTER TABLE tester ADD COLUMN {column_name} {column_type}")
-                    conn.commit()
-                    print(f"Added {column_name} column to tester table")
-                except sqlite3.Error as e:
-                    print(f"Error adding {column_name} column to tester table: {e}")
-        
-        conn.close()
+        if updates:
+            db.session.execute(db.text('UPDATE report SET "reportDateValue" = :value WHERE id = :id'), updates)
 
-if __name__ == '__main__':
-    with app.app_context():
-        # This will create the database file and the 'report' table if they don't exist.
+    processed = backfill_in_batches(
+        f'SELECT id, "reportDate" FROM report WHERE id > :last_id AND {REPORT_DATE_BACKFILL_WHERE} '
+        'ORDER BY id LIMIT :batch_size',
+        update_batch,
+    )
+    app.logger.info(f"Backfilled reportDateValue for {processed} reports")
+
+# Indexes for per-project and status queries
+@migration(3, 'add_report_indexes', estimate=lambda: count_rows('SELECT count(*) FROM report'))
+def add_report_indexes():
+    for index in Report.__table__.indexes:
+        index.create(db.session.connection(), checkfirst=True)
+
+@migration(4, 'add_tester_role_columns')
+def add_tester_role_columns():
+    add_missing_columns('tester', LEGACY_TESTER_COLUMNS)
+
+# The stats tables are pure rollups of the report table. Older databases hold
+# them in a narrower shape; their rows also take portfolio/project ids from
+# reports, which are linked here for databases that predate those columns.
+@migration(5, 'rebuild_stats_rollups', transactional=False, estimate=lambda: count_rows('SELECT count(*) FROM report'))
+def rebuild_stats_rollups():
+    dashboard_stats_columns = table_columns('dashboard_stats')
+    if dashboard_stats_columns and 'passed_user_stories' not in dashboard_stats_columns:
+        for table_name in ('project_stats', 'portfolio_stats', 'dashboard_stats'):
+            db.session.execute(db.text(f"DROP TABLE IF EXISTS {table_name}"))
+        db.session.commit()
+        app.logger.info("Dropped outdated statistics tables")
         db.create_all()
-        # Handle migration for existing databases
-        migrate_database()
-        
-        # Create default admin user if no users exist
-        if User.query.count() == 0:
-            admin_user = User(
-                first_name='Admin',
-                last_name='User',
-                email='admin@example.com',
-                role='admin',
-                is_approved=True
-            )
-            admin_user.set_password('admin123')  # Change this password!
-            db.session.add(admin_user)
+    relinked = relink_reports()
+    db.session.commit()
+    app.logger.info(f"Linked reports to portfolios and projects ({relinked} name pairs)")
+    update_stats_cache()
+    app.logger.info("Rebuilt statistics rollup tables")
+
+def _report_blob_columns():
+    """JSON list columns still on the report table of a database that predates the child tables"""
+    columns = table_columns('report')
+    return [field for field in REPORT_LIST_FIELDS if field in columns]
+
+def _count_reports_with_blobs():
+    blob_columns = _report_blob_columns()
+    if not blob_columns:
+        return 0
+    return count_rows('SELECT count(*) FROM report WHERE ' + ' OR '.join(f'"{field}" IS NOT NULL' for field in blob_columns))
+
+@migration(6, 'move_report_lists_to_child_tables', transactional=False, estimate=_count_reports_with_blobs)
+def move_report_lists_migration():
+    blob_columns = _report_blob_columns()
+    if blob_columns:
+        moved = move_report_lists_to_child_tables(blob_columns)
+        app.logger.info(f"Moved {moved} report list entries into child tables")
+
+@migration(7, 'normalize_report_json_columns', transactional=False, estimate=lambda: count_rows(
+    'SELECT count(*) FROM report WHERE "qaNoteFieldsData" IS NOT NULL') if db.engine.dialect.name == 'sqlite' else 0)
+def normalize_report_json_migration():
+    # Values written by this app through dump_json_blob are canonical already;
+    # the check relies on SQLite's JSON functions
+    if db.engine.dialect.name != 'sqlite':
+        return
+    normalized = normalize_report_json_columns()
+    if normalized:
+        app.logger.info(f"Rewrote {normalized} report JSON values in canonical form")
+
+def applied_schema_version():
+    """The highest applied migration version: 0 if none, None if the schema is not versioned yet"""
+    from sqlalchemy.exc import DBAPIError
+    try:
+        return db.session.execute(db.text("SELECT max(version) FROM schema_version")).scalar() or 0
+    except DBAPIError:
+        db.session.rollback()
+        return None
+
+def pending_migrations():
+    """Migrations newer than the database's schema version, in the order they apply"""
+    version = applied_schema_version() or 0
+    return [item for item in MIGRATIONS if item.version > version]
+
+def migrate_database(dry_run=False):
+    """Apply pending schema migrations in version order.
+
+    A new database is created complete by db.create_all() and stamped with the
+    latest version. Databases that predate versioned migrations run all of
+    them; each migration checks what is already in place. With dry_run only
+    the pending migrations and their estimated rows touched are printed.
+    Returns the migrations that were (or would be) applied.
+    """
+    from sqlalchemy import inspect
+    new_database = not inspect(db.engine).has_table('report')
+    latest = MIGRATIONS[-1].version
+
+    if new_database:
+        if dry_run:
+            app.logger.info(f"Would create all tables at schema version {latest}")
+            return []
+        db.create_all()
+        db.session.add_all(SchemaVersion(version=item.version, name=item.name, duration_ms=0) for item in MIGRATIONS)
+        db.session.commit()
+        app.logger.info(f"Created database at schema version {latest}")
+        return []
+
+    pending = pending_migrations()
+    if dry_run:
+        for item in pending:
+            rows = item.estimate()
+            app.logger.info(f"Would apply migration {item.version} {item.name} (~{'?' if rows is None else rows} rows)")
+        if not pending:
+            app.logger.info(f"Schema is up to date at version {latest}")
+        return pending
+
+    db.create_all()
+    for item in pending:
+        started = time.perf_counter()
+        db.session.commit()
+        if item.transactional and db.engine.dialect.name == 'sqlite':
+            # pysqlite commits before DDL unless a transaction was begun explicitly
+            db.session.execute(db.text('BEGIN'))
+        try:
+            item.apply()
+            db.session.add(SchemaVersion(
+                version=item.version, name=item.name, duration_ms=round((time.perf_counter() - started) * 1000, 2)
+            ))
             db.session.commit()
-            print("Default admin user created: admin@example.com / admin123")
+        except Exception:
+            db.session.rollback()
+            app.logger.error(f"Migration {item.version} {item.name} failed; the schema stays at the previous version")
+            raise
+        app.logger.info(f"Applied migration {item.version} {item.name} in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return pending
+
+# --- Application Startup ---
+boot_stats = {'pid': os.getpid(), 'import_seconds': None, 'create_app_seconds': None, 'steps': {}}
+_app_created = False
+
+metrics.define('process_boot_seconds', 'gauge', 'Seconds spent importing the app, in create_app and booting a worker.')
+metrics.define('process_resident_memory_bytes', 'gauge', 'Resident memory of each process.')
+metrics.define('process_shared_memory_bytes', 'gauge', 'Resident memory of each process that is shared with others, e.g. copy-on-write with a preloading master.')
+
+def process_memory():
+    """(resident, shared) bytes of this process; shared is None where it cannot be measured"""
+    try:
+        fields = {}
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                if value.strip().endswith('kB'):
+                    fields[name] = int(value.split()[0]) * 1024
+        return fields['Rss'], fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0)
+    except (OSError, KeyError, ValueError):
+        import resource
+        import sys
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss * (1 if sys.platform == 'darwin' else 1024), None
+
+def _collect_process_metrics():
+    """Copy this process's boot times and memory use into the registry"""
+    pid = (('pid', str(os.getpid())),)
+    for phase in ('import', 'create_app', 'worker'):
+        seconds = boot_stats.get(f'{phase}_seconds')
+        if seconds is not None:
+            metrics.set('process_boot_seconds', seconds, pid + (('phase', phase),))
+    resident, shared = process_memory()
+    metrics.set('process_resident_memory_bytes', resident, pid)
+    if shared is not None:
+        metrics.set('process_shared_memory_bytes', shared, pid)
+
+metrics.collectors.append(_collect_process_metrics)
+
+def report_boot(role):
+    """Print how long this process took to start and how much memory it holds"""
+    resident, shared = process_memory()
+    boot_stats.update(pid=os.getpid(), resident_bytes=resident, shared_bytes=shared)
+    timings = ', '.join(
+        f"{phase} {boot_stats[f'{phase}_seconds'] * 1000:.0f} ms" for phase in ('import', 'create_app', 'worker')
+        if boot_stats.get(f'{phase}_seconds') is not None
+    )
+    memory = f"RSS {resident / 2**20:.1f} MB" + (f" ({shared / 2**20:.1f} MB shared)" if shared is not None else '')
+    app.logger.info(f"{role.capitalize()} {os.getpid()} ready: {timings}; {memory}")
+
+def check_schema_version():
+    """Warn when the database has migrations this code expects but that were not applied"""
+    version = applied_schema_version()
+    latest = MIGRATIONS[-1].version
+    if version != latest:
+        app.logger.warning(f"Database schema is at version {version or 0} but this code expects {latest}; run `flask --app app:create_app migrate`")
+    return version
+
+def create_app(config=None):
+    """Finish setting up the app for serving and return it.
+
+    The routes are registered on the module-level app at import; this applies
+    config overrides, then binds the database and sizes the caches from the
+    result, timing each startup step. Overriding SQLALCHEMY_DATABASE_URI
+    alone also picks the engine options for that database. The app is set up
+    once per process, so passing config to a later call raises RuntimeError.
+    It only checks the schema version: run `flask --app app:create_app migrate`
+    once per deploy first. Servers that fork workers should call it in the
+    master process (see wsgi.py and gunicorn.conf.py) so the workers share its
+    memory.
+    """
+    global _app_created
+    if _app_created:
+        if config:
+            raise RuntimeError(f"create_app() already ran in this process; cannot apply {', '.join(sorted(config))}")
+        return app
+    started = time.perf_counter()
+    config = dict(config or {})
+    if 'SQLALCHEMY_DATABASE_URI' in config:
+        config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(config['SQLALCHEMY_DATABASE_URI']))
+    app.config.update(config)
+    if app.config['TRUSTED_PROXY_HOPS']:
+        from werkzeug.middleware.proxy_fix import ProxyFix
+        hops = app.config['TRUSTED_PROXY_HOPS']
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops, x_host=hops)
+    db.init_app(app)
+    response_cache.configure(app.config['RESPONSE_CACHE_MAX_ENTRIES'], app.config['RESPONSE_CACHE_TTL'])
+    with app.app_context():
+        for step, run in (
+            ('database_engine', lambda: _time_pool_checkouts(db.engine)),
+            ('static_manifest', static_manifest.build),
+            ('schema_version_check', check_schema_version),
+        ):
+            step_started = time.perf_counter()
+            run()
+            boot_stats['steps'][step] = round((time.perf_counter() - step_started) * 1000, 2)
+    boot_stats['create_app_seconds'] = time.perf_counter() - started
+    _app_created = True
+    report_boot('app')
+    return app
+
+def init_worker(boot_seconds=None):
+    """Per-process setup for a server worker, after it has been forked.
+
+    Pooled connections inherited from the master are dropped without closing
+    them, since the master still owns them, and the worker starts its own
+    statistics refresh thread (threads do not survive a fork).
+    """
+    with app.app_context():
+        db.engine.dispose(close=False)
+    start_stats_refresh_scheduler()
+    boot_stats['worker_seconds'] = boot_seconds
+    report_boot('worker')
+
+def create_default_admin():
+    """Create the default admin user if there are no users yet"""
+    if User.query.count() == 0:
+        admin_user = User(
+            first_name='Admin',
+            last_name='User',
+            email='admin@example.com',
+            role='admin',
+            is_approved=True
+        )
+        admin_user.set_password('admin123')  # Change this password!
+        db.session.add(admin_user)
+        db.session.commit()
+        app.logger.info("Default admin user created: admin@example.com / admin123")
+
+def run_migrations(dry_run=False):
+    """Apply pending schema migrations, then set up search and the admin user"""
+    applied = migrate_database(dry_run=dry_run)
+    if not dry_run:
+        install_report_search()
+        create_default_admin()
+    return applied
+
+@app.cli.command('migrate')
+@click.option('--dry-run', is_flag=True, help='List pending migrations and the rows they would touch without applying them.')
+def migrate_command(dry_run):
+    """Bring the database schema up to date; run once per deploy, before starting workers."""
+    create_app()
+    started = time.perf_counter()
+    applied = run_migrations(dry_run=dry_run)
+    if not dry_run:
+        click.echo(f"Applied {len(applied)} migrations in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+boot_stats['import_seconds'] = time.perf_counter() - _import_started
+
+if __name__ == '__main__':
+    create_app()
+    with app.app_context():
+        # The development server migrates on start; deployments run `flask --app app:create_app migrate`
+        run_migrations()
+    
+    # The debug reloader runs this block in a watcher process too; only the
+    # serving process should refresh the statistics cache.
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_stats_refresh_scheduler()
     
     app.run(debug=True, port=5001)
-
@@ -1,7 +1,39 @@
 import os
 
+basedir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+def engine_options(database_uri):
+    """SQLAlchemy engine options for database_uri.
+
+    SQLite gets its pragmas on connect instead (see apply_sqlite_pragmas in
+    app.py); server databases get a sized connection pool whose connections
+    are recycled before the server's idle timeout and checked before use.
+    """
+    if database_uri.startswith('sqlite'):
+        return {}
+    return {
+        'pool_size': _env_int('DB_POOL_SIZE', 10),
+        'max_overflow': _env_int('DB_MAX_OVERFLOW', 20),
+        'pool_timeout': _env_int('DB_POOL_TIMEOUT', 30),
+        'pool_recycle': _env_int('DB_POOL_RECYCLE', 1800),
+        'pool_pre_ping': True,
+    }
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///reports.db'
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///' + os.path.join(basedir, 'reports.db')
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file upload
\ No newline at end of file
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file upload
+
+    # SQLite pragmas applied to every new connection. WAL lets readers carry on
+    # while a report is being written; NORMAL sync is durable across app crashes
+    # in WAL mode. cache_size is in KiB (applied as a negative page count).
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = _env_int('SQLITE_BUSY_TIMEOUT_MS', 5000)
+    SQLITE_CACHE_SIZE_KB = _env_int('SQLITE_CACHE_SIZE_KB', 64 * 1024)
+    SQLITE_MMAP_SIZE = _env_int('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)
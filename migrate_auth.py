@@ -2,10 +2,11 @@
 """
 Migration script to add authentication to existing Sprint Reports System
 """
-from app import app, db, User
+from app import create_app, db, User
 
 def migrate_to_auth():
     """Migrate existing database to include authentication"""
+    app = create_app()
     with app.app_context():
         print("Starting authentication migration...")
         
@@ -0,0 +1,213 @@
+# benchmark.py
+"""
+Offline benchmark for the reports API.
+
+Generates synthetic reports with the generators in sample_reports.py
+straight into a scratch SQLite database, then drives the main read and
+write endpoints through the Flask test client and prints latency
+percentiles, SQL statements per request and peak memory as JSON.
+
+    python scripts/benchmark.py --reports 100000 --portfolios 20 --projects 10
+
+No server needs to be running, and the real reports.db is never touched.
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+
+import sample_reports as generators
+
+INSERT_BATCH_SIZE = 5000
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--reports', type=int, default=10000, help='synthetic reports to generate (default 10000)')
+    parser.add_argument('--portfolios', type=int, default=20, help='distinct portfolios (default 20)')
+    parser.add_argument('--projects', type=int, default=10, help='projects per portfolio (default 10)')
+    parser.add_argument('--requests', type=int, default=50, help='timed requests per endpoint (default 50)')
+    parser.add_argument('--database', help='scratch SQLite file (default: a new temporary file)')
+    parser.add_argument('--reuse', action='store_true', help='benchmark an existing --database without generating data')
+    parser.add_argument('--seed', type=int, default=42, help='random seed for the generators (default 42)')
+    parser.add_argument('--output', help='also write the JSON results to this file')
+    return parser.parse_args()
+
+def log(message):
+    """Progress goes to stderr so stdout stays valid JSON"""
+    print(message, file=sys.stderr, flush=True)
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list of numbers"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def configure_generators(portfolio_count, project_count):
+    """Widen the generators' name pools so reports spread over many portfolios and projects"""
+    generators.PORTFOLIOS = [f'portfolio-{i:03d}' for i in range(portfolio_count)]
+    generators.PROJECTS = [f'project-{i:03d}' for i in range(project_count)]
+
+def generate_dataset(app_module, report_count):
+    """Create portfolios, projects, an admin user and report_count reports"""
+    db = app_module.db
+    app_module.migrate_database()
+    admin = app_module.User(first_name='Bench', last_name='Admin', email='bench@example.com', role='admin', is_approved=True)
+    admin.set_password('benchmark')
+    db.session.add(admin)
+    for portfolio_name in generators.PORTFOLIOS:
+        portfolio = app_module.Portfolio(name=portfolio_name)
+        db.session.add(portfolio)
+        db.session.flush()
+        for project_name in generators.PROJECTS:
+            db.session.add(app_module.Project(name=project_name, portfolio_id=portfolio.id))
+    db.session.commit()
+
+    link_maps = app_module.build_report_link_maps()
+    started = time.perf_counter()
+    for offset in range(0, report_count, INSERT_BATCH_SIZE):
+        batch = [
+            app_module.report_from_data(generators.generate_sample_report(), link_maps)
+            for _ in range(min(INSERT_BATCH_SIZE, report_count - offset))
+        ]
+        app_module.insert_reports(batch)
+        db.session.commit()
+        log(f"Inserted {offset + len(batch)}/{report_count} reports")
+    insert_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    app_module.update_stats_cache()
+    app_module.install_report_search()
+    return {
+        'insert_seconds': round(insert_seconds, 2),
+        'rollup_and_index_seconds': round(time.perf_counter() - started, 2),
+    }
+
+def endpoint_requests(app_module):
+    """(name, method, url or url factory, json body factory) for each benchmarked endpoint"""
+    projects = app_module.db.session.execute(
+        app_module.db.select(app_module.Project.id, app_module.Project.name, app_module.Portfolio.name)
+        .join(app_module.Portfolio, app_module.Project.portfolio_id == app_module.Portfolio.id)
+    ).all()
+
+    def project_stats_url():
+        return f'/api/project-stats/{random.choice(projects)[0]}'
+
+    def latest_data_url():
+        _, project_name, portfolio_name = random.choice(projects)
+        return f'/api/projects/{portfolio_name}/{project_name}/latest-data'
+
+    def reports_url():
+        return f'/api/reports?page={random.randint(1, 20)}&per_page=20'
+
+    return [
+        ('get_reports', 'GET', reports_url, None),
+        ('get_dashboard_stats', 'GET', lambda: '/api/dashboard/stats', None),
+        ('get_cached_dashboard_stats', 'GET', lambda: '/api/dashboard/stats/cached', None),
+        ('get_project_stats', 'GET', project_stats_url, None),
+        ('get_latest_project_data', 'GET', latest_data_url, None),
+        ('create_report', 'POST', lambda: '/api/reports', generators.generate_sample_report),
+    ]
+
+def run_endpoint(client, method, url_factory, body_factory, count, statement_counter):
+    """Time count requests, then repeat one under tracemalloc for its peak allocation"""
+    durations = []
+    statements = []
+    for _ in range(count):
+        url = url_factory()
+        body = body_factory() if body_factory else None
+        issued_before = statement_counter[0]
+        started = time.perf_counter()
+        response = client.open(url, method=method, json=body)
+        durations.append((time.perf_counter() - started) * 1000)
+        statements.append(statement_counter[0] - issued_before)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{method} {url} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+
+    tracemalloc.start()
+    client.open(url_factory(), method=method, json=body_factory() if body_factory else None)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'requests': count,
+        'p50_ms': round(percentile(durations, 0.50), 2),
+        'p95_ms': round(percentile(durations, 0.95), 2),
+        'p99_ms': round(percentile(durations, 0.99), 2),
+        'max_ms': round(max(durations), 2),
+        'mean_ms': round(sum(durations) / count, 2),
+        'queries_per_request': round(sum(statements) / count, 2),
+        'max_queries': max(statements),
+        'peak_alloc_kb': round(peak_bytes / 1024, 1),
+    }
+
+def main():
+    args = parse_args()
+    random.seed(args.seed)
+    configure_generators(args.portfolios, args.projects)
+
+    database = args.database or os.path.join(tempfile.mkdtemp(prefix='reports-benchmark-'), 'benchmark.db')
+    if os.path.exists(database) != args.reuse:
+        sys.exit(f"{database} already exists; pass --reuse to benchmark it as is" if not args.reuse else f"{database} does not exist")
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.abspath(database)
+    os.environ.setdefault('STATS_REFRESH_INTERVAL', '0')
+
+    import app as app_module
+    from sqlalchemy import event
+
+    app_module.create_app()
+    results = {'database': os.path.abspath(database)}
+    with app_module.app.app_context():
+        if args.reuse:
+            app_module.install_report_search()
+        else:
+            log(f"Generating {args.reports} reports across {args.portfolios} portfolios x {args.projects} projects")
+            results['generation'] = generate_dataset(app_module, args.reports)
+        results['dataset'] = {
+            'reports': app_module.Report.query.count(),
+            'portfolios': app_module.Portfolio.query.count(),
+            'projects': app_module.Project.query.count(),
+            'database_bytes': os.path.getsize(database),
+        }
+        admin_id = app_module.User.query.filter_by(role='admin').first().id
+        requests_to_run = endpoint_requests(app_module)
+        engine = app_module.db.engine
+
+    results['boot'] = {
+        'import_ms': round(app_module.boot_stats['import_seconds'] * 1000, 1),
+        'create_app_ms': round(app_module.boot_stats['create_app_seconds'] * 1000, 1),
+    }
+    statement_counter = [0]
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count_statement(*_):
+        statement_counter[0] += 1
+
+    client = app_module.app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(admin_id)
+
+    results['endpoints'] = {}
+    for name, method, url_factory, body_factory in requests_to_run:
+        log(f"Benchmarking {name}")
+        client.open(url_factory(), method=method, json=body_factory() if body_factory else None)  # warm-up
+        results['endpoints'][name] = run_endpoint(client, method, url_factory, body_factory, args.requests, statement_counter)
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results['peak_rss_mb'] = round(max_rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+if __name__ == '__main__':
+    main()
@@ -4,18 +4,15 @@ let dashboardCharts = {};
 async function fetchDashboardStatsLocal() {
     let response;
     try {
-        // Add cache-busting parameter to prevent stale data
-        const timestamp = new Date().getTime();
-        const url = `/api/dashboard/stats?t=${timestamp}`;
+        // Revalidate with the server's ETag so unchanged stats come back as 304
+        const url = '/api/dashboard/stats';
         
         console.log('Fetching dashboard stats from:', url);
         response = await fetch(url, {
             method: 'GET',
+            cache: 'no-cache',
             headers: {
-                'Accept': 'application/json',
-                'Cache-Control': 'no-cache, no-store, must-revalidate',
-                'Pragma': 'no-cache',
-                'Expires': '0'
+                'Accept': 'application/json'
             }
         });
         
@@ -38,7 +38,7 @@ const DASHBOARD_API_URL = '/api/dashboard/stats';
 
 
 
-async function fetchReports(page = 1, search = '', limit = reportsPerPage) {
+async function fetchReports(page = 1, search = '', limit = reportsPerPage, fields = '') {
     try {
         const params = new URLSearchParams({
             page: page.toString(),
@@ -49,6 +49,11 @@ async function fetchReports(page = 1, search = '', limit = reportsPerPage) {
             params.append('search', search);
         }
 
+        // Only request the listed columns (e.g. 'summary' for the reports table)
+        if (fields) {
+            params.append('fields', fields);
+        }
+
         const response = await fetch(`${API_URL}?${params}`);
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
@@ -98,9 +103,9 @@ async function fetchDashboardStats() {
             console.log('Attempting to fetch from cached endpoint...');
             response = await fetch('/api/dashboard/stats/cached', {
                 method: 'GET',
+                cache: 'no-cache',
                 headers: {
-                    'Accept': 'application/json',
-                    'Cache-Control': 'no-cache'
+                    'Accept': 'application/json'
                 }
             });
 
@@ -131,9 +136,9 @@ async function fetchDashboardStats() {
                 console.log('Attempting to fetch from regular endpoint...');
                 response = await fetch('/api/dashboard/stats', {
                     method: 'GET',
+                    cache: 'no-cache',
                     headers: {
-                        'Accept': 'application/json',
-                        'Cache-Control': 'no-cache'
+                        'Accept': 'application/json'
                     }
                 });
 
@@ -2490,7 +2495,7 @@ async function initializeFilterDropdowns() {
 async function searchReportsImmediate() {
     const searchQuery = document.getElementById('searchInput')?.value || '';
     showReportsLoading();
-    const result = await fetchReports(currentPage, searchQuery);
+    const result = await fetchReports(currentPage, searchQuery, reportsPerPage, 'summary');
     hideReportsLoading();
 
     renderReportsTable(result.reports);
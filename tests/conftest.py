@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+os.environ.setdefault('STATS_REFRESH_INTERVAL', '0')
+
+import app as app_module
+
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    """The app set up once for the test session against a scratch SQLite database"""
+    scratch = tmp_path_factory.mktemp('reports')
+    flask_app = app_module.create_app({
+        'TESTING': True,
+        'WTF_CSRF_ENABLED': False,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{scratch / 'reports.db'}",
+        'EXPORT_CACHE_DIR': str(scratch / 'export_cache'),
+        'BCRYPT_ROUNDS': 4,
+    })
+    with flask_app.app_context():
+        app_module.run_migrations()
+    return flask_app
+
+
+@pytest.fixture
+def db(app):
+    """The database session, with every report and reference data row deleted after the test"""
+    with app.app_context():
+        yield app_module.db
+        app_module.db.session.rollback()
+        for table in reversed(app_module.db.metadata.sorted_tables):
+            if table.name in app_module.DATA_VERSION_TABLES:
+                app_module.db.session.execute(table.delete())
+        app_module.db.session.commit()
+
+
+@pytest.fixture
+def client(app):
+    """A test client logged in as the default admin"""
+    client = app.test_client()
+    with app.app_context():
+        admin = app_module.User.query.filter_by(email='admin@example.com').one()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(admin.id)
+    return client
+
+
+@pytest.fixture
+def rollups(db):
+    """Stats rollups rebuilt to match the report table, so the test's report writes update them by deltas"""
+    app_module.rebuild_stats_tables()
+    db.session.commit()
+    return db
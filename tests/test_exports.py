@@ -0,0 +1,64 @@
+import io
+import time
+
+import pytest
+from openpyxl import load_workbook
+
+import app as app_module
+
+XLSX = app_module.REPORT_EXPORT_MIMETYPES['xlsx']
+
+
+@pytest.fixture
+def reports(db, client):
+    for sprint in range(1, 4):
+        response = client.post('/api/reports', json={
+            'portfolioName': 'Export portfolio', 'projectName': 'Export project', 'sprintNumber': sprint, 'reportDate': '2024-01-05',
+        })
+        assert response.status_code == 201
+
+
+@pytest.fixture
+def sync_max_rows(app):
+    saved = app.config['EXPORT_XLSX_SYNC_MAX_ROWS']
+    yield lambda rows: app.config.update(EXPORT_XLSX_SYNC_MAX_ROWS=rows)
+    app.config['EXPORT_XLSX_SYNC_MAX_ROWS'] = saved
+
+
+def wait_for_job(client, status_url):
+    for _ in range(100):
+        job = client.get(status_url).json
+        if job['status'] in ('finished', 'failed'):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f'Export job still {job["status"]}')
+
+
+def sheet_rows(response):
+    return list(load_workbook(io.BytesIO(response.data), read_only=True).active.values)
+
+
+def test_small_xlsx_export_is_built_in_the_request(reports, client):
+    response = client.get('/api/reports/export.xlsx?fields=sprintNumber')
+    assert response.status_code == 200
+    assert response.mimetype == XLSX
+    rows = sheet_rows(response)
+    assert rows[0] == ('id', 'sprintNumber')
+    assert [row[1] for row in rows[1:]] == [3, 2, 1]
+
+
+def test_large_xlsx_export_redirects_to_its_job_then_serves_the_cached_file(reports, client, sync_max_rows):
+    sync_max_rows(2)
+    response = client.get('/api/reports/export.xlsx?fields=sprintNumber')
+    assert response.status_code == 303
+    job = wait_for_job(client, response.headers['Location'])
+    assert job['status'] == 'finished' and job['processed'] == job['total'] == 3
+
+    response = client.get('/api/reports/export.xlsx?fields=sprintNumber')
+    assert response.status_code == 200
+    assert response.mimetype == XLSX
+    assert [row[1] for row in sheet_rows(response)[1:]] == [3, 2, 1]
+
+    # A report write changes the data version, so the cached file is not reused
+    client.post('/api/reports', json={'portfolioName': 'Export portfolio', 'projectName': 'Export project', 'sprintNumber': 4})
+    assert client.get('/api/reports/export.xlsx?fields=sprintNumber').status_code == 303
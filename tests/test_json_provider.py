@@ -0,0 +1,54 @@
+import pytest
+
+import app as app_module
+from app import FastJSONProvider, RawJSON, dump_json_blob
+
+COMPACT = {'separators': (',', ':')}
+
+REPORT = {
+    'id': 42,
+    'portfolioName': 'Portefeuille été',
+    'projectName': 'プロジェクト-01',
+    'sprintNumber': 7,
+    'reportDate': '2024-01-05',
+    'passRate': 97.5,
+    'testCases': {'total': 1200, 'passed': 1170, 'failed': 30},
+    'releaseVersion': None,
+    'qaNoteFieldsData': RawJSON(dump_json_blob([{'name': 'Umgebung', 'value': 'Prüfung 🚀'}])),
+}
+
+PAYLOADS = [
+    pytest.param(REPORT, id='report'),
+    pytest.param([REPORT, dict(REPORT, id=43, passRate=0.1)], id='report-list'),
+    pytest.param({'values': [1e16, 1.5e300, 5e-324, 1e-7, 0.1, -0.0, 2.0 ** 53, 1e15, 123456.789]}, id='extreme-floats'),
+    pytest.param({'text': 'naïve café — 日本語 \u2028 😀', 'keys': {'é': 1, 'z': 2, 'a': 3}}, id='non-ascii'),
+    pytest.param({'raw': RawJSON('{"a":[1,2.5,"ü"],"b":null}'), 'list': [RawJSON('[]')]}, id='raw-json'),
+    pytest.param({'raw': RawJSON(dump_json_blob({'ratio': 1e16}))}, id='raw-json-exponent'),
+    pytest.param({'count': 2 ** 70}, id='big-int'),
+]
+
+
+def stdlib_dumps(obj):
+    return super(FastJSONProvider, app_module.app.json).dumps(obj, **COMPACT)
+
+
+@pytest.mark.parametrize('payload', PAYLOADS)
+def test_dumps_matches_stdlib(payload):
+    assert app_module.app.json.dumps(payload, **COMPACT) == stdlib_dumps(payload)
+
+
+@pytest.mark.parametrize('payload', PAYLOADS)
+def test_orjson_output_matches_stdlib(payload):
+    pytest.importorskip('orjson')
+    encoded = app_module.app.json._orjson_dumps(payload)
+    if encoded is not None:
+        assert encoded == stdlib_dumps(payload)
+
+
+def test_orjson_encodes_reports():
+    pytest.importorskip('orjson')
+    assert app_module.app.json._orjson_dumps(REPORT) is not None
+
+
+def test_exponent_floats_use_stdlib_format():
+    assert app_module.app.json.dumps({'values': [1e16, 1.5e300, 1e-7]}, **COMPACT) == '{"values":[1e+16,1.5e+300,1e-07]}'
@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+
+import app as app_module
+
+
+@pytest.fixture
+def login_limits(app):
+    """Empty login buckets, restoring the limits and buckets afterwards"""
+    names = ('LOGIN_IP_BURST', 'LOGIN_IP_PER_MINUTE', 'LOGIN_ACCOUNT_BURST', 'LOGIN_ACCOUNT_PER_MINUTE')
+    saved = {name: app.config[name] for name in names}
+    app_module.login_ip_limiter.clear()
+    app_module.login_account_limiter.clear()
+    yield app.config
+    app.config.update(saved)
+    app_module.login_ip_limiter.clear()
+    app_module.login_account_limiter.clear()
+
+
+def log_in(app, email, password='wrong password'):
+    return app.test_client().post('/login', data={'email': email, 'password': password})
+
+
+def test_login_is_throttled_once_the_account_bucket_is_empty(app, login_limits):
+    login_limits.update(LOGIN_ACCOUNT_BURST=2, LOGIN_ACCOUNT_PER_MINUTE=0)
+    assert [log_in(app, 'admin@example.com').status_code for _ in range(3)] == [200, 200, 429]
+    response = log_in(app, 'admin@example.com', 'admin123')
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+
+    # Other accounts have their own bucket
+    assert log_in(app, 'someone@example.com').status_code == 200
+
+
+def test_login_is_throttled_once_the_ip_bucket_is_empty(app, login_limits):
+    login_limits.update(LOGIN_IP_BURST=2, LOGIN_IP_PER_MINUTE=0)
+    statuses = [log_in(app, f'user{i}@example.com').status_code for i in range(3)]
+    assert statuses == [200, 200, 429]
+
+
+def test_password_change_is_throttled_as_json(app, client, login_limits):
+    login_limits.update(LOGIN_ACCOUNT_BURST=1, LOGIN_ACCOUNT_PER_MINUTE=0)
+    body = {'current_password': 'wrong password', 'new_password': 'another password'}
+    assert client.post('/api/profile/change-password', json=body).status_code == 400
+    response = client.post('/api/profile/change-password', json=body)
+    assert response.status_code == 429
+    assert response.json['success'] is False
+
+
+def test_password_checks_are_turned_away_when_every_slot_is_taken(app, login_limits, monkeypatch):
+    app_module.run_password_hash(len, '')  # Creates the semaphores
+    monkeypatch.setattr(app_module, '_password_slots', threading.BoundedSemaphore(1))
+    app_module._password_slots.acquire()
+    with pytest.raises(app_module.PasswordHashingBusy):
+        app_module.hash_password('admin123')
@@ -0,0 +1,129 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+
+from sqlalchemy.dialects import sqlite
+
+import app as app_module
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def legacy_database(path, reports):
+    """A database from before versioned migrations: report list fields are JSON columns on the report table"""
+    added_later = {name for name, _ in app_module.LEGACY_REPORT_COLUMNS}
+    columns = [
+        f'"{column.name}" {column.type.compile(dialect=sqlite.dialect())}'
+        + (' PRIMARY KEY' if column.primary_key else '')
+        for column in app_module.Report.__table__.columns
+        if column.name not in added_later
+    ]
+    columns += [f'"{field}" TEXT DEFAULT \'[]\'' for field in app_module.REPORT_LIST_FIELDS]
+    columns.append('"qaNoteFieldsData" TEXT DEFAULT \'[]\'')
+    with sqlite3.connect(path) as connection:
+        connection.execute(f'CREATE TABLE report ({", ".join(columns)})')
+        for report in reports:
+            names = ', '.join(f'"{key}"' for key in report)
+            placeholders = ', '.join('?' for _ in report)
+            connection.execute(f'INSERT INTO report ({names}) VALUES ({placeholders})', list(report.values()))
+    connection.close()
+
+
+def flask_migrate(path):
+    """Run `flask migrate` against the database at path in a separate process"""
+    return subprocess.run(
+        [sys.executable, '-m', 'flask', '--app', 'app:create_app', 'migrate'],
+        cwd=REPO, capture_output=True, text=True, timeout=60,
+        env=dict(os.environ, DATABASE_URL=f'sqlite:///{path}', STATS_REFRESH_INTERVAL='0'),
+    )
+
+
+def report_lists(path):
+    """Each report's list fields and qaNoteFieldsData as the app reads them from the database at path"""
+    script = (
+        'import json, app\n'
+        'app.create_app()\n'
+        'with app.app.app_context():\n'
+        '    print(json.dumps({report.id: dict({field: report.list_field(field) for field in app.REPORT_LIST_FIELDS},'
+        ' qaNoteFieldsData=json.loads(report.qaNoteFieldsData)) for report in app.Report.query}))\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd=REPO, capture_output=True, text=True, timeout=60, check=True,
+        env=dict(os.environ, DATABASE_URL=f'sqlite:///{path}', STATS_REFRESH_INTERVAL='0'),
+    )
+    return {int(report_id): lists for report_id, lists in json.loads(result.stdout).items()}
+
+
+def legacy_report(report_id, **fields):
+    return dict({
+        'id': report_id, 'portfolioName': 'Legacy portfolio', 'projectName': 'Legacy project',
+        'sprintNumber': report_id, 'reportDate': '05-01-2024',
+    }, **fields)
+
+
+def list_entries(connection, field, report_id):
+    """The raw `extra` values of a report's child rows for one list field"""
+    table = app_module.report_list_model(field).__tablename__
+    return [extra for extra, in connection.execute(f'SELECT extra FROM {table} WHERE report_id = ? ORDER BY position', (report_id,))]
+
+
+def test_unreadable_list_values_survive_the_migration(tmp_path):
+    path = tmp_path / 'legacy.db'
+    legacy_database(path, [legacy_report(1, testerData='[{"name": "Ana"', qaNoteFieldsData='{not json')])
+
+    result = flask_migrate(path)
+    assert result.returncode == 0, result.stderr
+    assert 'Report ids: 1' in result.stderr
+
+    with sqlite3.connect(path) as connection:
+        assert list_entries(connection, 'testerData', 1) == [json.dumps('[{"name": "Ana"')]
+        qa_note_fields, = connection.execute('SELECT "qaNoteFieldsData" FROM report WHERE id = 1').fetchone()
+    connection.close()
+    assert json.loads(qa_note_fields) == ['{not json']
+
+
+LISTS = {
+    'requestData': [{'id': 'REQ-1', 'url': 'https://example.com/REQ-1'}, {'id': 'REQ-2', 'priority': 'high'}],
+    'buildData': [{'requestId': 'REQ-1', 'requestUrl': 'https://example.com/b/1', 'environment': 'staging', 'cycles': 2}],
+    'testerData': [{'id': 3, 'name': 'Ana', 'email': 'ana@example.com', 'is_automation_engineer': True}, 'legacy tester text'],
+    'teamMemberData': [{'id': 7, 'name': 'Lee', 'email': 'lee@example.com', 'role': 'Scrum Master'}],
+    'qaNotesData': [{'note': 'Regression passed on staging'}, 'Plain note'],
+    'qaNoteFieldsData': [{'name': 'Environment', 'value': 'Prüfung'}],
+}
+
+
+def test_flask_migrate_brings_a_version_0_database_to_the_latest_version(tmp_path):
+    path = tmp_path / 'legacy.db'
+    legacy_database(path, [
+        legacy_report(1, **{field: json.dumps(items) for field, items in LISTS.items()}),
+        legacy_report(2, projectName='Second project', reportDate='2024-02-10'),
+    ])
+
+    result = flask_migrate(path)
+    assert result.returncode == 0, result.stderr
+    latest = app_module.MIGRATIONS[-1].version
+    assert latest == 7
+    assert f'Applied {latest} migrations' in result.stdout
+
+    with sqlite3.connect(path) as connection:
+        versions = [version for version, in connection.execute('SELECT version FROM schema_version ORDER BY version')]
+        report_columns = {row[1] for row in connection.execute('PRAGMA table_info(report)')}
+        date_values = dict(connection.execute('SELECT id, "reportDateValue" FROM report'))
+        total_reports, = connection.execute('SELECT total_reports FROM dashboard_stats').fetchone()
+    connection.close()
+    assert versions == list(range(1, latest + 1))
+    assert not report_columns & set(app_module.REPORT_LIST_FIELDS)
+    assert date_values == {1: '2024-01-05', 2: '2024-02-10'}
+    assert total_reports == 2
+
+    assert report_lists(path) == {
+        1: LISTS,
+        2: dict({field: [] for field in app_module.REPORT_LIST_FIELDS}, qaNoteFieldsData=[]),
+    }
+
+    # Nothing is left to apply
+    again = flask_migrate(path)
+    assert again.returncode == 0, again.stderr
+    assert 'Applied 0 migrations' in again.stdout
@@ -0,0 +1,69 @@
+import re
+
+import pytest
+
+import app as app_module
+
+
+def seed(db, portfolios, projects_per_portfolio, testers, prefix):
+    """Add portfolios with projects, and testers each assigned to several of the projects"""
+    projects = []
+    for i in range(portfolios):
+        portfolio = app_module.Portfolio(name=f'{prefix} portfolio {i}')
+        db.session.add(portfolio)
+        for j in range(projects_per_portfolio):
+            project = app_module.Project(name=f'{prefix} project {i}-{j}', portfolio=portfolio)
+            db.session.add(project)
+            projects.append(project)
+    for i in range(testers):
+        tester = app_module.Tester(name=f'{prefix} tester {i}', email=f'{prefix}.tester{i}@example.com', is_manual_engineer=True)
+        tester.projects = projects[i % len(projects):][:3] or projects[:3]
+        db.session.add(tester)
+        db.session.add(app_module.TeamMember(name=f'{prefix} member {i}', email=f'{prefix}.member{i}@example.com', role='Scrum Master'))
+    db.session.commit()
+
+
+def statement_counts(client, db):
+    """SQL statements issued by each budgeted view, from the Server-Timing header.
+
+    The views raise QueryBudgetExceeded when they go over budget because the app is testing.
+    """
+    portfolio_id = db.session.query(app_module.Portfolio.id).order_by(app_module.Portfolio.id).first()[0]
+    tester_id = db.session.query(app_module.Tester.id).order_by(app_module.Tester.id).first()[0]
+    project_ids = [project_id for project_id, in db.session.query(app_module.Project.id)]
+    requests = [
+        ('manage_testers', 'GET', '/api/testers', None),
+        ('manage_projects', 'GET', '/api/projects', None),
+        ('manage_tester_projects', 'GET', f'/api/testers/{tester_id}/projects', None),
+        ('manage_tester_projects', 'POST', f'/api/testers/{tester_id}/projects', {'project_ids': project_ids}),
+        ('get_portfolio_projects_detailed', 'GET', f'/api/portfolios/{portfolio_id}/projects/detailed', None),
+        ('get_form_data', 'GET', '/api/form-data', None),
+    ]
+    counts = {}
+    for name, method, url, body in requests:
+        response = client.open(url, method=method, json=body)
+        assert response.status_code == 200, (name, method, response.get_data(as_text=True))
+        counts[(name, method)] = int(re.search(r'desc="(\d+) queries"', response.headers['Server-Timing']).group(1))
+    return counts
+
+
+def test_budgets_hold_regardless_of_row_count(app, db, client):
+    assert app.testing and app.config['PROFILE_REQUESTS']
+    seed(db, portfolios=1, projects_per_portfolio=1, testers=1, prefix='small')
+    client.get('/api/form-data')  # Loads the user cache and data version row
+    small = statement_counts(client, db)
+
+    seed(db, portfolios=6, projects_per_portfolio=5, testers=25, prefix='large')
+    large = statement_counts(client, db)
+
+    # Reads issue the same statements at any size; the POST's depend on which assignments change
+    gets = [key for key in small if key[1] == 'GET']
+    assert [large[key] for key in gets] == [small[key] for key in gets]
+
+
+def test_over_budget_view_raises_when_testing(app):
+    view = app_module.query_budget(GET=0)(lambda: app_module.Tester.query.all())
+    with app.test_request_context('/api/testers'):
+        app.preprocess_request()
+        with pytest.raises(app_module.QueryBudgetExceeded):
+            view()
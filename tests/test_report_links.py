@@ -0,0 +1,48 @@
+import pytest
+
+import app as app_module
+
+
+@pytest.fixture
+def foreign_keys(db):
+    """Enforce SQLite foreign keys on the test's connection, as server databases do"""
+    db.session.execute(db.text('PRAGMA foreign_keys = ON'))
+    yield
+    db.session.rollback()
+    db.session.execute(db.text('PRAGMA foreign_keys = OFF'))
+
+
+def create_reports(client, names):
+    for sprint, (portfolio_name, project_name) in enumerate(names, start=1):
+        response = client.post('/api/reports', json={
+            'portfolioName': portfolio_name, 'projectName': project_name, 'sprintNumber': sprint, 'reportDate': '2024-01-05',
+        })
+        assert response.status_code == 201, response.get_data(as_text=True)
+
+
+def links(db, model):
+    return set(db.session.query(model.portfolio_id, model.project_id).distinct())
+
+
+def test_links_follow_portfolio_and_project_writes(db, client, foreign_keys):
+    create_reports(client, [('Alpha', 'Web'), ('alpha ', 'Mobile'), ('Beta', 'Web'), ('Gamma', 'Web')])
+
+    alpha = client.post('/api/portfolios', json={'name': 'Alpha'}).json['id']
+    beta = client.post('/api/portfolios', json={'name': 'Beta'}).json['id']
+    web = client.post('/api/projects', json={'name': 'web', 'portfolio_id': alpha}).json['id']
+    shared = client.post('/api/projects', json={'name': 'Web'}).json['id']  # No portfolio: the fallback for every one
+    assert links(db, app_module.Report) == {(None, shared), (alpha, None), (alpha, web), (beta, shared)}
+
+    assert client.put(f'/api/projects/{web}', json={'portfolio_id': beta}).status_code == 200
+    assert client.put(f'/api/portfolios/{alpha}', json={'name': 'Gamma'}).status_code == 200
+    assert links(db, app_module.Report) == {(None, shared), (None, None), (alpha, shared), (beta, web)}
+
+    assert client.delete(f'/api/projects/{shared}').status_code == 200
+    assert client.delete(f'/api/projects/{web}').status_code == 200
+    assert client.delete(f'/api/portfolios/{alpha}').status_code == 200
+    assert links(db, app_module.Report) == {(None, None), (beta, None)}
+    assert links(db, app_module.ProjectStats) == {(None, None), (beta, None)}
+    assert db.session.query(app_module.PortfolioStats.portfolio_id).filter_by(portfolio_name='Gamma').scalar() is None
+
+    # The scoped relinks left nothing for a full one to fix
+    assert app_module.relink_reports() == 0
@@ -0,0 +1,36 @@
+import pytest
+
+import app as app_module
+
+
+@pytest.fixture
+def reports(db):
+    """Reports across hyphenated portfolio, project and release names"""
+    if app_module.get_report_search().name != 'fts5':
+        pytest.skip('SQLite without FTS5')
+    for i in range(24):
+        db.session.add(app_module.Report(
+            portfolioName=f'portfolio-{i % 12:03d}',
+            projectName=f'project-{i % 5:03d}',
+            sprintNumber=i,
+            reportDate='2024-01-05',
+            reportName=f'Sprint {i} report',
+            releaseNumber=f'release-2.{i % 3}',
+        ))
+    db.session.commit()
+
+
+def matching_ids(search, term):
+    query, _ = search.apply(app_module.db.session.query(app_module.Report.id), term)
+    return sorted(report_id for report_id, in query)
+
+
+@pytest.mark.parametrize('term', ['portfolio-00', 'portfolio-011', 'project-003', 'release-2.1', 'PORTFOLIO-01'])
+def test_fts_matches_like_on_hyphenated_terms(reports, term):
+    like_ids = matching_ids(app_module.LikeReportSearch(), term)
+    assert like_ids
+    assert matching_ids(app_module.Fts5ReportSearch(), term) == like_ids
+
+
+def test_match_expression_quotes_terms_as_phrases():
+    assert app_module.Fts5ReportSearch.match_expression('portfolio-00 "q3" -') == '"portfolio 00"* "q3"*'
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+import app as app_module
+
+
+def payload(i, **fields):
+    return dict({'portfolioName': 'Bulk portfolio', 'projectName': f'Bulk project {i % 3}', 'sprintNumber': i + 1, 'reportDate': '2024-01-05'}, **fields)
+
+
+def report_count(db):
+    return db.session.query(app_module.Report).count()
+
+
+@pytest.fixture
+def limits(app):
+    """Restores the request size limits a test lowers"""
+    saved = {key: app.config[key] for key in ('MAX_CONTENT_LENGTH', 'REPORT_BULK_MAX_BYTES', 'REPORT_BULK_MAX_REPORTS')}
+    yield app.config
+    app.config.update(saved)
+
+
+def test_body_over_max_content_length_is_accepted(db, client, limits):
+    limits['MAX_CONTENT_LENGTH'] = 16 * 1024
+    limits['REPORT_BULK_MAX_BYTES'] = 1024 * 1024
+    response = client.post('/api/reports/bulk', json=[payload(i, testSummary='x' * 1024) for i in range(40)])
+    assert response.status_code == 201, response.get_data(as_text=True)
+    assert response.json['created'] == 40
+
+
+def test_body_over_bulk_byte_limit_is_rejected(db, client, limits):
+    limits['REPORT_BULK_MAX_BYTES'] = 1024
+    response = client.post('/api/reports/bulk', json=[payload(i, testSummary='x' * 1024) for i in range(2)])
+    assert response.status_code == 413
+    assert 'error' in response.json
+    assert report_count(db) == 0
+
+
+def test_array_over_report_limit_is_rejected_whole(db, client, limits):
+    limits['REPORT_BULK_MAX_REPORTS'] = 3
+    response = client.post('/api/reports/bulk', json=[payload(i) for i in range(4)])
+    assert response.status_code == 413
+    assert report_count(db) == 0
+
+
+def test_ndjson_over_report_limit_keeps_reports_before_it(db, client, limits):
+    limits['REPORT_BULK_MAX_REPORTS'] = 3
+    body = '\n'.join(json.dumps(payload(i)) for i in range(5))
+    response = client.post('/api/reports/bulk', data=body, content_type='application/x-ndjson')
+    assert response.status_code == 413
+    assert [result['index'] for result in response.json['results']] == [0, 1, 2]
+    assert report_count(db) == 3
+
+
+@pytest.fixture
+def bulk_calls(monkeypatch):
+    """Counts of the commits and rollup updates made while the test runs"""
+    calls = {'commits': 0, 'rollups': []}
+
+    def count_commit(session):
+        calls['commits'] += 1
+
+    def apply_report_rollups(changes):
+        calls['rollups'].append(len(changes))
+        return original(changes)
+
+    original = app_module.apply_report_rollups
+    monkeypatch.setattr(app_module, 'apply_report_rollups', apply_report_rollups)
+    event.listen(Session, 'after_commit', count_commit)
+    yield calls
+    event.remove(Session, 'after_commit', count_commit)
+
+
+def test_mixed_batch_reports_each_row_and_writes_once(db, rollups, client, bulk_calls):
+    body = [
+        payload(0),
+        {'projectName': 'No portfolio', 'sprintNumber': 1},
+        payload(2, sprintNumber='not a number'),
+        'not a report',
+        payload(4, qaNotesData=[{'note': 'Flakyhandshake in the bulk batch'}]),
+    ]
+    response = client.post('/api/reports/bulk', json=body)
+    assert response.status_code == 201
+
+    results = response.json['results']
+    assert [result['index'] for result in results] == [0, 1, 2, 3, 4]
+    assert ['id' in result for result in results] == [True, False, False, False, True]
+    assert results[1]['error'] == 'Missing required field: portfolioName'
+    assert results[3]['error'] == 'No data provided'
+    assert (response.json['created'], response.json['failed']) == (2, 3)
+
+    # One transaction and one rollup update for the valid reports
+    assert bulk_calls['commits'] == 1
+    assert bulk_calls['rollups'] == [2]
+    assert app_module.rebuild_stats_tables() == {'inserted': 0, 'updated': 0, 'deleted': 0}
+
+    # Each created report is indexed for search once, QA notes included
+    if app_module.get_report_search().name == 'fts5':
+        indexed = db.session.execute(db.text('SELECT rowid FROM report_search ORDER BY rowid')).scalars().all()
+        assert indexed == [results[0]['id'], results[4]['id']]
+    query, _ = app_module.get_report_search().apply(db.session.query(app_module.Report.id), 'flakyhandshake')
+    assert [report_id for report_id, in query] == [results[4]['id']]
+
+
+def test_each_chunk_is_its_own_transaction(db, rollups, client, bulk_calls, monkeypatch):
+    monkeypatch.setattr(app_module, 'REPORT_BULK_CHUNK_SIZE', 2)
+    response = client.post('/api/reports/bulk', json=[payload(i) for i in range(5)])
+    assert response.json['created'] == 5
+    assert bulk_calls['commits'] == 3
+    assert bulk_calls['rollups'] == [2, 2, 1]
+    assert app_module.rebuild_stats_tables() == {'inserted': 0, 'updated': 0, 'deleted': 0}
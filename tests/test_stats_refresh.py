@@ -0,0 +1,87 @@
+import fcntl
+
+import app as app_module
+
+
+def test_refresh_skips_while_another_process_holds_the_lock(app, db):
+    with open(app_module.stats_refresh_lock_path(), 'a+') as other_process:
+        fcntl.flock(other_process, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        assert app_module.update_stats_cache() is None
+    assert app_module.update_stats_cache() is not None
+
+
+def test_scheduled_refresh_skips_after_a_recent_one(app, db):
+    assert app_module.update_stats_cache() is not None
+    assert app_module.update_stats_cache(skip_if_newer_than=60) is None
+    assert app_module.update_stats_cache(skip_if_newer_than=0) is not None
+
+
+def test_dashboard_etag_changes_when_a_refresh_changes_rollups(db, rollups, client):
+    response = client.post('/api/reports', json={
+        'portfolioName': 'ETag portfolio', 'projectName': 'ETag project', 'sprintNumber': 1, 'passedTestCases': 5,
+    })
+    assert response.status_code == 201
+    first = client.get('/api/dashboard/stats/cached')
+    etag = first.headers['ETag']
+    assert client.get('/api/dashboard/stats/cached', headers={'If-None-Match': etag}).status_code == 304
+
+    # A refresh that finds the rollups current keeps the tag
+    assert app_module.update_stats_cache()['rows_touched'] == 0
+    assert client.get('/api/dashboard/stats/cached', headers={'If-None-Match': etag}).status_code == 304
+
+    # A write made outside the app leaves the tag stale until a refresh corrects the rollups
+    db.session.execute(db.text('UPDATE report SET "passedTestCases" = 7'))
+    db.session.commit()
+    assert client.get('/api/dashboard/stats/cached', headers={'If-None-Match': etag}).status_code == 304
+    assert app_module.update_stats_cache()['rows_touched'] > 0
+    refreshed = client.get('/api/dashboard/stats/cached', headers={'If-None-Match': etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers['ETag'] != etag
+    assert refreshed.json['overall']['passedTestCases'] == 7
+
+
+def rollup_rows(db):
+    """Every rollup row's values, without ids and refresh times"""
+    rows = {}
+    for model in (app_module.DashboardStats, app_module.PortfolioStats, app_module.ProjectStats):
+        columns = [column for column in model.__table__.columns if column.name not in ('id', 'last_updated')]
+        rows[model.__tablename__] = sorted(
+            (tuple(row) for row in db.session.query(*columns)), key=repr
+        )
+    return rows
+
+
+def test_rebuild_matches_rollups_maintained_by_deltas(db, rollups, client):
+    def create(portfolio, project, sprint, **fields):
+        response = client.post('/api/reports', json=dict(
+            portfolioName=portfolio, projectName=project, sprintNumber=sprint, **fields
+        ))
+        assert response.status_code == 201, response.get_data(as_text=True)
+        return response.json['id']
+
+    client.post('/api/portfolios', json={'name': 'Delta A'})
+    reports = [
+        create('Delta A', 'Web', 1, reportDate='2024-01-05', testingStatus='passed', passedTestCases=10, failedTestCases=2),
+        create('Delta A', 'Web', 2, reportDate='2024-02-05', testingStatus='failed', criticalIssues=3, newEnhancements=1),
+        create('Delta A', 'Mobile', 1, reportDate='2024-01-20', testingStatus='passed-with-issues', passedUserStories=4),
+        create('Delta B', 'Web', 1, reportDate='2024-03-01', automationPassedTestCases=50, automationFlakyTests=2),
+        create('Delta B', 'API', 1, reportDate='2023-12-31', blockedTestCases=5),
+    ]
+
+    # Change metrics, status and date; move a report to another project; delete the latest of a
+    # project and the only report of another, so those rows are recomputed or dropped
+    for report_id, changes in (
+        (reports[0], {'passedTestCases': 15, 'testingStatus': 'failed'}),
+        (reports[2], {'projectName': 'Web', 'reportDate': '2024-04-01'}),
+        (reports[3], {'automationFailedTestCases': 7, 'reportDate': '2022-06-15'}),
+    ):
+        response = client.put(f'/api/reports/{report_id}', json=dict(client.get(f'/api/reports/{report_id}').json, **changes))
+        assert response.status_code == 200, response.get_data(as_text=True)
+    assert client.delete(f'/api/reports/{reports[1]}').status_code == 200
+    assert client.delete(f'/api/reports/{reports[4]}').status_code == 200
+
+    maintained = rollup_rows(db)
+    assert app_module.rebuild_stats_tables() == {'inserted': 0, 'updated': 0, 'deleted': 0}
+    assert rollup_rows(db) == maintained
+    projects = db.session.query(app_module.ProjectStats.portfolio_name, app_module.ProjectStats.project_name)
+    assert sorted(projects) == [('Delta A', 'Web'), ('Delta B', 'Web')]
@@ -0,0 +1,56 @@
+import pytest
+
+import app as app_module
+
+
+@pytest.fixture
+def member(app):
+    """An approved non-admin user, logged in on a client of their own.
+
+    No app context stays pushed during the test: requests would share it, and
+    with it the user Flask-Login keeps on g, across the two clients.
+    """
+    with app.app_context():
+        user = app_module.User(first_name='Cache', last_name='Member', email='cache.member@example.com', role='user', is_approved=True)
+        user.set_password('member password')
+        app_module.db.session.add(user)
+        app_module.db.session.commit()
+        user_id = user.id
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+    yield user_id, client
+    with app.app_context():
+        app_module.db.session.query(app_module.User).filter_by(id=user_id).delete()
+        app_module.db.session.commit()
+    app_module.user_cache.invalidate(user_id)
+
+
+def is_admin(client):
+    return client.get('/api/admin/stats-cache').status_code == 200
+
+
+def test_role_and_approval_changes_apply_to_the_next_request(member, client):
+    user_id, member_client = member
+    assert not is_admin(member_client)
+    assert app_module.user_cache.get(user_id).role == 'user'
+
+    assert client.post(f'/api/users/{user_id}/toggle-role').json['success']
+    assert app_module.user_cache.get(user_id) is None
+    assert is_admin(member_client)
+
+    assert client.post(f'/api/users/{user_id}/update', json={'is_approved': False}).json['success']
+    assert app_module.user_cache.get(user_id) is None
+    response = member_client.get('/api/admin/stats-cache')
+    assert response.status_code == 302 and response.location.startswith('/login')
+
+
+def test_deleted_user_is_logged_out_on_the_next_request(member, client):
+    user_id, member_client = member
+    assert member_client.get('/api/reports').status_code == 200
+    assert app_module.user_cache.get(user_id) is not None
+
+    assert client.delete(f'/api/users/{user_id}').json['success']
+    assert app_module.user_cache.get(user_id) is None
+    response = member_client.get('/api/reports')
+    assert response.status_code == 302 and response.location.startswith('/login')
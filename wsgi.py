@@ -0,0 +1,11 @@
+# wsgi.py
+"""
+WSGI entry point for production servers:
+
+    flask --app app:create_app migrate   # once per deploy
+    gunicorn -c gunicorn.conf.py       # serves wsgi:app
+"""
+
+from app import create_app
+
+app = create_app()